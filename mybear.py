@@ -1,32 +1,107 @@
+from concurrent.futures import ProcessPoolExecutor
 import csv
-import json
+import io
+from itertools import islice
 import logging
+import mmap as mmap_module
 import os
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
 
+import numpy as np
+
+from src.binary import read_binary as read_binary_series
+from src.builders import as_strings
+from src.builders import ColumnBuilder
+from src.builders import common_kind
+from src.builders import concat_series
+from src.builders import kind_of_dtype
+from src.builders import mixed_formats
+from src.builders import ValueBuilder
 from src.dataframe import DataFrame
+from src.executor import get_option
+from src.executor import set_options
+from src.inference import infer_series
+from src.json_codec import loads
+from src.lazy import LazyFrame
+from src.lazy import Scan
+from src.predicates import check_filters
+from src.predicates import Filter
+from src.predicates import filters_mask
 from src.series import Series
+from src.sketches import HyperLogLog
+from src.sketches import QuantileSketch
 
 logging.basicConfig(level=logging.INFO)
 
+# Nombre de lignes lues et converties à la fois par read_csv
+CSV_BLOCK_SIZE = 65536
+# Nombre d'enregistrements JSON ajoutés à la fois aux builders par read_json
+JSON_BLOCK_SIZE = 65536
+# Taille minimale (en octets) d'une plage du fichier confiée à un processus
+MIN_RANGE_SIZE = 1 << 20
+# Taille des blocs d'octets parcourus pour compter les guillemets
+QUOTE_BLOCK_SIZE = 1 << 26
+
 Series = Series
 DataFrame = DataFrame
+set_options = set_options
 
 
-def read_csv(path: str, delimiter: str = ","):
+def read_csv(
+    path: str,
+    delimiter: str = ",",
+    chunksize: int = None,
+    usecols: List[Union[str, int]] = None,
+    dtype: Dict[str, Any] = None,
+    mmap: bool = False,
+    workers: int = None,
+    filters: List[Filter] = None,
+):
     """
     Fonction permettant de créer une nouvelle instance de la classe DataFrame à partir d'un fichier csv
 
+    Le fichier est lu en flux par blocs de lignes, chaque bloc étant converti en bloc
+    dans des builders typés (un par colonne), si bien que seul un bloc de lignes brutes
+    est présent en mémoire à un instant donné.
+    Avec `mmap=True`, le fichier est projeté en mémoire et découpé en plages d'octets
+    alignées sur les enregistrements (guillemets compris), analysées en parallèle par
+    un pool de processus puis concaténées
+
     Parameters
     -------
     path: str:
         Le chemin relatif, absolu, ou tout simplement le nom du fichier csv
     delimiter: str:
         Le séparateur d'éléments au sein du fichier `virgule par défaut`
+    chunksize: int:
+        Si précisé, retourne un itérateur de DataFrames de `chunksize` lignes chacun
+    usecols: list:
+        Les noms ou positions des colonnes à lire, les autres étant ignorées
+    dtype: dict:
+        Le type à utiliser pour certaines colonnes, qui ne sont alors pas inférées.
+        Le format des dates (ISO, jour-mois-année, ou epoch en secondes pour un type
+        datetime64 imposé) est détecté sur le premier bloc puis réutilisé
+    mmap: bool:
+        Lecture parallèle du fichier projeté en mémoire (incompatible avec `chunksize`)
+    workers: int:
+        Le nombre de processus utilisés avec `mmap=True` (option num_threads par défaut)
+    filters: list:
+        Des filtres (colonne, opérateur, valeur) que les lignes lues doivent tous satisfaire.
+        Les colonnes filtrées sont d'abord lues entièrement, si bien que les filtres sont
+        évalués sur leur type final (celui d'une lecture sans filtre), puis seules les
+        lignes retenues des autres colonnes sont converties
 
     Returns
     -------
     DataFrame
         Une nouvelle instance de la classe DataFrame à partir des données du fichier
+        (ou un itérateur de DataFrames si `chunksize` est précisé)
 
 
     Raises
@@ -41,31 +116,42 @@ def read_csv(path: str, delimiter: str = ","):
     if not os.path.exists(os.path.join(path)):
         logging.exception(f"Fichier {path} introuvable")
         raise FileNotFoundError
+    if chunksize is not None and (not isinstance(chunksize, int) or chunksize <= 0):
+        logging.exception("Valeur pour le paramètre chunksize non conforme")
+        raise ValueError
+
+    if mmap and chunksize is not None:
+        logging.exception("Les paramètres mmap et chunksize sont incompatibles")
+        raise ValueError
+    filters = check_filters(filters) if filters else None
+
+    if mmap:
+        try:
+            dataframe = _read_csv_mmap(
+                path, delimiter, usecols, dtype, workers, filters
+            )
+        except Exception as e:
+            logging.exception(
+                f"Une erreur est survenue durant la lecture du fichier car : {e}"
+            )
+            raise e
+        else:
+            return dataframe
+
+    chunks = _iter_csv(
+        path,
+        delimiter,
+        chunksize if chunksize is not None else CSV_BLOCK_SIZE,
+        usecols,
+        dtype,
+        filters,
+        yield_chunks=chunksize is not None,
+    )
+    if chunksize is not None:
+        return chunks
 
     try:
-        with open(path, mode="r") as f:
-            reader = csv.reader(f, delimiter=delimiter)
-            lines = [f"{delimiter}".join(row).split(delimiter) for row in reader]
-            columns = lines[0]
-            lines = list(map(list, zip(*lines[1:])))
-            for line in lines:
-                for index, element in enumerate(line):
-                    if element.isdigit() or element.isnumeric():
-                        line[index] = int(element)
-                    if element[0] == "-" and element[1:].isdigit():
-                        line[index] = -int(element[1:])
-                    elif (
-                        "." in element and element[element.index(".") + 1 :].isnumeric()
-                    ):
-                        try:
-                            line[index] = float(element)
-                        except ValueError as ve:
-                            logging.exception("Value can not be converted to float")
-                            raise ve
-                    # elif re.fullmatch(r"\d{1,2}-\d{1,2}-\d{4}", element):
-                    # line[index] = datetime.strptime(element, "%d-%m-%Y").date()
-
-            dataframe = DataFrame(colonnes=columns, data=lines)
+        dataframe = next(chunks)
     except Exception as e:
         logging.exception(
             f"Une erreur est survenue durant la lecture du fichier car : {e}"
@@ -75,21 +161,345 @@ def read_csv(path: str, delimiter: str = ","):
         return dataframe
 
 
-def read_json(path: str, orient: str = "records"):
+def _iter_csv(
+    path: str,
+    delimiter: str,
+    block_size: int,
+    usecols: List[Union[str, int]],
+    dtype: Dict[str, Any],
+    filters: List[Filter],
+    yield_chunks: bool,
+) -> Iterator[DataFrame]:
+    """
+    Générateur lisant un fichier csv par blocs de `block_size` lignes et alimentant
+    un builder typé par colonne, seules les lignes satisfaisant les filtres étant
+    conservées (voir `_csv_filter_mask`). Produit un DataFrame par bloc non vide si
+    `yield_chunks` est vrai, sinon un unique DataFrame à la fin du fichier
+    """
+    with open(path, mode="r", newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            logging.exception(f"Le fichier {path} est vide")
+            raise ValueError
+
+        positions = _select_columns(header, usecols)
+        dtype = dtype if dtype is not None else {}
+        kept = None
+        if filters:
+            _select_columns(header, [column for column, _, _ in filters])
+            kept = _csv_filter_mask(path, delimiter, dtype, filters)
+        builders = [
+            ColumnBuilder(name=header[position], dtype=dtype.get(header[position]))
+            for position in positions
+        ]
+
+        offset = 0
+        for rows in _read_blocks(reader, block_size):
+            if kept is not None:
+                block = kept[offset : offset + len(rows)].tolist()
+                offset += len(rows)
+                rows = [row for row, keep in zip(rows, block) if keep]
+                if not rows:
+                    continue
+            _append_rows(rows, positions, builders)
+            if yield_chunks:
+                yield DataFrame(series=[builder.build() for builder in builders])
+
+        if not yield_chunks:
+            yield DataFrame(series=[builder.build() for builder in builders])
+
+
+def _read_blocks(
+    reader: Iterator[List[str]], block_size: int
+) -> Iterator[List[List[str]]]:
+    """
+    Générateur regroupant les lignes non vides d'un lecteur csv par blocs de `block_size` lignes
+    """
+    while True:
+        rows = [row for row in islice(reader, block_size) if row]
+        if not rows:
+            break
+        yield rows
+
+
+def _append_rows(
+    rows: List[List[str]], positions: List[int], builders: List[ColumnBuilder]
+) -> None:
+    """
+    Transpose un bloc de lignes et ajoute chaque colonne sélectionnée à son builder,
+    les lignes trop courtes étant complétées par des valeurs manquantes
+    """
+    for position, builder in zip(positions, builders):
+        try:
+            builder.append([row[position] for row in rows])
+        except IndexError:
+            builder.append(
+                [row[position] if position < len(row) else "" for row in rows]
+            )
+
+
+def _csv_filter_mask(
+    path: str, delimiter: str, dtype: Dict[str, Any], filters: List[Filter]
+) -> np.ndarray:
+    """
+    Lit entièrement les colonnes filtrées d'un fichier csv, comme une lecture sans filtre,
+    et retourne le masque des lignes (non vides) satisfaisant tous les filtres. Évalués
+    bloc par bloc, les filtres verraient le type de chaque bloc et non celui de la colonne,
+    qu'un bloc suivant peut encore élargir
+    """
+    columns = list(dict.fromkeys(column for column, _, _ in filters))
+    frame = next(
+        _iter_csv(path, delimiter, CSV_BLOCK_SIZE, columns, dtype, None, False)
+    )
+    return filters_mask(frame.data, filters)
+
+
+def _read_csv_mmap(
+    path: str,
+    delimiter: str,
+    usecols: List[Union[str, int]],
+    dtype: Dict[str, Any],
+    workers: int,
+    filters: List[Filter],
+) -> DataFrame:
+    """
+    Lit un fichier csv projeté en mémoire en analysant des plages d'octets
+    en parallèle dans un pool de processus
+    """
+    if os.path.getsize(path) == 0:
+        logging.exception(f"Le fichier {path} est vide")
+        raise ValueError
+    workers = workers if workers is not None else get_option("num_threads")
+
+    with open(path, mode="rb") as f, mmap_module.mmap(
+        f.fileno(), 0, access=mmap_module.ACCESS_READ
+    ) as buffer:
+        header_end = _next_record_start(buffer, 0, 0)
+        header = next(
+            csv.reader(
+                io.StringIO(buffer[:header_end].decode("utf-8")), delimiter=delimiter
+            )
+        )
+        ranges = _record_ranges(buffer, header_end, workers)
+
+    positions = _select_columns(header, usecols)
+    dtype = dtype if dtype is not None else {}
+    masks = [None] * len(ranges)
+    if filters:
+        # Les colonnes filtrées sont d'abord lues entièrement (voir `_csv_filter_mask`)
+        columns = list(dict.fromkeys(column for column, _, _ in filters))
+        filtered = _select_columns(header, columns)
+        parts = _parse_csv_ranges(
+            [
+                (path, start, end, delimiter, header, filtered, dtype, None)
+                for start, end in ranges
+            ],
+            workers,
+        )
+        series = {
+            column: _concat_ranges([part[index] for part in parts], name=column)
+            for index, column in enumerate(columns)
+        }
+        bounds = np.cumsum([len(part[0][0]) for part in parts])[:-1]
+        masks = np.split(filters_mask(series, filters), bounds)
+    parts = _parse_csv_ranges(
+        [
+            (path, start, end, delimiter, header, positions, dtype, mask)
+            for (start, end), mask in zip(ranges, masks)
+        ],
+        workers,
+    )
+
+    return DataFrame(
+        series=[
+            _concat_ranges([part[index] for part in parts], name=header[position])
+            for index, position in enumerate(positions)
+        ]
+    )
+
+
+def _parse_csv_ranges(
+    arguments: List[Tuple[Any, ...]], workers: int
+) -> List[List[Tuple[Series, Optional[str]]]]:
+    """
+    Analyse les plages d'octets d'un fichier csv (voir `_parse_csv_range`) dans un pool
+    de processus, ou dans le processus courant s'il n'y a qu'une plage
+    """
+    if len(arguments) == 1:
+        return [_parse_csv_range(*arguments[0])]
+    with ProcessPoolExecutor(max_workers=min(workers, len(arguments))) as pool:
+        return list(pool.map(_parse_csv_range, *zip(*arguments)))
+
+
+def _concat_ranges(parts: List[Tuple[Series, Optional[str]]], name: str) -> Series:
+    """
+    Concatène les morceaux d'une colonne lus dans chaque plage du fichier. Si seul le
+    type object les réunit, ou si leurs dates sont écrites dans des formats différents,
+    les morceaux typés sont réécrits en chaînes (voir `as_strings`), comme une colonne
+    élargie en cours de lecture d'une seule plage
+    """
+    present = [
+        (serie, date_format) for serie, date_format in parts if serie._validity().any()
+    ]
+    kinds = [kind_of_dtype(serie.dtype) for serie, _ in present]
+    series = [serie for serie, _ in parts]
+    if (len(set(kinds)) > 1 and common_kind(kinds) == "O") or mixed_formats(
+        [date_format for _, date_format in present]
+    ):
+        series = [
+            serie if serie.dtype == object else as_strings(serie, date_format)
+            for serie, date_format in parts
+        ]
+    return concat_series(series, name=name)
+
+
+def _count_quotes(buffer: mmap_module.mmap, start: int, end: int) -> int:
+    """
+    Compte les guillemets présents entre deux positions par blocs d'octets
+    """
+    count = 0
+    for block_start in range(start, end, QUOTE_BLOCK_SIZE):
+        block_end = min(end, block_start + QUOTE_BLOCK_SIZE)
+        count += buffer[block_start:block_end].count(b'"')
+    return count
+
+
+def _next_record_start(buffer: mmap_module.mmap, position: int, parity: int) -> int:
+    """
+    Retourne la position du premier enregistrement commençant après `position`.
+    `parity` est la parité du nombre de guillemets rencontrés depuis le début
+    de l'enregistrement courant : un saut de ligne n'est une fin d'enregistrement
+    que s'il n'est pas entre guillemets
+    """
+    size = len(buffer)
+    while position < size:
+        newline = buffer.find(b"\n", position)
+        if newline == -1:
+            return size
+        parity ^= _count_quotes(buffer, position, newline) & 1
+        if not parity:
+            return newline + 1
+        position = newline + 1
+    return size
+
+
+def _record_ranges(
+    buffer: mmap_module.mmap, start: int, count: int
+) -> List[Tuple[int, int]]:
+    """
+    Découpe le fichier à partir de `start` en au plus `count` plages d'octets
+    de tailles proches, chaque plage commençant au début d'un enregistrement
+    """
+    size = len(buffer)
+    step = max(MIN_RANGE_SIZE, -(-(size - start) // count))
+    boundaries = [start]
+    while boundaries[-1] + step < size:
+        candidate = boundaries[-1] + step
+        parity = _count_quotes(buffer, boundaries[-1], candidate) & 1
+        boundary = _next_record_start(buffer, candidate, parity)
+        if boundary >= size:
+            break
+        boundaries.append(boundary)
+    return list(zip(boundaries, boundaries[1:] + [size]))
+
+
+def _parse_csv_range(
+    path: str,
+    start: int,
+    end: int,
+    delimiter: str,
+    header: List[str],
+    positions: List[int],
+    dtype: Dict[str, Any],
+    kept: Optional[np.ndarray],
+) -> List[Tuple[Series, Optional[str]]]:
+    """
+    Analyse une plage d'octets d'un fichier csv (exécuté dans un processus du pool)
+    et retourne les colonnes typées correspondantes, chacune avec le format de ses dates.
+    Seules les lignes (non vides) retenues par le masque `kept` sont conservées
+    """
+    with open(path, mode="rb") as f, mmap_module.mmap(
+        f.fileno(), 0, access=mmap_module.ACCESS_READ
+    ) as buffer:
+        text = buffer[start:end].decode("utf-8")
+    reader = csv.reader(io.StringIO(text, newline=""), delimiter=delimiter)
+    builders = [
+        ColumnBuilder(name=header[position], dtype=dtype.get(header[position]))
+        for position in positions
+    ]
+    offset = 0
+    for rows in _read_blocks(reader, CSV_BLOCK_SIZE):
+        if kept is not None:
+            block = kept[offset : offset + len(rows)].tolist()
+            offset += len(rows)
+            rows = [row for row, keep in zip(rows, block) if keep]
+        if rows:
+            _append_rows(rows, positions, builders)
+    return [(builder.build(), builder.date_format) for builder in builders]
+
+
+def _select_columns(header: List[str], usecols: List[Union[str, int]]) -> List[int]:
+    """
+    Retourne les positions des colonnes à lire à partir de leurs noms ou positions
+
+    Raises
+    -------
+    ValueError
+        Une des colonnes demandées n'existe pas
+    """
+    if usecols is None:
+        return list(range(len(header)))
+    positions = []
+    for column in usecols:
+        if isinstance(column, int) and 0 <= column < len(header):
+            positions.append(column)
+        elif column in header:
+            positions.append(header.index(column))
+        else:
+            logging.exception(f"Colonne {column} introuvable")
+            raise ValueError
+    return positions
+
+
+def read_json(
+    path: str,
+    orient: str = "records",
+    lines: bool = False,
+    chunksize: int = None,
+    usecols: List[str] = None,
+    filters: List[Filter] = None,
+):
     """
     Fonction permettant de créer une nouvelle instance de la classe DataFrame à partir d'un fichier JSON
 
+    Les enregistrements sont décodés (avec orjson s'il est installé) puis ajoutés par lots
+    à un builder typé par colonne. Avec `lines=True`, le fichier est lu en flux, un
+    enregistrement JSON par ligne (NDJSON)
+
     Parameters
     -------
     path: str:
         Le chemin relatif, absolu, ou tout simplement le nom du fichier csv
     orient: str:
         L'orientation du fichier JSON `records par défaut`
+    lines: bool:
+        Lecture d'un fichier contenant un enregistrement JSON par ligne
+    chunksize: int:
+        Avec `lines=True`, retourne un itérateur de DataFrames de `chunksize` lignes chacun
+    usecols: list:
+        Les noms des colonnes à conserver, les autres clés étant ignorées
+    filters: list:
+        Des filtres (colonne, opérateur, valeur) que les enregistrements lus doivent tous
+        satisfaire. Les clés filtrées sont d'abord lues entièrement, si bien que les filtres
+        sont évalués sur leur type final (celui d'une lecture sans filtre), puis seuls les
+        enregistrements retenus sont ajoutés aux builders
 
     Returns
     -------
     DataFrame
         Une nouvelle instance de la classe DataFrame à partir des données du fichier
+        (ou un itérateur de DataFrames si `chunksize` est précisé)
 
     Raises
     -------
@@ -105,26 +515,54 @@ def read_json(path: str, orient: str = "records"):
     if orient != "records" and orient != "columns":
         logging.exception("Valeur pour le paramètre orient non conforme")
         raise TypeError
+    if lines and orient != "records":
+        logging.exception("La lecture par ligne n'est possible qu'avec orient=records")
+        raise TypeError
+    if chunksize is not None and (
+        not lines or not isinstance(chunksize, int) or chunksize <= 0
+    ):
+        logging.exception("Valeur pour le paramètre chunksize non conforme")
+        raise ValueError
     if not os.path.exists(path):
         logging.exception(f"Fichier {path} introuvable")
         raise FileNotFoundError
+    filters = check_filters(filters) if filters else None
+
+    if chunksize is not None:
+        return _iter_ndjson(path, chunksize, True, usecols, filters)
 
     try:
-        with open(path, mode="r") as f:
-            json_object = json.load(f)
+        if lines:
+            json_dataframe = next(
+                _iter_ndjson(path, JSON_BLOCK_SIZE, False, usecols, filters)
+            )
+        else:
+            with open(path, mode="rb") as f:
+                json_object = loads(f.read())
             if orient == "records":
-                json_dataframe = DataFrame(
-                    data=[
-                        [obj[key] for obj in json_object]
-                        for key in list(json_object[0].keys())
-                    ],
-                    colonnes=list(json_object[0].keys()),
+                kept = (
+                    _json_filter_mask(iter(json_object), filters) if filters else None
+                )
+                json_dataframe = next(
+                    _records_to_dataframes(
+                        iter(json_object), JSON_BLOCK_SIZE, False, usecols, kept
+                    )
                 )
             if orient == "columns":
+                columns = {
+                    k: infer_series(list(v.values()), name=k)
+                    for k, v in json_object.items()
+                }
+                kept = filters_mask(columns, filters) if filters else None
                 json_dataframe = DataFrame(
-                    data=[list(v.values()) for v in json_object.values()],
-                    colonnes=list(json_object.keys()),
+                    series=[
+                        serie
+                        for k, serie in columns.items()
+                        if usecols is None or k in usecols
+                    ]
                 )
+                if kept is not None:
+                    json_dataframe = json_dataframe.filter(kept)
     except Exception as exc:
         logging.exception(
             f"Une erreur est survenue durant la lecture du fichier car : {exc}"
@@ -132,3 +570,202 @@ def read_json(path: str, orient: str = "records"):
         raise exc
     else:
         return json_dataframe
+
+
+def read_binary(path: str, mmap: bool = True) -> DataFrame:
+    """
+    Fonction permettant de créer une nouvelle instance de la classe DataFrame à partir d'un
+    fichier écrit par `DataFrame.to_binary`. Les types étant stockés dans le fichier,
+    aucune inférence n'est effectuée
+
+    Parameters
+    -------
+    path: str:
+        Le chemin relatif, absolu, ou tout simplement le nom du fichier binaire
+    mmap: bool:
+        Projection du fichier en mémoire : les colonnes numériques sont des vues
+        sur le fichier, sans copie `True par défaut`
+
+    Returns
+    -------
+    DataFrame
+        Une nouvelle instance de la classe DataFrame à partir des données du fichier
+
+    Raises
+    -------
+    FileNotFoundError
+        Le fichier n'existe pas
+    ValueError
+        Le fichier n'est pas au format binaire MyBear
+    """
+    if not os.path.exists(path):
+        logging.exception(f"Fichier {path} introuvable")
+        raise FileNotFoundError
+    return DataFrame(series=read_binary_series(path, mmap=mmap))
+
+
+def scan_csv(
+    path: str,
+    delimiter: str = ",",
+    dtype: Dict[str, Any] = None,
+    mmap: bool = False,
+    workers: int = None,
+) -> LazyFrame:
+    """
+    Fonction permettant de créer un LazyFrame lisant un fichier csv. Seul l'en-tête est lu :
+    la lecture a lieu lors de `collect`, limitée aux colonnes utilisées par le plan
+    et aux lignes satisfaisant ses filtres
+
+    Parameters
+    -------
+    path: str:
+        Le chemin relatif, absolu, ou tout simplement le nom du fichier csv
+    delimiter: str:
+        Le séparateur d'éléments au sein du fichier `virgule par défaut`
+    dtype: dict:
+        Le type à utiliser pour certaines colonnes, qui ne sont alors pas inférées.
+        Le format des dates (ISO, jour-mois-année, ou epoch en secondes pour un type
+        datetime64 imposé) est détecté sur le premier bloc puis réutilisé
+    mmap: bool:
+        Lecture parallèle du fichier projeté en mémoire
+    workers: int:
+        Le nombre de processus utilisés avec `mmap=True` (option num_threads par défaut)
+
+    Returns
+    -------
+    LazyFrame
+        Un LazyFrame ayant la lecture du fichier pour source
+
+    Raises
+    -------
+    FileNotFoundError
+        Le fichier n'existe pas
+    ValueError
+        Le fichier est vide
+    """
+    if not os.path.exists(path):
+        logging.exception(f"Fichier {path} introuvable")
+        raise FileNotFoundError
+    with open(path, mode="r", newline="") as f:
+        header = next(csv.reader(f, delimiter=delimiter), None)
+    if header is None:
+        logging.exception(f"Le fichier {path} est vide")
+        raise ValueError
+    options = {"delimiter": delimiter, "dtype": dtype, "mmap": mmap, "workers": workers}
+    return LazyFrame(Scan(read_csv, path, options, schema=header))
+
+
+def scan_json(path: str, orient: str = "records", lines: bool = False) -> LazyFrame:
+    """
+    Fonction permettant de créer un LazyFrame lisant un fichier JSON lors de `collect`,
+    en ne conservant que les clés utilisées par le plan et les enregistrements
+    satisfaisant ses filtres
+
+    Parameters
+    -------
+    path: str:
+        Le chemin relatif, absolu, ou tout simplement le nom du fichier JSON
+    orient: str:
+        L'orientation du fichier JSON `records par défaut`
+    lines: bool:
+        Lecture d'un fichier contenant un enregistrement JSON par ligne
+
+    Returns
+    -------
+    LazyFrame
+        Un LazyFrame ayant la lecture du fichier pour source
+
+    Raises
+    -------
+    FileNotFoundError
+        Le fichier n'existe pas
+    """
+    if not os.path.exists(path):
+        logging.exception(f"Fichier {path} introuvable")
+        raise FileNotFoundError
+    options = {"orient": orient, "lines": lines}
+    return LazyFrame(Scan(read_json, path, options, schema=None))
+
+
+def _iter_ndjson(
+    path: str,
+    block_size: int,
+    yield_chunks: bool,
+    usecols: List[str] = None,
+    filters: List[Filter] = None,
+) -> Iterator[DataFrame]:
+    """
+    Générateur décodant un fichier NDJSON ligne par ligne, les lignes vides étant ignorées
+    """
+    kept = None
+    if filters:
+        with open(path, mode="rb") as f:
+            records = (loads(line) for line in f if line.strip())
+            kept = _json_filter_mask(records, filters)
+    with open(path, mode="rb") as f:
+        records = (loads(line) for line in f if line.strip())
+        yield from _records_to_dataframes(
+            records, block_size, yield_chunks, usecols, kept
+        )
+
+
+def _json_filter_mask(
+    records: Iterator[Dict[str, Any]], filters: List[Filter]
+) -> np.ndarray:
+    """
+    Lit entièrement les clés filtrées des enregistrements, comme une lecture sans filtre,
+    et retourne le masque des enregistrements satisfaisant tous les filtres, évalués
+    sur le type final de chaque clé (voir `_csv_filter_mask`)
+    """
+    columns = list(dict.fromkeys(column for column, _, _ in filters))
+    frame = next(_records_to_dataframes(records, JSON_BLOCK_SIZE, False, columns))
+    return filters_mask(frame.data, filters)
+
+
+def _records_to_dataframes(
+    records: Iterator[Dict[str, Any]],
+    block_size: int,
+    yield_chunks: bool,
+    usecols: List[str] = None,
+    kept: np.ndarray = None,
+) -> Iterator[DataFrame]:
+    """
+    Générateur ajoutant des enregistrements par lots de `block_size` à un builder par colonne.
+    Une clé absente d'un enregistrement donne une valeur manquante et une clé apparue
+    en cours de lecture est complétée par des valeurs manquantes pour les lignes précédentes.
+    Seules les clés de `usecols` (dans cet ordre) et les enregistrements retenus par le
+    masque `kept` (voir `_json_filter_mask`) sont conservés.
+    Produit un DataFrame par lot si `yield_chunks` est vrai, sinon un unique DataFrame
+    """
+    builders: Dict[str, ValueBuilder] = {}
+    if usecols is not None:
+        builders = {key: ValueBuilder(name=key) for key in usecols}
+    rows = 0
+    offset = 0
+    while True:
+        batch = list(islice(records, block_size))
+        if not batch:
+            break
+        if kept is not None:
+            block = kept[offset : offset + len(batch)].tolist()
+            offset += len(batch)
+            batch = [record for record, keep in zip(batch, block) if keep]
+            if not batch:
+                continue
+        for record in batch:
+            for key in record:
+                if usecols is not None and key not in usecols:
+                    continue
+                if key not in builders:
+                    builders[key] = ValueBuilder(name=key)
+                    if rows:
+                        builders[key].append([None] * rows)
+        for key, builder in builders.items():
+            builder.append([record.get(key) for record in batch])
+        rows += len(batch)
+        if yield_chunks:
+            yield DataFrame(series=[builder.build() for builder in builders.values()])
+            rows = 0
+
+    if not yield_chunks:
+        yield DataFrame(series=[builder.build() for builder in builders.values()])
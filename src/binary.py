@@ -0,0 +1,233 @@
+import json
+import logging
+from typing import Any
+from typing import Dict
+from typing import List
+
+import numpy as np
+
+from src.json_codec import dumps
+from src.json_codec import loads
+from src.series import Series
+from src.strings import compact
+from src.strings import offsets_of
+from src.strings import spans_from_offsets
+
+logging.basicConfig(level=logging.INFO)
+
+MAGIC = b"MYBEAR01"
+# Alignement (en octets) du début de chaque buffer dans le fichier
+ALIGNMENT = 64
+
+
+def _padding(position: int) -> bytes:
+    """
+    Retourne les octets de remplissage nécessaires pour aligner la position suivante
+    """
+    return b"\0" * (-position % ALIGNMENT)
+
+
+def _encode_objects(values: np.ndarray, valid: np.ndarray) -> Dict[str, Any]:
+    """
+    Encode une colonne object en un buffer d'octets contigu et un tableau d'offsets.
+    Les chaînes sont écrites en UTF-8, les autres valeurs en JSON et les valeurs
+    manquantes occupent zéro octet
+    """
+    elements = values.tolist()
+    present = valid.tolist()
+    if all(isinstance(v, str) for v, p in zip(elements, present) if p):
+        encoding = "utf8"
+        encoded = [v.encode("utf-8") if p else b"" for v, p in zip(elements, present)]
+    else:
+        encoding = "json"
+        encoded = [dumps(v) if p else b"" for v, p in zip(elements, present)]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    return {"encoding": encoding, "offsets": offsets, "data": b"".join(encoded)}
+
+
+def _decode_objects(
+    encoding: str, offsets: np.ndarray, data: np.ndarray, valid: np.ndarray
+) -> np.ndarray:
+    """
+    Décode une colonne object encodée par `_encode_objects`
+    """
+    raw = data.tobytes()
+    bounds = offsets.tolist()
+    decode = (lambda b: b.decode("utf-8")) if encoding == "utf8" else loads
+    decoded = [
+        decode(raw[a:b]) if p else None
+        for a, b, p in zip(bounds, bounds[1:], valid.tolist())
+    ]
+    values = np.empty(len(decoded), dtype=object)
+    values[:] = decoded
+    return values
+
+
+def write_binary(series: List[Series], path: str) -> None:
+    """
+    Écrit des Series dans un fichier au format binaire colonne MyBear :
+
+    - l'identifiant du format (8 octets) puis la taille de l'en-tête (8 octets)
+    - un en-tête JSON décrivant chaque colonne (nom, type, taille, position des buffers)
+    - les buffers typés bruts de chaque colonne et leur bitmap de validité, alignés sur 64 octets
+      (codes et dictionnaire des valeurs distinctes pour une colonne catégorielle,
+      offsets et buffer UTF-8 pour une colonne de chaînes)
+
+    Parameters
+    ----------
+    series : list:
+        Les Series à écrire
+    path : str
+        Le chemin du fichier
+    """
+    buffers = []
+    columns = []
+    position = 0
+
+    def add_buffer(content: bytes) -> Dict[str, int]:
+        nonlocal position
+        buffers.append(_padding(position))
+        position += len(buffers[-1])
+        buffers.append(content)
+        location = {"offset": position, "nbytes": len(content)}
+        position += len(content)
+        return location
+
+    for serie in series:
+        column = {"name": serie.name, "dtype": serie.dtype.str, "length": len(serie)}
+        if serie.categories is not None:
+            # Colonne catégorielle : buffer des codes et dictionnaire encodé à part
+            categories = serie.categories
+            encoded = _encode_objects(categories, np.ones(len(categories), dtype=bool))
+            column["codes"] = serie.codes.dtype.str
+            column["values"] = add_buffer(np.ascontiguousarray(serie.codes).tobytes())
+            column["categories"] = {
+                "length": len(categories),
+                "encoding": encoded["encoding"],
+                "offsets": add_buffer(encoded["offsets"].tobytes()),
+                "values": add_buffer(encoded["data"]),
+            }
+        elif serie._strings is not None:
+            # Colonne de chaînes : son buffer UTF-8 compacté est écrit tel quel
+            data, spans = compact(serie._strings, serie._values)
+            column["encoding"] = "utf8"
+            column["offsets"] = add_buffer(offsets_of(spans).tobytes())
+            column["values"] = add_buffer(data.tobytes())
+        elif serie.dtype == object:
+            encoded = _encode_objects(serie.values, serie._validity())
+            column["encoding"] = encoded["encoding"]
+            column["offsets"] = add_buffer(encoded["offsets"].tobytes())
+            column["values"] = add_buffer(encoded["data"])
+        else:
+            column["values"] = add_buffer(np.ascontiguousarray(serie.values).tobytes())
+        if serie._mask is not None:
+            column["mask"] = add_buffer(
+                np.packbits(serie._mask, bitorder="little").tobytes()
+            )
+        columns.append(column)
+
+    header = json.dumps({"version": 1, "columns": columns}).encode("utf-8")
+    start = len(MAGIC) + 8 + len(header)
+    with open(path, mode="wb") as f:
+        f.write(MAGIC)
+        f.write(len(header).to_bytes(8, "little"))
+        f.write(header)
+        # Les positions de l'en-tête sont relatives au début de la zone des buffers,
+        # elle-même alignée
+        f.write(_padding(start))
+        for buffer in buffers:
+            f.write(buffer)
+
+
+def read_binary(path: str, mmap: bool = True) -> List[Series]:
+    """
+    Lit les Series d'un fichier au format binaire colonne MyBear. Avec `mmap=True`, les
+    buffers numériques et les chaînes UTF-8 sont des vues sur le fichier projeté
+    en mémoire (aucune copie)
+
+    Parameters
+    ----------
+    path : str
+        Le chemin du fichier
+    mmap : bool
+        Projection du fichier en mémoire plutôt que lecture complète
+
+    Returns
+    -------
+    list
+        Les colonnes lues
+
+    Raises
+    ------
+    ValueError
+        Le fichier n'est pas au format binaire MyBear
+    """
+    with open(path, mode="rb") as f:
+        magic = f.read(len(MAGIC))
+        if magic != MAGIC:
+            logging.exception(f"Le fichier {path} n'est pas au format binaire MyBear")
+            raise ValueError
+        header_size = int.from_bytes(f.read(8), "little")
+        header = json.loads(f.read(header_size))
+    start = len(MAGIC) + 8 + header_size
+    start += -start % ALIGNMENT
+
+    if mmap:
+        # Les buffers sont des vues en lecture seule : la copie sur écriture des Series
+        # ne touchera jamais au fichier
+        content = np.asarray(np.memmap(path, dtype=np.uint8, mode="r"))
+    else:
+        content = np.fromfile(path, dtype=np.uint8)
+    content = content[start:]
+
+    def buffer(location: Dict[str, int]) -> np.ndarray:
+        return content[location["offset"] : location["offset"] + location["nbytes"]]
+
+    series = []
+    for column in header["columns"]:
+        dtype = np.dtype(column["dtype"])
+        length = column["length"]
+        mask = None
+        if "mask" in column:
+            mask = np.unpackbits(
+                buffer(column["mask"]), count=length, bitorder="little"
+            ).astype(bool)
+        if "categories" in column:
+            stored = column["categories"]
+            categories = _decode_objects(
+                stored["encoding"],
+                buffer(stored["offsets"]).view(np.int64),
+                buffer(stored["values"]),
+                np.ones(stored["length"], dtype=bool),
+            )
+            codes = buffer(column["values"]).view(np.dtype(column["codes"]))
+            series.append(
+                Series(
+                    data=codes, name=column["name"], mask=mask, categories=categories
+                )
+            )
+            continue
+        if dtype == object and column["encoding"] == "utf8":
+            # Colonne de chaînes : positions déduites des offsets, sans décodage
+            spans = spans_from_offsets(buffer(column["offsets"]).view(np.int64))
+            series.append(
+                Series(
+                    data=spans,
+                    name=column["name"],
+                    mask=mask,
+                    strings=buffer(column["values"]),
+                )
+            )
+            continue
+        if dtype == object:
+            values = _decode_objects(
+                column["encoding"],
+                buffer(column["offsets"]).view(np.int64),
+                buffer(column["values"]),
+                mask if mask is not None else np.ones(length, dtype=bool),
+            )
+        else:
+            values = buffer(column["values"]).view(dtype)
+        series.append(Series(data=values, name=column["name"], dtype=dtype, mask=mask))
+    return series
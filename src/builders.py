@@ -0,0 +1,614 @@
+import logging
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+from src.categorical import categories_of
+from src.categorical import encode
+from src.categorical import low_cardinality
+from src.categorical import unify_categories
+from src.dates import detect_format
+from src.dates import DETECTED_FORMATS
+from src.dates import FORMAT_KINDS
+from src.dates import FORMAT_SAMPLE_SIZE
+from src.dates import parse_dates
+from src.inference import COMPATIBLE_KINDS
+from src.inference import infer_series
+from src.inference import KIND_DTYPES
+from src.series import FILL_VALUES
+from src.series import Series
+from src.strings import concat_strings
+from src.strings import encode_strings
+from src.strings import SPAN_DTYPE
+from src.strings import Strings
+
+logging.basicConfig(level=logging.INFO)
+
+# Ordre dans lequel une colonne est élargie lorsqu'un chunk ne peut pas être converti
+PROMOTIONS = {
+    "i": "f",
+    "f": "O",
+    "b": "O",
+    "D": "M",
+    "M": "O",
+}
+# Format avec heure vers lequel une colonne de dates est élargie : des dates écrites
+# dans un autre format que celui de la colonne la rendent object, comme lorsque les deux
+# formats se mélangent dans un même chunk
+DATETIME_FORMATS = {
+    "%Y-%m-%d": "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S": "%Y-%m-%d %H:%M:%S",
+}
+
+
+def kind_of_dtype(dtype: Any) -> str:
+    """
+    Associe un type numpy ou Python (int, float, str, "datetime64[D]"...) à sa famille de type
+
+    Parameters
+    ----------
+    dtype : str | type | np.dtype
+        Le type demandé pour une colonne
+
+    Returns
+    -------
+    str
+        La famille de type (b, i, f, D, M ou O)
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind == "M":
+        return "D" if np.datetime_data(dtype)[0] == "D" else "M"
+    if dtype.kind in ("b", "i", "f"):
+        return dtype.kind
+    if dtype.kind == "u":
+        return "i"
+    return "O"
+
+
+def _convert(raw: np.ndarray, kind: str, date_format: str = None) -> np.ndarray:
+    """
+    Convertit en bloc un tableau de chaînes de caractères non vides vers une famille de type,
+    les dates étant lues au format donné (détecté sur le chunk s'il n'est pas précisé)
+
+    Raises
+    ------
+    ValueError
+        Au moins une valeur ne peut pas être convertie
+    """
+    if kind == "i":
+        try:
+            return raw.astype(np.int64)
+        except OverflowError as oe:
+            raise ValueError(oe)
+    if kind == "f":
+        return raw.astype(np.float64)
+    if kind == "b":
+        lowered = np.char.lower(raw.astype(str))
+        if not np.isin(lowered, ("true", "false")).all():
+            raise ValueError("Valeur booléenne invalide")
+        return lowered == "true"
+    if kind in ("D", "M"):
+        dates = parse_dates(raw.tolist(), date_format)
+        if np.isnat(dates).any():
+            raise ValueError("Date invalide")
+        return dates.astype(KIND_DTYPES[kind])
+    return raw
+
+
+def render_strings(values: np.ndarray, kind: str, date_format: str = None) -> List[str]:
+    """
+    Réécrit des valeurs typées sous forme de chaînes de caractères, telles qu'elles
+    ont pu être lues : nombres et booléens comme par `str`, dates au format détecté
+    (ISO par défaut)
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Les valeurs présentes
+    kind : str
+        La famille de type des valeurs
+    date_format : str
+        Le format des dates lues
+
+    Returns
+    -------
+    list
+        Les chaînes de caractères
+    """
+    items = values.tolist()
+    if kind == "D":
+        day_format = date_format if date_format == "%d-%m-%Y" else "%Y-%m-%d"
+        return [item.strftime(day_format) for item in items]
+    if kind == "M":
+        return [item.isoformat(sep=" ") for item in items]
+    return [str(item) for item in items]
+
+
+def mixed_formats(formats: List[Optional[str]]) -> bool:
+    """
+    Indique si des morceaux d'une même colonne ont été lus dans des formats de dates
+    incompatibles (voir `DATETIME_FORMATS`), la colonne devant alors être object
+
+    Parameters
+    ----------
+    formats : list:
+        Le format des dates de chaque morceau, None pour un morceau sans dates
+
+    Returns
+    -------
+    bool
+        Vrai si les formats ne peuvent pas être réunis
+    """
+    families = {
+        DATETIME_FORMATS.get(date_format, date_format)
+        for date_format in formats
+        if date_format is not None
+    }
+    return len(families) > 1
+
+
+def _detect_kind(raw: np.ndarray) -> Tuple[str, np.ndarray, Optional[str]]:
+    """
+    Détecte la famille de type d'un chunk de chaînes de caractères non vides
+    et retourne le chunk converti, ainsi que le format des dates détecté
+    """
+    for kind in ("i", "f", "b"):
+        try:
+            return kind, _convert(raw, kind), None
+        except ValueError:
+            continue
+    date_format = detect_format(raw[:FORMAT_SAMPLE_SIZE].tolist())
+    while date_format is not None:
+        kind = FORMAT_KINDS[date_format]
+        try:
+            return kind, _convert(raw, kind, date_format), date_format
+        except ValueError:
+            # Les dates du chunk sont élargies comme entre deux chunks
+            widened = DATETIME_FORMATS.get(date_format)
+            date_format = widened if widened != date_format else None
+    return "O", raw, None
+
+
+class ColumnBuilder:
+    """
+    Construit une colonne typée à partir de chunks successifs de chaînes de caractères.
+    Chaque chunk est converti en bloc dès son ajout, si bien que seules les valeurs
+    typées sont conservées entre deux chunks. Une colonne de chaînes de caractères
+    est conservée sous forme de codes catégoriels tant qu'elle a peu de valeurs distinctes,
+    puis chaque chunk est encodé dans un buffer UTF-8 (aucune chaîne n'est conservée)
+    """
+
+    def __init__(self, name: str, dtype: Any = None) -> None:
+        """
+        Fonction __init__ permettant de créer une nouvelle instance de la classe ColumnBuilder
+
+        Parameters
+        ----------
+        name : str
+            Le nom de la colonne
+        dtype : str | type | np.dtype
+            Le type imposé pour la colonne, inféré sur le premier chunk s'il n'est pas précisé
+        """
+        self.name = name
+        self.fixed = dtype is not None
+        self.kind: Optional[str] = kind_of_dtype(dtype) if self.fixed else None
+        self._chunks: List[np.ndarray] = []
+        self._masks: List[Optional[np.ndarray]] = []
+        # Dictionnaire des valeurs distinctes d'une colonne catégorielle (inférée)
+        self._table: Optional[Dict[str, int]] = None if self.fixed else {}
+        self._present = 0
+        # Buffers UTF-8 des chunks d'une colonne de chaînes, dont les chunks sont
+        # alors les positions des valeurs
+        self._buffers: Optional[List[np.ndarray]] = None
+        # Format des dates de la colonne, détecté une seule fois puis réutilisé
+        # pour chaque chunk
+        self._date_format: Optional[str] = None
+        # Format des dates de chaque chunk typé, avec lequel il est réécrit en chaînes
+        self._formats: List[Optional[str]] = []
+
+    def append(self, strings: List[str]) -> None:
+        """
+        Convertit et ajoute un chunk de valeurs à la colonne, les chaînes vides
+        étant considérées comme des valeurs manquantes
+
+        Parameters
+        ----------
+        strings : list:
+            Les valeurs brutes du chunk
+
+        Raises
+        ------
+        ValueError
+            Une valeur ne peut pas être convertie vers le type imposé
+        """
+        raw = np.array(strings, dtype=object)
+        mask = raw != ""
+        if mask.all():
+            mask = None
+            present = raw
+        else:
+            present = raw[mask]
+
+        if self.kind is None:
+            self.kind, converted, self._date_format = _detect_kind(present)
+            if self.kind != "O":
+                self._table = None
+        else:
+            while True:
+                try:
+                    if self.kind in ("D", "M") and self._date_format is None:
+                        # Un type imposé accepte aussi les secondes depuis l'epoch
+                        self._date_format = detect_format(
+                            present[:FORMAT_SAMPLE_SIZE].tolist(),
+                            tuple(FORMAT_KINDS) if self.fixed else DETECTED_FORMATS,
+                        )
+                    converted = _convert(present, self.kind, self._date_format)
+                    break
+                except ValueError as ve:
+                    if self.fixed:
+                        logging.exception(
+                            f"La colonne {self.name} ne peut pas être convertie "
+                            f"en {KIND_DTYPES[self.kind]}"
+                        )
+                        raise ve
+                    self._promote(PROMOTIONS[self.kind])
+
+        if self._table is not None or self._buffers is not None:
+            self._append_strings(raw, mask, len(present))
+            return
+
+        if mask is None:
+            values = converted
+        else:
+            dtype = KIND_DTYPES[self.kind]
+            values = np.full(len(raw), FILL_VALUES[dtype.kind], dtype=dtype)
+            values[mask] = converted
+        self._chunks.append(values)
+        self._masks.append(mask)
+        self._formats.append(self._date_format)
+
+    def _append_strings(
+        self, raw: np.ndarray, mask: Optional[np.ndarray], present: int
+    ) -> None:
+        """
+        Ajoute un chunk de chaînes à une colonne catégorielle ou de chaînes, les valeurs
+        manquantes étant des chaînes vides
+        """
+        if self._table is not None:
+            self._chunks.append(encode(raw, mask, self._table))
+            self._masks.append(mask)
+            self._present += present
+            if not low_cardinality(len(self._table), self._present):
+                self._decode()
+            return
+        data, spans = encode_strings(raw.tolist())
+        self._buffers.append(data)
+        self._chunks.append(spans)
+        self._masks.append(mask)
+
+    def _decode(self) -> None:
+        """
+        Abandonne le stockage catégoriel : les chunks de codes sont remplacés
+        par les positions des chaînes correspondantes dans le dictionnaire encodé
+        """
+        data, spans = encode_strings(list(self._table))
+        if not len(spans):
+            spans = np.zeros(1, dtype=SPAN_DTYPE)
+        self._chunks = [spans[codes] for codes in self._chunks]
+        self._buffers = [data] * len(self._chunks)
+        self._table = None
+
+    def _promote(self, kind: str) -> None:
+        """
+        Élargit le type de la colonne, les chunks déjà convertis gardant leur type
+        jusqu'à la construction de la Serie. Des dates ne sont élargies avec heure
+        que dans le même format (voir `DATETIME_FORMATS`), sinon la colonne devient
+        object. Une colonne devenue object réécrit ses chunks en chaînes (voir
+        `render_strings`) puis est construite comme une colonne de chaînes détectée
+        dès le premier chunk : son contenu ne dépend pas du découpage en chunks
+        """
+        if kind == "M" and self._date_format is not None:
+            if self._date_format not in DATETIME_FORMATS:
+                self._promote("O")
+                return
+            self.kind = kind
+            # Le chunk refusé est converti selon le format avec heure de la colonne
+            self._date_format = DATETIME_FORMATS[self._date_format]
+            return
+        if kind == "O":
+            chunks, masks, formats = self._chunks, self._masks, self._formats
+            self._chunks, self._masks, self._formats = [], [], []
+            self._table, self._present = {}, 0
+            for chunk, mask, date_format in zip(chunks, masks, formats):
+                present = chunk if mask is None else chunk[mask]
+                raw = np.full(len(chunk), "", dtype=object)
+                raw[slice(None) if mask is None else mask] = render_strings(
+                    present, kind_of_dtype(chunk.dtype), date_format
+                )
+                self._append_strings(raw, mask, len(present))
+        self.kind = kind
+        # Le chunk refusé est converti selon un format détecté à nouveau
+        self._date_format = None
+
+    @property
+    def date_format(self) -> Optional[str]:
+        """
+        Propriété retournant le format des dates de la colonne, None s'il n'a pas été
+        détecté
+
+        Returns
+        -------
+        str
+            Le format des dates
+        """
+        return self._date_format
+
+    def __len__(self) -> int:
+        """
+        Redéfinition de la méthode __len__ retournant le nombre de valeurs accumulées
+
+        Returns
+        -------
+        int
+            Le nombre de valeurs
+        """
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def build(self) -> Series:
+        """
+        Concatène les chunks accumulés en une Serie typée puis vide le builder,
+        le type retenu étant conservé pour les chunks suivants
+
+        Returns
+        -------
+        Series
+            La colonne construite
+        """
+        kind = self.kind if self.kind is not None else "O"
+        categories = None
+        strings = None
+        if self._table is not None and self._chunks:
+            if self._table:
+                categories = categories_of(self._table)
+            else:
+                self._decode()
+        if not self._chunks:
+            values = np.empty(0, dtype=KIND_DTYPES[kind])
+            mask = None
+        else:
+            if self._buffers is not None:
+                strings, values = concat_strings(list(zip(self._buffers, self._chunks)))
+                self._buffers = []
+            else:
+                values = np.concatenate(self._chunks)
+                if categories is None:
+                    values = values.astype(KIND_DTYPES[kind], copy=False)
+            if all(mask is None for mask in self._masks):
+                mask = None
+            else:
+                mask = np.concatenate(
+                    [
+                        np.ones(len(chunk), dtype=bool) if mask is None else mask
+                        for chunk, mask in zip(self._chunks, self._masks)
+                    ]
+                )
+        self._chunks = []
+        self._masks = []
+        self._formats = []
+        if categories is not None:
+            # Le dictionnaire est conservé pour les chunks suivants : leurs codes restent
+            # compatibles avec ceux des Series déjà construites
+            return Series(data=values, name=self.name, mask=mask, categories=categories)
+        if strings is not None:
+            return Series(data=values, name=self.name, mask=mask, strings=strings)
+        return Series(data=values, name=self.name, dtype=KIND_DTYPES[kind], mask=mask)
+
+
+def as_strings(serie: Series, date_format: str = None) -> Series:
+    """
+    Réécrit une Serie typée en Serie de chaînes (voir `render_strings`), les valeurs
+    manquantes étant conservées
+
+    Parameters
+    ----------
+    serie : Series
+        La Serie typée
+    date_format : str
+        Le format des dates lues
+
+    Returns
+    -------
+    Series
+        La Serie de chaînes
+    """
+    valid = serie._validity()
+    raw = [""] * len(serie)
+    rendered = render_strings(
+        serie._values[valid], kind_of_dtype(serie.dtype), date_format
+    )
+    for position, text in zip(np.flatnonzero(valid).tolist(), rendered):
+        raw[position] = text
+    data, spans = encode_strings(raw)
+    return Series(data=spans, name=serie.name, mask=serie._mask, strings=data)
+
+
+def common_kind(kinds: List[str]) -> str:
+    """
+    Retourne la plus petite famille de type capable de recevoir toutes les familles données
+
+    Parameters
+    ----------
+    kinds : list:
+        Les familles de type à réunir
+
+    Returns
+    -------
+    str
+        La famille commune
+    """
+    common = kinds[0]
+    for kind in kinds[1:]:
+        while kind != common and kind not in COMPATIBLE_KINDS[common]:
+            if common in COMPATIBLE_KINDS[kind]:
+                common = kind
+            else:
+                common = PROMOTIONS[common]
+    return common
+
+
+def concat_series(series: List[Series], name: str = None) -> Series:
+    """
+    Concatène plusieurs Series en une seule, leurs types étant élargis au type commun.
+    Des Series catégorielles restent catégorielles, leurs dictionnaires étant réunis,
+    et des Series de chaînes (ou catégorielles) donnent une Serie de chaînes
+
+    Parameters
+    ----------
+    series : list:
+        Les Series à concaténer, dans l'ordre
+    name : str
+        Le nom de la Serie obtenue
+
+    Returns
+    -------
+    Series
+        La Serie concaténée
+    """
+    # Les Series entièrement manquantes ne participent pas au choix du type commun
+    present = [serie for serie in series if serie._validity().any()] or series[:1]
+    present_ids = {id(serie) for serie in present}
+    if all(serie.categories is not None for serie in present):
+        return _concat_categorical(series, present, name)
+    if all(serie._strings is not None for serie in present) or (
+        any(serie._strings is not None for serie in present)
+        and all(serie._encoded() for serie in present)
+    ):
+        return _concat_strings(series, present, name)
+    dtype = KIND_DTYPES[common_kind([kind_of_dtype(serie.dtype) for serie in present])]
+    values = np.concatenate(
+        [
+            serie.values.astype(dtype, copy=False)
+            if id(serie) in present_ids
+            else np.full(len(serie), FILL_VALUES[dtype.kind], dtype=dtype)
+            for serie in series
+        ]
+    )
+    if all(serie._mask is None for serie in series):
+        mask = None
+    else:
+        mask = np.concatenate([serie._validity() for serie in series])
+    return Series(data=values, name=name, dtype=dtype, mask=mask)
+
+
+def _concat_categorical(
+    series: List[Series], present: List[Series], name: str
+) -> Series:
+    """
+    Concatène des Series dont toutes celles ayant une valeur présente sont catégorielles
+    """
+    codes, categories = unify_categories(present)
+    recoded = {id(serie): serie_codes for serie, serie_codes in zip(present, codes)}
+    values = np.concatenate(
+        [
+            recoded.get(id(serie), np.zeros(len(serie), dtype=codes[0].dtype))
+            for serie in series
+        ]
+    )
+    if all(serie._mask is None for serie in series):
+        mask = None
+    else:
+        mask = np.concatenate([serie._validity() for serie in series])
+    return Series(data=values, name=name, mask=mask, categories=categories)
+
+
+def _strings_of(serie: Series) -> Strings:
+    """
+    Retourne le buffer UTF-8 et les positions des chaînes d'une Serie de chaînes
+    ou catégorielle (le dictionnaire étant encodé une seule fois)
+    """
+    if serie._strings is not None:
+        return serie._strings, serie._values
+    data, spans = encode_strings(serie.categories.tolist())
+    if not len(spans):
+        return data, np.zeros(len(serie), dtype=SPAN_DTYPE)
+    return data, spans[serie.codes]
+
+
+def _concat_strings(series: List[Series], present: List[Series], name: str) -> Series:
+    """
+    Concatène des Series dont toutes celles ayant une valeur présente sont des Series
+    de chaînes ou catégorielles
+    """
+    present_ids = {id(serie) for serie in present}
+    strings, spans = concat_strings(
+        [
+            _strings_of(serie)
+            if id(serie) in present_ids
+            else (np.empty(0, dtype=np.uint8), np.zeros(len(serie), dtype=SPAN_DTYPE))
+            for serie in series
+        ]
+    )
+    if all(serie._mask is None for serie in series):
+        mask = None
+    else:
+        mask = np.concatenate([serie._validity() for serie in series])
+    return Series(data=spans, name=name, mask=mask, strings=strings)
+
+
+class ValueBuilder:
+    """
+    Construit une colonne typée à partir de lots successifs de valeurs Python déjà décodées
+    (lecture JSON). Chaque lot est typé dès son ajout puis les lots sont concaténés
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Fonction __init__ permettant de créer une nouvelle instance de la classe ValueBuilder
+
+        Parameters
+        ----------
+        name : str
+            Le nom de la colonne
+        """
+        self.name = name
+        self._chunks: List[Series] = []
+
+    def append(self, values: List[Any]) -> None:
+        """
+        Type et ajoute un lot de valeurs à la colonne
+
+        Parameters
+        ----------
+        values : list:
+            Les valeurs du lot, None pour une valeur manquante
+        """
+        self._chunks.append(infer_series(values, name=self.name))
+
+    def __len__(self) -> int:
+        """
+        Redéfinition de la méthode __len__ retournant le nombre de valeurs accumulées
+
+        Returns
+        -------
+        int
+            Le nombre de valeurs
+        """
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def build(self) -> Series:
+        """
+        Concatène les lots accumulés en une Serie typée puis vide le builder
+
+        Returns
+        -------
+        Series
+            La colonne construite
+        """
+        chunks, self._chunks = self._chunks, []
+        if not chunks:
+            return Series(data=[], name=self.name, dtype=object)
+        return concat_series(chunks, name=self.name)
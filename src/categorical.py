@@ -0,0 +1,133 @@
+import logging
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+from src.series import Series
+
+logging.basicConfig(level=logging.INFO)
+
+# Proportion maximale de valeurs distinctes parmi les valeurs présentes pour qu'une
+# colonne de chaînes de caractères soit stockée sous forme catégorielle
+CATEGORY_MAX_RATIO = 0.5
+# Nombre de valeurs examinées avant d'encoder toute la colonne
+CATEGORY_SAMPLE_SIZE = 1000
+CODE_DTYPE = np.dtype(np.int32)
+
+
+def low_cardinality(ncategories: int, present: int) -> bool:
+    """
+    Indique si une colonne de `present` valeurs présentes dont `ncategories` distinctes
+    gagne à être stockée sous forme catégorielle
+    """
+    return 0 < ncategories <= CATEGORY_MAX_RATIO * present
+
+
+def encode(
+    values: np.ndarray, mask: Optional[np.ndarray], table: Dict[str, int]
+) -> np.ndarray:
+    """
+    Remplace chaque chaîne présente par son code dans le dictionnaire (table de hachage
+    complétée au fil des nouvelles valeurs), 0 aux positions manquantes
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Les chaînes de caractères (type object)
+    mask : np.ndarray
+        Le masque de validité, None si aucune valeur ne manque
+    table : dict:
+        Le dictionnaire des valeurs distinctes et de leur code, modifié en place
+
+    Returns
+    -------
+    np.ndarray
+        Les codes
+    """
+    present = values if mask is None else values[mask]
+    encoded = np.fromiter(
+        (table.setdefault(value, len(table)) for value in present.tolist()),
+        dtype=CODE_DTYPE,
+        count=len(present),
+    )
+    if mask is None:
+        return encoded
+    codes = np.zeros(len(values), dtype=CODE_DTYPE)
+    codes[mask] = encoded
+    return codes
+
+
+def categories_of(table: Dict[str, int]) -> np.ndarray:
+    """
+    Convertit un dictionnaire de valeurs distinctes en tableau indexé par les codes
+    """
+    categories = np.empty(len(table), dtype=object)
+    categories[:] = list(table)
+    return categories
+
+
+def categorize(serie: Series) -> Series:
+    """
+    Convertit une Serie de chaînes de caractères en Serie catégorielle (codes entiers et
+    dictionnaire des valeurs distinctes) si elle a peu de valeurs distinctes. Un échantillon
+    écarte sans tout encoder les colonnes dont les valeurs sont presque toutes distinctes
+
+    Parameters
+    ----------
+    serie : Series
+        La Serie, dont toutes les valeurs présentes sont des chaînes de caractères
+
+    Returns
+    -------
+    Series
+        La Serie catégorielle, ou la Serie d'origine si elle a trop de valeurs distinctes
+    """
+    if serie.categories is not None or serie.dtype != object:
+        return serie
+    present = len(serie) - serie.null_count()
+    sample = serie._valid_values()[:CATEGORY_SAMPLE_SIZE]
+    if not low_cardinality(len(set(sample.tolist())), len(sample)):
+        return serie
+    table = {}
+    codes = encode(serie.values, serie._mask, table)
+    if not low_cardinality(len(table), present):
+        return serie
+    return Series(
+        data=codes, name=serie.name, mask=serie._mask, categories=categories_of(table)
+    )
+
+
+def unify_categories(series: List[Series]) -> Tuple[List[np.ndarray], np.ndarray]:
+    """
+    Réunit les dictionnaires de plusieurs Series catégorielles et recode chacune d'elles
+    dans le dictionnaire commun, en ne traitant que leurs valeurs distinctes
+
+    Parameters
+    ----------
+    series : list:
+        Les Series catégorielles
+
+    Returns
+    -------
+    tuple
+        Les codes de chaque Serie dans le dictionnaire commun et ce dictionnaire
+    """
+    base = series[0].categories
+    if all(serie.categories is base for serie in series):
+        return [serie.codes for serie in series], base
+    table = {value: code for code, value in enumerate(base.tolist())}
+    recoded = []
+    for serie in series:
+        mapping = np.fromiter(
+            (
+                table.setdefault(value, len(table))
+                for value in serie.categories.tolist()
+            ),
+            dtype=CODE_DTYPE,
+            count=len(serie.categories),
+        )
+        recoded.append(mapping[serie.codes] if len(mapping) else serie.codes)
+    return recoded, categories_of(table)
@@ -1,15 +1,45 @@
-import copy
-from datetime import datetime
+from collections import namedtuple
 import logging
-import re
+from operator import methodcaller
+import tempfile
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Tuple
 from typing import Union
 
+import numpy as np
+
+from src.binary import write_binary
+from src.builders import concat_series
+from src.dates import bucket_ids
+from src.dates import bucket_starts
+from src.describe import describe_columns
+from src.describe import NUMERIC_KINDS
+from src.describe import percentile_name
+from src.executor import parallel_map
+from src.groupby import aggregate
+from src.groupby import first_rows
+from src.groupby import group_codes
+from src.groupby import integer_group_codes
+from src.inference import infer_series
+from src.join import HOW
+from src.join import join_indexers
+from src.join import partitioned_join_indexers
+from src.json_codec import dumps
+from src.lazy import LazyFrame
+from src.lazy import Source
 from src.series import Series
+from src.sort import check_na_position
+from src.sort import lexsort_indexer
+from src.sort import smallest_indexer
+from src.spill import load
+from src.spill import partition_rows
+from src.spill import spill
+from src.spill import spill_partitions
+from src.window import FrameRolling
 
 logging.basicConfig(level=logging.INFO)
 
@@ -45,6 +75,10 @@ class DataFrame:
             Paramètre non conforme
         """
 
+        # Colonnes selon lesquelles les lignes sont triées (voir `sort_values`), avec
+        # la Serie et sa version au moment du tri
+        self._sorted_by = []
+
         if kwargs.get("colonnes"):
             if not isinstance(kwargs.get("colonnes"), list):
                 logging.exception(
@@ -72,40 +106,55 @@ class DataFrame:
                 )
                 raise AttributeError
 
-            data = []
-            for colonne, liste in zip(kwargs.get("colonnes"), kwargs.get("data")):
-                data.append(
-                    cast_into_most_reccurent_type(liste)
-                )  # cast_into_most_reccurent_type(liste))
-
-            self.data = {
-                colonne: Series(data=serie, name=colonne)
-                for colonne, serie in zip(self.colonnes, data)
-            }
+            # L'inférence des colonnes, indépendantes, est répartie par l'exécuteur
+            data = kwargs.get("data")
+            series = parallel_map(
+                infer_series, data, self.colonnes, size=sum(map(len, data))
+            )
+            self.data = dict(zip(self.colonnes, series))
+            # Accès positionnel en O(1) aux colonnes, en parallèle du dictionnaire
+            self._series = list(self.data.values())
 
         elif kwargs.get("series"):
             series_list = kwargs.get("series")
             if series_list:
-                for index, serie in enumerate(series_list):
-                    series_list[index].data = cast_into_most_reccurent_type(serie.data)
+                # Seules les Series dont le type n'a jamais été inféré sont converties
+                series_list = [
+                    serie
+                    if serie._inferred
+                    else infer_series(serie.data, name=serie.name)
+                    for serie in series_list
+                ]
 
                 self.colonnes = [
                     serie.name if serie.name is not None else f"Unnamed {index}"
                     for (index, serie) in enumerate(series_list)
                 ]
+                # Les Series sans nom sont remplacées par des vues nommées
+                for index, (colonne, serie) in enumerate(
+                    zip(self.colonnes, series_list)
+                ):
+                    if serie.name is None:
+                        series_list[index] = serie[:]
+                        series_list[index].set_name(colonne)
 
                 self.data = {
                     colonne: serie for colonne, serie in zip(self.colonnes, series_list)
                 }
+                self._series = series_list
 
-    def __getitem__(self, index: Tuple[Union[int, slice], Union[int, slice]]) -> Any:
+    def __getitem__(
+        self, index: Union[Tuple[Union[int, slice], Union[int, slice]], str, Series]
+    ) -> Any:
         """
-        Fonction permettant de d'indexer l'instance d'une classe, nécessaire pour la propriété iloc
+        Fonction permettant de d'indexer l'instance d'une classe, nécessaire pour la propriété iloc.
+        Un nom de colonne retourne la Serie correspondante et un masque booléen
+        les lignes sélectionnées (voir `filter`)
 
         Parameters
         ----------
-        index : tuple:
-            Tuple à deux éléments puvant être un slice ou un int
+        index : tuple | str | Series:
+            Tuple à deux éléments puvant être un slice ou un int, nom de colonne ou masque booléen
 
 
         Returns
@@ -117,7 +166,16 @@ class DataFrame:
         ------
         IndexError
             Paramètre index non conforme.
+        KeyError
+            Colonne introuvable
         """
+        if isinstance(index, str):
+            if index not in self.data:
+                logging.exception(f"Colonne {index} introuvable")
+                raise KeyError(index)
+            return self.data[index]
+        if isinstance(index, (Series, np.ndarray, list)):
+            return self.filter(index)
         if not isinstance(index, tuple):
             logging.exception("Mauvais type d'index")
             raise IndexError(
@@ -145,31 +203,64 @@ class DataFrame:
         is_slice_and_slice = isinstance(index[0], slice) and isinstance(index[1], slice)
 
         if is_integer_and_integer:
-            return list(self.data.values())[column_start].data[row_start]
+            return self._series[column_start][row_start]
         elif is_slice_and_integer:
-            return Series(
-                data=list(self.data.values())[column_start].data[row_start:row_stop],
-                name=list(self.data.keys())[column_start],
-            )
+            # Vue sur la colonne partageant son buffer
+            serie = self._series[column_start][index[0]]
+            serie.set_name(self.colonnes[column_start])
+            return serie
         elif is_integer_and_slice:
-            data = [d.data[row_start] for d in self.data.values()]
-            columns = self.colonnes[column_start:column_stop]
-            series = [Series(data=[val], name=name) for val, name in zip(data, columns)]
+            series = []
+            for serie, name in zip(self._series[index[1]], self.colonnes[index[1]]):
+                row = serie.take([row_start])
+                row.set_name(name)
+                series.append(row)
             return DataFrame(series=series)
         elif is_slice_and_slice:
-            data = [d.data[row_start:row_stop] for d in self.data.values()]
-            columns = self.colonnes[column_start:column_stop]
-            series = [
-                Series(
-                    data=[series_data]
-                    if not isinstance(series_data, list)
-                    else series_data,
-                    name=series_name,
-                )
-                for series_data, series_name in zip(data, columns)
-            ]
+            # Vues sur les colonnes partageant leurs buffers, copiées seulement à l'écriture
+            series = []
+            for serie, name in zip(self._series[index[1]], self.colonnes[index[1]]):
+                view = serie[index[0]]
+                view.set_name(name)
+                series.append(view)
             return DataFrame(series=series)
 
+    def filter(self, mask: Union[Series, np.ndarray, List[bool]]) -> Any:
+        """
+        Sélectionne les lignes pour lesquelles le masque booléen est vrai : les positions
+        retenues sont calculées une seule fois puis chaque colonne est extraite en un
+        passage vectorisé. Une valeur manquante du masque ne sélectionne pas la ligne
+
+        Parameters
+        ----------
+        mask : Series | np.ndarray | list:
+            Le masque booléen, de la taille du DataFrame
+
+        Returns
+        -------
+        DataFrame
+            Nouvelle instance de DataFrame contenant les lignes sélectionnées
+
+        Raises
+        ------
+        TypeError
+            Le masque n'est pas booléen
+        ValueError
+            Le masque n'a pas la taille du DataFrame
+        """
+        if isinstance(mask, Series):
+            mask = mask._mask_values()
+        mask = np.asarray(mask)
+        if mask.dtype.kind != "b":
+            logging.exception(f"Masque booléen attendu. Type reçu : {mask.dtype}")
+            raise TypeError
+        if len(mask) != len(self):
+            logging.exception(
+                f"Taille du masque attendue : {len(self)}. Reçu : {len(mask)}"
+            )
+            raise ValueError
+        return self._take(np.flatnonzero(mask))
+
     @property
     def iloc(self):
         """
@@ -191,45 +282,93 @@ class DataFrame:
         int
             Le nombre d'éléments du DataFrame
         """
-        return self.data.get(list(self.data.keys())[0]).count()
+        return self._series[0].count()
 
-    def min(self) -> Any:
+    def _reduce(self, how: str, **kwargs: Any) -> Any:
+        """
+        Réduit chaque colonne en un scalaire (valeurs manquantes exclues), les colonnes
+        étant réparties par l'exécuteur configuré avec `set_options`, et retourne
+        un DataFrame d'une ligne
+        """
+        results = parallel_map(
+            methodcaller(how, **kwargs),
+            self._series,
+            size=len(self._series) * len(self),
+        )
+        return DataFrame(
+            series=[
+                Series(data=[result], name=name)
+                for name, result in zip(self.colonnes, results)
+            ]
+        )
+
+    def sum(self, skipna: bool = True, min_count: int = 0) -> Any:
+        """
+        Récupère la somme des élements présents de chaque Serie composant un DataFrame
+
+        Parameters
+        ----------
+        skipna : bool
+            Si faux, le résultat d'une colonne est manquant dès qu'une de ses valeurs l'est
+        min_count : int
+            Le nombre minimal de valeurs présentes par colonne, le résultat étant manquant en deçà
+
+        Returns
+        -------
+        DataFrame
+            La somme pour chaque colonne
+        """
+        return self._reduce("sum", skipna=skipna, min_count=min_count)
+
+    def min(self, skipna: bool = True, min_count: int = 0) -> Any:
         """
         Récupère le plus petit élement numérique de chaque Serie composant
         un DataFrame
 
+        Parameters
+        ----------
+        skipna : bool
+            Si faux, le résultat d'une colonne est manquant dès qu'une de ses valeurs l'est
+        min_count : int
+            Le nombre minimal de valeurs présentes par colonne, le résultat étant manquant en deçà
+
         Returns
         -------
         DataFrame
             L'élement le plus petit pour chaque colonne
         """
+        return self._reduce("min", skipna=skipna, min_count=min_count)
 
-        minimums = [
-            Series(data=[element.min()], name=name)
-            for name, element in self.data.items()
-        ]
-        return DataFrame(series=minimums)
-
-    def max(self) -> Any:
+    def max(self, skipna: bool = True, min_count: int = 0) -> Any:
         """
         Récupère le plus grand élement numérique de chaque Serie composant
         un DataFrame
 
+        Parameters
+        ----------
+        skipna : bool
+            Si faux, le résultat d'une colonne est manquant dès qu'une de ses valeurs l'est
+        min_count : int
+            Le nombre minimal de valeurs présentes par colonne, le résultat étant manquant en deçà
+
         Returns
         -------
         DataFrame
             L'élement le plus grand pour chaque colonne
         """
-        maximums = [
-            Series(data=[element.max()], name=name)
-            for name, element in self.data.items()
-        ]
-        return DataFrame(series=maximums)
+        return self._reduce("max", skipna=skipna, min_count=min_count)
 
-    def mean(self) -> Any:
+    def mean(self, skipna: bool = True, min_count: int = 0) -> Any:
         """
         Calcul de la moyenne de l'ensemble des colonnes d'une dataframe
 
+        Parameters
+        ----------
+        skipna : bool
+            Si faux, le résultat d'une colonne est manquant dès qu'une de ses valeurs l'est
+        min_count : int
+            Le nombre minimal de valeurs présentes par colonne, le résultat étant manquant en deçà
+
         Returns
         -------
         DataFrame
@@ -240,16 +379,21 @@ class DataFrame:
         ValueError
             Une des Series n'a pas d'éléments numérique
         """
-        moyennes = [
-            Series(data=[element.mean()], name=name)
-            for name, element in self.data.items()
-        ]
-        return DataFrame(series=moyennes)
+        return self._reduce("mean", skipna=skipna, min_count=min_count)
 
-    def std(self) -> Any:
+    def std(self, skipna: bool = True, min_count: int = 0, ddof: int = 0) -> Any:
         """
         Calcul de l'écart-type de l'ensemble des colonnes d'une dataframe
 
+        Parameters
+        ----------
+        skipna : bool
+            Si faux, le résultat d'une colonne est manquant dès qu'une de ses valeurs l'est
+        min_count : int
+            Le nombre minimal de valeurs présentes par colonne, le résultat étant manquant en deçà
+        ddof : int
+            Le nombre de degrés de liberté retranché au dénominateur `0 par défaut`
+
         Returns
         -------
         DataFrame
@@ -260,93 +404,476 @@ class DataFrame:
         ValueError
             Une des Series n'a pas d'éléments numérique
         """
-        stds = [
-            Series(data=[element.std()], name=name)
-            for name, element in self.data.items()
+        return self._reduce("std", skipna=skipna, min_count=min_count, ddof=ddof)
+
+    @staticmethod
+    def _describe(series: List[Series], statistics: List[str]) -> Any:
+        """
+        Calcule les statistiques des colonnes données et les présente en un DataFrame
+        dont chaque ligne est une statistique
+        """
+        results = describe_columns(series, statistics)
+        return DataFrame(
+            series=[Series(data=statistics, name="statistic")]
+            + [
+                Series(data=values, name=serie.name)
+                for serie, values in zip(series, results)
+            ]
+        )
+
+    def agg(self, statistics: Union[str, List[str]]) -> Any:
+        """
+        Calcule plusieurs statistiques de chaque colonne en un seul passage par colonne,
+        les colonnes étant traitées en parallèle. Les colonnes non numériques n'ont que
+        count, null_count, min et max (les autres statistiques sont manquantes)
+
+        Parameters
+        ----------
+        statistics : str | list:
+            Les statistiques parmi count (valeurs présentes), null_count, sum, min, max,
+            mean, std, median et les quantiles ("25%", "90%"...)
+
+        Returns
+        -------
+        DataFrame
+            Une colonne statistic avec le nom des statistiques puis une colonne par colonne
+            du DataFrame
+
+        Raises
+        ------
+        ValueError
+            Nom de statistique inconnu
+        """
+        statistics = [statistics] if isinstance(statistics, str) else list(statistics)
+        return self._describe(self._series, statistics)
+
+    def describe(self, percentiles: List[float] = (0.25, 0.5, 0.75)) -> Any:
+        """
+        Résume les colonnes numériques d'un DataFrame : nombre de valeurs présentes et
+        manquantes, moyenne, écart-type, minimum, quantiles exacts et maximum, les
+        quantiles mis à part étant calculés en un seul passage par colonne
+
+        Parameters
+        ----------
+        percentiles : list:
+            Les fractions des quantiles à estimer `0.25, 0.5 et 0.75 par défaut`
+
+        Returns
+        -------
+        DataFrame
+            Une colonne statistic avec le nom des statistiques puis une colonne par colonne
+            numérique du DataFrame
+
+        Raises
+        ------
+        ValueError
+            Fraction de quantile en dehors de [0, 1]
+        """
+        statistics = ["count", "null_count", "mean", "std", "min"]
+        statistics += [percentile_name(fraction) for fraction in percentiles]
+        statistics.append("max")
+        numeric = [serie for serie in self._series if serie.dtype.kind in NUMERIC_KINDS]
+        return self._describe(numeric, statistics)
+
+    def _is_sorted_by(self, columns: List[str]) -> bool:
+        """
+        Indique si les lignes sont triées selon les colonnes données (dans un ordre
+        et des sens quelconques), c'est-à-dire si elles forment un préfixe des colonnes
+        de tri dont les Series n'ont pas été modifiées depuis le tri : les lignes de
+        mêmes clés sont alors contiguës
+        """
+        prefix = self._sorted_by[: len(columns)]
+        return (
+            len(prefix) == len(columns)
+            and {name for name, _, _ in prefix} == set(columns)
+            and all(
+                self.data.get(name) is serie and serie._version == version
+                for name, serie, version in prefix
+            )
+        )
+
+    def sort_values(
+        self,
+        by: Union[List[str], str],
+        ascending: Union[List[bool], bool] = True,
+        na_position: str = "last",
+    ) -> Any:
+        """
+        Trie les lignes d'un DataFrame selon une ou plusieurs colonnes par un tri
+        lexicographique stable sur les buffers typés des colonnes. Le DataFrame trié
+        retient ses colonnes de tri, ce qui permet aux groupby et aux jointures
+        ultérieurs de se passer de hachage
+
+        Parameters
+        ----------
+        by : str | list:
+            Le nom de la ou des colonnes de tri, la première étant la plus significative
+        ascending : bool | list:
+            Le sens du tri, pour toutes les colonnes ou pour chacune `croissant par défaut`
+        na_position : str
+            La position des valeurs manquantes (first ou last) `last par défaut`
+
+        Returns
+        -------
+        DataFrame
+            Nouvel objet de type DataFrame trié
+
+        Raises
+        ------
+        ValueError
+            Colonne introuvable, nombre de sens de tri ou position des valeurs manquantes
+            non conforme
+        TypeError
+            Valeurs non ordonnables entre elles
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        ascending = (
+            [ascending] * len(by) if isinstance(ascending, bool) else list(ascending)
+        )
+        missing_columns = [colonne for colonne in by if colonne not in self.colonnes]
+        if missing_columns:
+            logging.exception(f"Colonnes introuvables : {missing_columns}")
+            raise ValueError
+        if not by or len(ascending) != len(by):
+            logging.exception(
+                f"Un sens de tri attendu par colonne : {len(by)}. Reçu : {len(ascending)}"
+            )
+            raise ValueError
+        check_na_position(na_position)
+
+        keys = [self.data[colonne]._sort_buffer() for colonne in by]
+        order = lexsort_indexer(keys, ascending, na_position)
+        sorted_frame = self._take(order)
+        sorted_frame._sorted_by = [
+            (colonne, sorted_frame.data[colonne], sorted_frame.data[colonne]._version)
+            for colonne in by
         ]
-        return DataFrame(series=stds)
+        if ascending[0]:
+            sorted_frame.data[by[0]]._statistic("sorted", lambda: True)
+        return sorted_frame
+
+    def _take(self, positions: np.ndarray) -> Any:
+        """
+        Retourne un DataFrame composé des lignes situées aux positions données
+        """
+        return DataFrame(series=[serie.take(positions) for serie in self._series])
+
+    def _smallest(self, n: int, columns: Union[List[str], str], largest: bool) -> Any:
+        """
+        Retourne les `n` plus petites ou plus grandes lignes selon les colonnes données
+        """
+        columns = [columns] if isinstance(columns, str) else list(columns)
+        missing_columns = [
+            colonne for colonne in columns if colonne not in self.colonnes
+        ]
+        if missing_columns:
+            logging.exception(f"Colonnes introuvables : {missing_columns}")
+            raise ValueError
+        keys = [self.data[colonne]._sort_buffer() for colonne in columns]
+        return self._take(smallest_indexer(keys, n, largest=largest))
+
+    def nsmallest(self, n: int, columns: Union[List[str], str]) -> Any:
+        """
+        Récupère les `n` lignes ayant les plus petites valeurs dans les colonnes données,
+        triées, par une sélection partielle sur la première colonne plutôt qu'un tri
+        complet. Les lignes dont la première colonne est manquante sont exclues et,
+        à égalité, la première ligne l'emporte
+
+        Parameters
+        ----------
+        n : int
+            Le nombre de lignes
+        columns : str | list:
+            Le nom de la ou des colonnes comparées, la première étant la plus significative
+
+        Returns
+        -------
+        DataFrame
+            Les lignes retenues
+
+        Raises
+        ------
+        ValueError
+            Colonne introuvable
+        """
+        return self._smallest(n, columns, largest=False)
+
+    def nlargest(self, n: int, columns: Union[List[str], str]) -> Any:
+        """
+        Récupère les `n` lignes ayant les plus grandes valeurs dans les colonnes données,
+        triées par ordre décroissant (voir `nsmallest`)
+
+        Parameters
+        ----------
+        n : int
+            Le nombre de lignes
+        columns : str | list:
+            Le nom de la ou des colonnes comparées, la première étant la plus significative
+
+        Returns
+        -------
+        DataFrame
+            Les lignes retenues
+
+        Raises
+        ------
+        ValueError
+            Colonne introuvable
+        """
+        return self._smallest(n, columns, largest=True)
 
     def groupby(
-        self, by: List[str] | str, agg: Dict[str, Callable[[List[Any]], Any]]
+        self,
+        by: List[str] | str,
+        agg: Dict[str, Union[str, Callable[[List[Any]], Any], List[Any]]] = None,
     ) -> Any:
         """
         Permet de combiner et d'agréger plusieurs lignes d'un DataFrame en formant des groupes à partir d'une
         ou plusieurs colonnes.
 
+        Les clés sont encodées une seule fois en codes entiers de groupe, puis chaque
+        agrégation nommée (sum, mean, min, max, count, std, first, last) est calculée
+        en un passage vectorisé sur ces codes, approx_nunique estimant le nombre de
+        valeurs distinctes de chaque groupe par un HyperLogLog. Une fonction quelconque est appelée avec
+        la liste des valeurs de chaque groupe. Les colonnes absentes de `agg` prennent
+        la première valeur de chaque groupe et les lignes dont une clé est manquante sont ignorées
+        Au-delà du budget mémoire (option `memory_limit`), les groupes sont calculés
+        partition par partition sur disque, avec le même résultat
+
         Parameters
         -------
 
         by: str:
             Le nom de la ou des colonnes sur lesquelles grouper
         agg: dict:
-            La stratégie d'agrégation des colonnes
+            La stratégie d'agrégation des colonnes : un nom d'agrégation, une fonction
+            ou une liste de celles-ci (les colonnes produites sont alors suffixées par l'agrégation)
         Returns
         -------
         DataFrame
             Nouvelle instance de DataFrame contenant les valeurs aggrégés
+
+        Raises
+        -------
+        TypeError
+            Paramètre by non conforme, ou somme, moyenne ou écart-type d'une colonne
+            non numérique
+        ValueError
+            Colonne ou agrégation inconnue, ou budget mémoire trop faible
         """
 
-        if not isinstance(by, (list, str)):
-            raise Exception
+        if isinstance(by, str):
+            by = [by]
+        if not isinstance(by, list) or not by:
+            logging.exception(
+                f"Type attendu pour by : {list} ou {str}. Reçu : {type(by)}"
+            )
+            raise TypeError
+        agg = agg if agg is not None else {}
 
-        is_in_list = [True if element in self.colonnes else False for element in by]
+        missing_columns = [
+            colonne for colonne in by + list(agg) if colonne not in self.colonnes
+        ]
+        if missing_columns:
+            logging.exception(f"Colonnes introuvables : {missing_columns}")
+            raise ValueError
+
+        presorted = self._is_sorted_by(by)
+        npartitions = spill_partitions(self._series)
+        if npartitions > 1:
+            return self._partitioned_groupby(by, agg, presorted, npartitions)
+        return self._grouped(by, agg, presorted)[0]
+
+    def _grouped(
+        self,
+        by: List[str],
+        agg: Dict[str, Union[str, Callable[[List[Any]], Any], List[Any]]],
+        presorted: bool,
+    ) -> Tuple[Any, np.ndarray]:
+        """
+        Groupe et agrège les lignes en mémoire (voir `groupby`) et retourne le résultat
+        ainsi que la position de la première ligne de chaque groupe
+        """
+        keys = [self.data[colonne] for colonne in by]
+        codes, ngroups = group_codes(keys, presorted=presorted)
+        rows = first_rows(codes, ngroups)
+
+        series_list = []
+        for key in keys:
+            key_serie = key.take(rows)
+            key_serie.set_name(key.name)
+            series_list.append(key_serie)
+        series_list += self._aggregate_groups(by, codes, ngroups, agg)
+        return DataFrame(series=series_list), rows
+
+    def _partitioned_groupby(
+        self,
+        by: List[str],
+        agg: Dict[str, Union[str, Callable[[List[Any]], Any], List[Any]]],
+        presorted: bool,
+        npartitions: int,
+    ) -> Any:
+        """
+        Groupe et agrège les lignes partition par partition lorsqu'elles dépassent le
+        budget mémoire : les lignes sont réparties par hachage de leurs clés dans des
+        fichiers temporaires (un groupe n'appartient qu'à une partition), chaque
+        partition est relue et agrégée seule, puis les groupes sont remis dans l'ordre
+        de première apparition du groupby en mémoire
+        """
+        keys = [self.data[colonne] for colonne in by]
+        results, firsts = [], []
+        with tempfile.TemporaryDirectory(prefix="mybear-") as directory:
+            paths = spill(
+                self._series, partition_rows(keys, npartitions), directory, "groupby"
+            )
+            for path in paths:
+                *series, positions = load(path)
+                grouped, rows = DataFrame(series=series)._grouped(by, agg, presorted)
+                results.append(grouped)
+                firsts.append(positions.values[rows])
+
+        order = np.argsort(np.concatenate(firsts), kind="stable")
+        series_list = []
+        for colonne in results[0].colonnes:
+            parts = [result.data[colonne] for result in results]
+            series_list.append(concat_series(parts, name=colonne).take(order))
+            series_list[-1].set_name(colonne)
+        return DataFrame(series=series_list)
+
+    def rolling(self, window: int, min_periods: int = None) -> FrameRolling:
+        """
+        Retourne les calculs par fenêtre glissante (count, sum, mean, std, min, max)
+        de chaque colonne numérique, les autres colonnes étant conservées telles quelles
+
+        Parameters
+        ----------
+        window : int
+            Le nombre de lignes consécutives de chaque fenêtre
+        min_periods : int
+            Le nombre minimal de valeurs présentes dans une fenêtre, le résultat étant
+            manquant en deçà (taille de la fenêtre par défaut)
+
+        Returns
+        -------
+        FrameRolling
+            Les fenêtres du DataFrame
 
-        if False in is_in_list:
+        Raises
+        ------
+        ValueError
+            Taille de fenêtre ou nombre minimal non conforme
+        """
+        return FrameRolling(self, window, min_periods)
+
+    def expanding(self, min_periods: int = 1) -> FrameRolling:
+        """
+        Retourne les calculs par fenêtre croissante (de la première ligne à chaque
+        ligne) de chaque colonne numérique, avec les mêmes statistiques que `rolling`
+
+        Parameters
+        ----------
+        min_periods : int
+            Le nombre minimal de valeurs présentes dans une fenêtre
+
+        Returns
+        -------
+        FrameRolling
+            Les fenêtres du DataFrame
+        """
+        return FrameRolling(self, None, min_periods)
+
+    def _aggregate_groups(
+        self,
+        by: List[str],
+        codes: np.ndarray,
+        ngroups: int,
+        agg: Dict[str, Union[str, Callable[[List[Any]], Any], List[Any]]],
+    ) -> List[Series]:
+        """
+        Agrège par groupe les colonnes autres que les clés, selon leur stratégie
+        d'agrégation (voir `groupby`)
+        """
+        series_list = []
+        for colonne in self.colonnes:
+            if colonne in by:
+                continue
+            strategies = agg.get(colonne, "first")
+            if not isinstance(strategies, list):
+                series_list.append(
+                    aggregate(self.data[colonne], codes, ngroups, strategies)
+                )
+                continue
+            for strategy in strategies:
+                suffix = strategy if isinstance(strategy, str) else strategy.__name__
+                series_list.append(
+                    aggregate(
+                        self.data[colonne],
+                        codes,
+                        ngroups,
+                        strategy,
+                        name=f"{colonne}_{suffix}",
+                    )
+                )
+        return series_list
+
+    def resample(
+        self,
+        on: str,
+        every: str,
+        agg: Dict[str, Union[str, Callable[[List[Any]], Any], List[Any]]] = None,
+    ) -> Any:
+        """
+        Agrège les lignes d'un DataFrame par période d'une colonne de dates. Chaque date
+        est convertie en un numéro de période entier en un seul passage, puis les numéros
+        sont groupés sans hachage (voir `integer_group_codes`) et les colonnes agrégées
+        comme pour `groupby`. Seules les périodes contenant au moins une ligne sont
+        produites, par ordre chronologique, et les lignes sans date sont ignorées
+
+        Parameters
+        -------
+        on: str:
+            Le nom de la colonne de dates
+        every: str:
+            La durée des périodes : un entier suivi de us, ms, s, min, h, D, W
+            (durées fixes comptées depuis 1970-01-01) ou de M, Y (mois et années)
+        agg: dict:
+            La stratégie d'agrégation des colonnes (voir `groupby`)
+
+        Returns
+        -------
+        DataFrame
+            Le début de chaque période (colonne `on`) et les valeurs agrégées
+
+        Raises
+        -------
+        TypeError
+            La colonne n'est pas une colonne de dates
+        ValueError
+            Colonne, fréquence ou agrégation inconnue
+        """
+        agg = agg if agg is not None else {}
+        missing_columns = [
+            colonne for colonne in [on] + list(agg) if colonne not in self.colonnes
+        ]
+        if missing_columns:
+            logging.exception(f"Colonnes introuvables : {missing_columns}")
             raise ValueError
-        else:
-            series_list = []
-            doublon_indexes = []
-            for colonne in by:
-                if colonne in agg:
-                    # Regarder les valeurs uniques de la colonne sélectionné lors du by
-                    doublons = {}
-                    for index, valeur in enumerate(self.data.get(colonne).data):
-                        if valeur in doublons:
-                            doublons[valeur].append(index)
-                        else:
-                            doublons[valeur] = [index]
-
-                    # Crée la série de colonne du by et qui est dans agg et l'ajoute dans la liste des series
-                    datas = []
-                    for d in list(doublons.values()):
-                        values = []
-                        if len(d) == 1:
-                            datas.append(self.iloc[d[0], self.colonnes.index(colonne)])
-                        else:
-                            doublon_indexes.append(d)
-                            for d_index in d:
-                                # récupère une valeur unique
-                                values.append(
-                                    self.iloc[d_index, self.colonnes.index(colonne)]
-                                )
-                            datas.append(values[0])
-
-                    series_list.append(Series(data=datas, name=colonne))
-
-            # Parcours les colonnes à part la colonne du by et crée une nouvelle serie avec sum appliqué
-            for col in self.colonnes:
-                if col not in by:
-                    datas = []
-                    doublon_values = []
-                    for group_indexes in doublon_indexes:
-                        for index in group_indexes:
-                            doublon_values.append(
-                                self.iloc[index, self.colonnes.index(col)]
-                            )
-
-                    for agg_value in agg.values():
-                        try:
-                            datas.append(agg_value(doublon_values))
-                        except:
-                            ...
-
-                    series_list.append(Series(data=datas, name=col))
-
-            # TODO : Retourner une exception si la fonction d'aggrégation n'est pas possible pour la fonction appelé
-            # Créer un nouveau dataframe à partir de chaque nouvelle colonne
-            new_dataframe = DataFrame(series=series_list)
-            # Retourner cet instance nouvellement créée
-            return new_dataframe
+        dates = self.data[on]
+        if dates.dtype.kind != "M":
+            logging.exception(
+                f"Colonne de dates attendue pour {on}. Type reçu : {dates.dtype}"
+            )
+            raise TypeError
+
+        ids = bucket_ids(dates._values, every)
+        presorted = self._is_sorted_by([on]) or dates.is_sorted()
+        codes, keys = integer_group_codes(ids, dates._mask, presorted=presorted)
+        buckets = Series(
+            data=bucket_starts(keys, every, dates.dtype), name=on, dtype=dates.dtype
+        )
+        series_list = [buckets]
+        series_list += self._aggregate_groups([on], codes, len(keys), agg)
+        return DataFrame(series=series_list)
 
     def join(
         self,
@@ -354,10 +881,19 @@ class DataFrame:
         left_on: List[str] | str,
         right_on: List[str] | str,
         how: str = "left",
+        suffixes: Tuple[str, str] = ("_x", "_y"),
     ) -> Any:
         """
         Permet de combiner des données provenant de deux DataFrames
 
+        Les lignes sont appariées sur l'égalité des clés (une ou plusieurs colonnes),
+        chaque ligne pouvant correspondre à plusieurs lignes de l'autre DataFrame.
+        Une jointure par fusion est utilisée si les deux clés sont déjà triées, une
+        jointure par hachage sinon, dont la table est construite sur les clés du plus
+        petit DataFrame puis sondée par les lignes de l'autre. Aucun des deux
+        DataFrames n'est copié ni modifié. Au-delà du budget mémoire (option
+        `memory_limit`), les clés sont appariées partition par partition sur disque
+
         Parameters
         -------
         other: DataFrame:
@@ -365,83 +901,188 @@ class DataFrame:
         left_on : List | str: Le nom de la ou des colonnes de la dataframe de gauche ``self``
         right_on : List | str: Le nom de la ou des colonnes de la dataframe de droite ``other``
         how : str: La manière dont la jointure sera faite ``à gauche, à droite, intérieures et pleines``
+        suffixes : tuple: Les suffixes ajoutés aux colonnes présentes des deux côtés
 
         Returns
         -------
         DataFrame
             Le nouvel objet DataFrame ayant été combiné avec une l'autre dataframe
+
+        Raises
+        -------
+        TypeError
+            Paramètre other, left_on ou right_on non conforme
+        ValueError
+            Type de jointure inconnu, colonnes clés introuvables, colonnes en double
+            après l'ajout des suffixes ou budget mémoire trop faible
         """
         if not isinstance(other, DataFrame):
-            logging.log(
-                logging.CRITICAL,
-                f"Type attendu pour other : {DataFrame}. Got {type(other)}",
+            logging.exception(
+                f"Type attendu pour other : {DataFrame}. Reçu : {type(other)}"
             )
-        how_list = ["left", "right", "inner", "outer"]
-        if not isinstance(left_on, (list, str)) and not isinstance(
+            raise TypeError
+        if not isinstance(left_on, (list, str)) or not isinstance(
             right_on, (list, str)
         ):
-            logging.log(logging.CRITICAL, "Argument left_on ou right_on non conformes")
-        if how not in how_list:
-            logging.log(
-                logging.CRITICAL,
-                f"Argument attendu pour how : {' ou '.join(how_list)}. Got {type(other)}",
+            logging.exception("Argument left_on ou right_on non conformes")
+            raise TypeError
+        if how not in HOW:
+            logging.exception(
+                f"Argument attendu pour how : {' ou '.join(HOW)}. Reçu : {how}"
             )
-
-        result = []
+            raise ValueError
 
         # Vérification des types des clés
         if isinstance(left_on, str):
             left_on = [left_on]
         if isinstance(right_on, str):
             right_on = [right_on]
+        if len(left_on) != len(right_on) or not left_on:
+            logging.exception(
+                "left_on et right_on doivent avoir le même nombre de clés"
+            )
+            raise ValueError
+        missing_columns = [c for c in left_on if c not in self.colonnes] + [
+            c for c in right_on if c not in other.colonnes
+        ]
+        if missing_columns:
+            logging.exception(f"Colonnes introuvables : {missing_columns}")
+            raise ValueError
 
-        def add_suffix(col: str, i: int, df: DataFrame, suffix: str):
-            """
-            Fonction utilitaire permettant d'ajouter un suffixe
-            sur le dataframe de gauche ou droite en fonction de sa présence
-            """
-            df.colonnes[i] = col + suffix
-            df.data.get(col).set_name(col + suffix)
-            df.data[col + suffix] = df.data.get(col)
-            del df.data[col]
-
-        if how == "left":
-            left_dataframe = copy.deepcopy(self)
-            unique_right_cols = []
-            for index, colonne in enumerate(other.colonnes):
-                if colonne in left_dataframe.colonnes:
-                    add_suffix(colonne, index, other, "_y")
-                    add_suffix(colonne, index, left_dataframe, "_x")
-                else:
-                    unique_right_cols.append(other.data.get(colonne))
-
-            right_series_empty = []
-            for serie in other:
-                if "_y" in serie.name:
-                    right_series_empty.append(
-                        Series(data=[None] * serie.count(), name=serie.name)
-                    )
-            right_series_empty.extend(unique_right_cols)
-            left_series = list(left_dataframe.data.values())
-            return DataFrame(series=left_series + right_series_empty)
-        if how == "right":
-            left_dataframe = copy.deepcopy(self)
-            unique_right_cols = []
-            for index, colonne in enumerate(other.colonnes):
-                if colonne in left_dataframe.colonnes:
-                    add_suffix(colonne, index, other, "_y")
-                    add_suffix(colonne, index, left_dataframe, "_x")
-                else:
-                    unique_right_cols.append(other.data.get(colonne))
-            left_series_empty = []
-            for serie in left_dataframe:
-                if "_x" in serie.name:
-                    left_series_empty.append(
-                        Series(data=[None] * serie.count(), name=serie.name)
+        # Une clé portant le même nom des deux côtés n'apparaît qu'une fois
+        shared_keys = {
+            left_key
+            for left_key, right_key in zip(left_on, right_on)
+            if left_key == right_key
+        }
+        left_names = [
+            colonne + suffixes[0]
+            if colonne in other.colonnes and colonne not in shared_keys
+            else colonne
+            for colonne in self.colonnes
+        ]
+        right_names = [
+            colonne + suffixes[1] if colonne in self.colonnes else colonne
+            for colonne in other.colonnes
+            if colonne not in shared_keys
+        ]
+        names = left_names + right_names
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            logging.exception(
+                f"Colonnes en double après la jointure : {duplicates}. "
+                f"Suffixes à modifier : {suffixes}"
+            )
+            raise ValueError
+
+        left_keys = [self.data[colonne] for colonne in left_on]
+        right_keys = [other.data[colonne] for colonne in right_on]
+        npartitions = spill_partitions(self._series + other._series)
+        if npartitions > 1:
+            left_rows, right_rows = partitioned_join_indexers(
+                left_keys, right_keys, how, npartitions
+            )
+        else:
+            left_rows, right_rows = join_indexers(left_keys, right_keys, how)
+
+        series_list = []
+        for colonne, name in zip(self.colonnes, left_names):
+            serie = self.data[colonne].take(left_rows, allow_fill=True)
+            if colonne in shared_keys:
+                if how in ("right", "outer"):
+                    both = concat_series([self.data[colonne], other.data[colonne]])
+                    serie = both.take(
+                        np.where(left_rows >= 0, left_rows, len(self) + right_rows),
+                        allow_fill=True,
                     )
-            right_series = list(other.data.values())
-            right_series.append(right_series.pop(0))
-            return DataFrame(series=left_series_empty + right_series)
+            serie.set_name(name)
+            series_list.append(serie)
+
+        right_columns = [c for c in other.colonnes if c not in shared_keys]
+        for colonne, name in zip(right_columns, right_names):
+            serie = other.data[colonne].take(right_rows, allow_fill=True)
+            serie.set_name(name)
+            series_list.append(serie)
+
+        return DataFrame(series=series_list)
+
+    def lazy(self) -> LazyFrame:
+        """
+        Retourne un LazyFrame dont les opérations sont enregistrées dans un plan logique,
+        optimisé puis exécuté en une fois par `collect`
+
+        Returns
+        -------
+        LazyFrame
+            Un LazyFrame ayant le DataFrame pour source
+        """
+        return LazyFrame(Source(self))
+
+    def to_json(self, path: str, orient: str = "records", lines: bool = False) -> None:
+        """
+        Écrit le DataFrame dans un fichier JSON relisible par `read_json`. Les lignes sont
+        encodées (avec orjson s'il est installé) et écrites au fil de l'eau, sans construire
+        le document complet en mémoire
+
+        Parameters
+        ----------
+        path : str
+            Le chemin du fichier à écrire
+        orient : str
+            L'orientation du fichier JSON (records ou columns) `records par défaut`
+        lines : bool
+            Écriture d'un enregistrement JSON par ligne (NDJSON)
+
+        Raises
+        ------
+        TypeError
+            Valeur pour l'orientation du fichier JSON invalide
+        """
+        if orient not in ("records", "columns"):
+            logging.exception("Valeur pour le paramètre orient non conforme")
+            raise TypeError
+        if lines and orient != "records":
+            logging.exception(
+                "L'écriture par ligne n'est possible qu'avec orient=records"
+            )
+            raise TypeError
+
+        with open(path, mode="wb") as f:
+            if orient == "columns":
+                f.write(b"{")
+                for position, (colonne, serie) in enumerate(self.data.items()):
+                    f.write(b"," if position else b"")
+                    f.write(dumps(colonne) + b":")
+                    f.write(dumps(dict(zip(map(str, range(len(serie))), serie))))
+                f.write(b"}")
+                return
+
+            rows = (
+                dict(zip(self.colonnes, values))
+                for values in self.itertuples(index=False, name=None)
+            )
+            if lines:
+                for row in rows:
+                    f.write(dumps(row) + b"\n")
+                return
+            f.write(b"[")
+            for position, row in enumerate(rows):
+                f.write(b"," if position else b"")
+                f.write(dumps(row))
+            f.write(b"]")
+
+    def to_binary(self, path: str) -> None:
+        """
+        Écrit le DataFrame au format binaire colonne MyBear, relisible par `read_binary`
+        sans nouvelle inférence de type : un en-tête (noms, types, tailles et bitmaps de
+        valeurs manquantes des colonnes) suivi des buffers typés bruts
+
+        Parameters
+        ----------
+        path : str
+            Le chemin du fichier à écrire
+        """
+        write_binary(self._series, path)
 
     def __str__(self) -> str:
         """
@@ -463,31 +1104,56 @@ class DataFrame:
             )
         return p
 
-    def __iter__(self) -> Any:
+    def __iter__(self) -> Iterator[Series]:
         """
-        Redéfinition de la méthode __iter__ permettant d'itérer sur chaque série composant un DataFrame
+        Redéfinition de la méthode __iter__ permettant d'itérer sur chaque série composant un DataFrame.
+        Chaque appel retourne un nouvel itérateur indépendant sur les Series stockées
+
         Returns
         -------
-        DataFrame
-            self (L'instance par laquelle la méthode a été appelée)
+        Iterator
+            Un itérateur sur les Series du DataFrame
         """
-        self.index = 0
-        return self
+        return iter(self._series)
 
-    def __next__(self) -> Any:
+    def itertuples(self, index: bool = True, name: str = "Row") -> Iterator[Tuple]:
         """
-        Redéfinition de la méthode __next__ permettant de passer à la série suivante d'un DataFrame
-        Raises
+        Itère sur les lignes du DataFrame sous forme de namedtuple, sans construire
+        de DataFrame ni de Serie par ligne
+
+        Parameters
+        ----------
+        index : bool
+            Si vrai, le numéro de la ligne est le premier champ du tuple
+        name : str
+            Le nom du namedtuple, un tuple simple étant retourné si None
+
+        Returns
         -------
-        StopIteration
-            Arrêt de la boucle lorsque l'index est supérieur au nombre d'éléments
+        Iterator
+            Un itérateur sur les lignes
         """
-        if self.index >= len(self.data.keys()):
-            raise StopIteration
-        else:
-            serie = self.iloc[:, self.index]
-            self.index += 1
-            return serie
+        columns = [iter(serie) for serie in self._series]
+        fields = (["Index"] if index else []) + self.colonnes
+        if index:
+            columns.insert(0, iter(range(len(self))))
+        if name is None:
+            return zip(*columns)
+        row = namedtuple(name, fields, rename=True)
+        return map(row._make, zip(*columns))
+
+    def iterrows(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Itère sur les lignes du DataFrame sous forme de couples (numéro de ligne, dictionnaire
+        colonne: valeur), sans construire de DataFrame ni de Serie par ligne
+
+        Returns
+        -------
+        Iterator
+            Un itérateur sur les lignes
+        """
+        for position, values in enumerate(self.itertuples(index=False, name=None)):
+            yield position, dict(zip(self.colonnes, values))
 
     def __len__(self) -> int:
         """
@@ -514,36 +1180,7 @@ class DataFrame:
         elif self.colonnes != other.colonnes:
             return False
         for self_serie, other_serie in zip(self, other):
-            if self_serie != other_serie:
+            if not self_serie.equals(other_serie):
                 return False
 
         return True
-
-
-def cast_into_most_reccurent_type(elements: List) -> List:
-    types = []
-    list_types = []
-    for element in elements:
-        if re.fullmatch(r"\d{1,2}-\d{1,2}-\d{4}", str(element)):
-            types.append(type(datetime.strptime(element, "%d-%m-%Y").date()))
-        else:
-            types.append(type(element))
-        occurences = dict(list(set(map(lambda x: (x, types.count(x)), types))))
-        type_max = None
-        for cle, valeur in occurences.items():
-            if valeur == max(list(occurences.values())):
-                type_max = cle
-        values = []
-        for index, el in enumerate(elements):
-            try:
-                if re.fullmatch(r"\d{1,2}-\d{1,2}-\d{4}", str(el)):
-                    values.append(datetime.strptime(el, "%d-%m-%Y").date())
-                elif el is None:
-                    values.append(None)
-                else:
-                    values.append(type_max.__new__(type_max, el))
-            except ValueError:
-                values.append(None)
-        elements.append(values)
-        list_types.append(types)
-        return values
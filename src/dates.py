@@ -0,0 +1,509 @@
+import logging
+import re
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+from src.strings import encode_strings
+
+logging.basicConfig(level=logging.INFO)
+
+# Formats reconnus et famille de type (date ou date avec heure) qu'ils produisent.
+# Le format ISO avec heure accepte un T ou une espace, des secondes et une fraction
+# de seconde facultatives et un Z final ; epoch est un nombre entier de secondes
+FORMAT_KINDS = {
+    "%Y-%m-%d": "D",
+    "%Y-%m-%d %H:%M:%S": "M",
+    "%d-%m-%Y": "D",
+    "epoch": "M",
+}
+# Formats essayés, dans l'ordre, pour détecter les dates d'une colonne de chaînes
+# (une colonne d'entiers n'est lue en epoch que sur demande)
+DETECTED_FORMATS = ("%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%d-%m-%Y")
+# Nombre de chaînes examinées pour détecter le format d'une colonne
+FORMAT_SAMPLE_SIZE = 100
+# Nombre de chaînes converties à la fois (matrice d'octets de taille bornée)
+PARSE_BLOCK_SIZE = 1 << 16
+
+UNIT_DTYPES = {"D": np.dtype("datetime64[D]"), "M": np.dtype("datetime64[us]")}
+# Durée de chaque unité de fréquence, en microsecondes
+FREQUENCY_UNITS = {
+    "us": 1,
+    "ms": 1000,
+    "s": 1000_000,
+    "min": 60_000_000,
+    "h": 3600_000_000,
+    "D": 86400_000_000,
+    "W": 7 * 86400_000_000,
+}
+# Fréquences calendaires (mois et années de durées variables)
+CALENDAR_UNITS = {"M": "datetime64[M]", "Y": "datetime64[Y]"}
+FREQUENCY_PATTERN = re.compile(r"(\d*)([a-zA-Z]+)")
+
+ZERO = ord("0")
+# Nombre de jours de chaque mois d'une année non bissextile (indexé par le mois)
+MONTH_LENGTHS = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+
+def _byte_matrix(data: np.ndarray, spans: np.ndarray, width: int) -> np.ndarray:
+    """
+    Retourne la matrice (chaînes, width) des premiers octets de chaque chaîne, complétée
+    par des zéros. Elle est rangée par colonnes : chaque position est lue d'un bloc
+    """
+    matrix = np.zeros((len(spans), width), dtype=np.uint8, order="F")
+    if not len(data):
+        return matrix
+    last = len(data) - 1
+    for column in range(min(width, int(spans["length"].max(initial=0)))):
+        matrix[:, column] = data[np.minimum(spans["start"] + column, last)]
+        matrix[spans["length"] <= column, column] = 0
+    return matrix
+
+
+def _number(matrix: np.ndarray, start: int, stop: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lit le nombre écrit dans les colonnes [start, stop) de la matrice d'octets
+
+    Returns
+    -------
+    tuple
+        Les nombres et le masque des lignes où tous ces octets sont des chiffres
+    """
+    value = np.zeros(len(matrix), dtype=np.int64)
+    valid = np.ones(len(matrix), dtype=bool)
+    for column in range(start, stop):
+        digit = matrix[:, column] - np.uint8(ZERO)
+        valid &= digit <= 9
+        value = value * 10 + digit
+    return value, valid
+
+
+def _days(
+    year: np.ndarray, month: np.ndarray, day: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convertit des années, mois et jours en nombres de jours depuis 1970-01-01 par
+    l'arithmétique entière du calendrier grégorien (années commençant en mars)
+
+    Returns
+    -------
+    tuple
+        Les jours et le masque des dates existantes
+    """
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    valid = (month >= 1) & (month <= 12) & (day >= 1)
+    lengths = MONTH_LENGTHS[np.clip(month, 1, 12)] + (leap & (month == 2))
+    valid &= day <= lengths
+    shifted = year - (month <= 2)
+    era = shifted // 400
+    year_of_era = shifted - era * 400
+    day_of_year = (153 * np.where(month > 2, month - 3, month + 9) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468, valid
+
+
+def _parse_iso_date(
+    matrix: np.ndarray, lengths: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convertit des dates ISO (année-mois-jour) en jours depuis l'epoch
+    """
+    year, valid_year = _number(matrix, 0, 4)
+    month, valid_month = _number(matrix, 5, 7)
+    day, valid_day = _number(matrix, 8, 10)
+    days, valid = _days(year, month, day)
+    valid &= valid_year & valid_month & valid_day & (lengths == 10)
+    valid &= (matrix[:, 4] == ord("-")) & (matrix[:, 7] == ord("-"))
+    return days, valid
+
+
+def _parse_iso(
+    matrix: np.ndarray, lengths: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convertit des dates ISO avec heure (facultative) en microsecondes depuis l'epoch
+    """
+    # Un Z final (UTC) est ignoré
+    last = matrix[np.arange(len(matrix)), np.maximum(lengths - 1, 0)]
+    lengths = np.where(last == ord("Z"), lengths - 1, lengths)
+    days, valid = _parse_iso_date(matrix, np.minimum(lengths, 10))
+    valid &= np.isin(lengths, (10, 16, 19)) | ((lengths >= 21) & (lengths <= 29))
+
+    timed = lengths > 10
+    hour, valid_hour = _number(matrix, 11, 13)
+    minute, valid_minute = _number(matrix, 14, 16)
+    valid &= ~timed | (
+        ((matrix[:, 10] == ord("T")) | (matrix[:, 10] == ord(" ")))
+        & valid_hour
+        & valid_minute
+        & (matrix[:, 13] == ord(":"))
+        & (hour < 24)
+        & (minute < 60)
+    )
+    seconds = lengths > 16
+    second, valid_second = _number(matrix, 17, 19)
+    valid &= ~seconds | ((matrix[:, 16] == ord(":")) & valid_second & (second < 60))
+    valid &= (lengths <= 19) | (matrix[:, 19] == ord("."))
+    # Jusqu'à 9 chiffres après la virgule, tronqués à la microseconde
+    micros = np.zeros(len(matrix), dtype=np.int64)
+    for column in range(20, 29):
+        present = lengths > column
+        digit = matrix[:, column] - np.uint8(ZERO)
+        valid &= ~present | (digit <= 9)
+        if column < 26:
+            micros = micros * 10 + np.where(present, digit, 0)
+
+    time = np.where(timed, hour * 3600 + minute * 60, 0) + np.where(seconds, second, 0)
+    return days * FREQUENCY_UNITS["D"] + time * 1000_000 + micros, valid
+
+
+def _parse_day_first(
+    matrix: np.ndarray, lengths: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convertit des dates jour-mois-année (jour et mois sur 1 ou 2 chiffres) en jours
+    depuis l'epoch, chaque disposition des séparateurs étant lue à positions fixes
+    """
+    year = np.zeros(len(matrix), dtype=np.int64)
+    month = np.zeros(len(matrix), dtype=np.int64)
+    day = np.zeros(len(matrix), dtype=np.int64)
+    valid = np.zeros(len(matrix), dtype=bool)
+    for first in (1, 2):
+        for second in (first + 2, first + 3):
+            layout = (
+                (matrix[:, first] == ord("-"))
+                & (matrix[:, second] == ord("-"))
+                & (lengths == second + 5)
+            )
+            if not layout.any():
+                continue
+            fields = []
+            for start, stop in (
+                (0, first),
+                (first + 1, second),
+                (second + 1, second + 5),
+            ):
+                value, digits = _number(matrix, start, stop)
+                layout &= digits
+                fields.append(value)
+            day = np.where(layout, fields[0], day)
+            month = np.where(layout, fields[1], month)
+            year = np.where(layout, fields[2], year)
+            valid |= layout
+    days, exists = _days(year, month, day)
+    return days, valid & exists
+
+
+def _parse_epoch(
+    matrix: np.ndarray, lengths: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convertit des nombres entiers de secondes (signe facultatif) en microsecondes
+    """
+    negative = matrix[:, 0] == ord("-")
+    seconds = np.zeros(len(matrix), dtype=np.int64)
+    valid = lengths > negative
+    for column in range(matrix.shape[1]):
+        present = (lengths > column) & ((column > 0) | ~negative)
+        digit = matrix[:, column] - np.uint8(ZERO)
+        valid &= ~present | (digit <= 9)
+        seconds = np.where(present, seconds * 10 + digit, seconds)
+    return np.where(negative, -seconds, seconds) * 1000_000, valid
+
+
+# Analyseur, largeur de la matrice d'octets et unité de chaque format
+PARSERS = {
+    "%Y-%m-%d": (_parse_iso_date, 11, "D"),
+    "%Y-%m-%d %H:%M:%S": (_parse_iso, 30, "us"),
+    "%d-%m-%Y": (_parse_day_first, 11, "D"),
+    "epoch": (_parse_epoch, 13, "us"),
+}
+
+
+def parse_buffer(data: np.ndarray, spans: np.ndarray, date_format: str) -> np.ndarray:
+    """
+    Convertit des chaînes encodées dans un buffer UTF-8 (voir `encode_strings`) en dates,
+    par blocs de `PARSE_BLOCK_SIZE` chaînes lues comme une matrice d'octets : chaque
+    champ du format est lu à position fixe par des opérations vectorisées
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Le buffer d'octets
+    spans : np.ndarray
+        Les positions (début, taille) des chaînes
+    date_format : str
+        Le format des chaînes (voir `FORMAT_KINDS`)
+
+    Returns
+    -------
+    np.ndarray
+        Les dates (datetime64[D] ou datetime64[us] selon le format), NaT pour une
+        chaîne invalide
+    """
+    parser, width, unit = PARSERS[date_format]
+    dtype = UNIT_DTYPES[FORMAT_KINDS[date_format]]
+    result = np.empty(len(spans), dtype=dtype)
+    for start in range(0, len(spans), PARSE_BLOCK_SIZE):
+        block = spans[start : start + PARSE_BLOCK_SIZE]
+        # Une chaîne plus longue que le format est invalide
+        matrix = _byte_matrix(data, block, width)
+        values, valid = parser(matrix, block["length"])
+        valid &= block["length"] < width
+        dates = values.astype(f"datetime64[{unit}]").astype(dtype)
+        dates[~valid] = np.datetime64("NaT")
+        result[start : start + PARSE_BLOCK_SIZE] = dates
+    return result
+
+
+def parse_dates(strings: List[str], date_format: str = None) -> np.ndarray:
+    """
+    Convertit en bloc des chaînes de caractères en dates, leur format étant détecté
+    sur un échantillon s'il n'est pas précisé (voir `detect_format`)
+
+    Parameters
+    ----------
+    strings : list:
+        Les chaînes de caractères à convertir
+    date_format : str
+        Le format des chaînes (voir `FORMAT_KINDS`)
+
+    Returns
+    -------
+    np.ndarray
+        Le tableau de dates, NaT pour une chaîne invalide (ou pour toutes si aucun
+        format n'est reconnu)
+    """
+    if date_format is None:
+        date_format = detect_format(strings, complete=False) or DETECTED_FORMATS[-1]
+    data, spans = encode_strings(strings)
+    return parse_buffer(data, spans, date_format)
+
+
+def detect_format(
+    strings: List[str],
+    formats: Tuple[str, ...] = DETECTED_FORMATS,
+    complete: bool = True,
+) -> Optional[str]:
+    """
+    Détecte le format de dates d'une colonne : le premier format qui convertit toutes
+    les chaînes d'un échantillon est retenu. Le résultat est destiné à être conservé
+    pour toute la colonne, le format n'étant ainsi pas recherché pour chaque valeur
+
+    Parameters
+    ----------
+    strings : list:
+        Les chaînes de caractères (les autres valeurs sont ignorées)
+    formats : tuple:
+        Les formats essayés, dans l'ordre
+    complete : bool
+        Si faux, le format qui convertit le plus de chaînes de l'échantillon est retenu
+        à défaut d'un format qui les convertit toutes
+
+    Returns
+    -------
+    str
+        Le format détecté, None si aucun format ne convient
+    """
+    sample = []
+    for string in strings:
+        if isinstance(string, str):
+            sample.append(string)
+            if len(sample) == FORMAT_SAMPLE_SIZE:
+                break
+    if not sample:
+        return None
+    data, spans = encode_strings(sample)
+    parsed = {}
+    for date_format in formats:
+        parsed[date_format] = np.count_nonzero(
+            ~np.isnat(parse_buffer(data, spans, date_format))
+        )
+        if parsed[date_format] == len(sample):
+            return date_format
+    best = max(parsed, key=parsed.get)
+    return best if not complete and parsed[best] else None
+
+
+def parse_frequency(frequency: str) -> Tuple[int, str]:
+    """
+    Décompose une fréquence (1h, 15min, 1D, 1M...) en un multiple et une unité
+    (us, ms, s, min, h, D, W, M ou Y)
+
+    Raises
+    ------
+    ValueError
+        Fréquence non conforme
+    """
+    match = FREQUENCY_PATTERN.fullmatch(str(frequency))
+    units = (*FREQUENCY_UNITS, *CALENDAR_UNITS)
+    if match is None or match.group(2) not in units or match.group(1) == "0":
+        logging.exception(
+            f"Fréquence attendue : un entier suivi de {', '.join(units)}. "
+            f"Reçu : {frequency}"
+        )
+        raise ValueError
+    return int(match.group(1) or 1), match.group(2)
+
+
+def bucket_ids(values: np.ndarray, frequency: str) -> np.ndarray:
+    """
+    Calcule en un passage le numéro de période de chaque date : division entière de sa
+    représentation entière par la durée de la période pour une fréquence fixe (périodes
+    comptées depuis 1970-01-01), du nombre de mois ou d'années pour une fréquence calendaire
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Les dates (datetime64)
+    frequency : str
+        La fréquence (voir `parse_frequency`)
+
+    Returns
+    -------
+    np.ndarray
+        Les numéros de période (int64), quelconques pour NaT
+
+    Raises
+    ------
+    ValueError
+        Fréquence non conforme
+    """
+    multiple, unit = parse_frequency(frequency)
+    if unit in CALENDAR_UNITS:
+        periods = values.astype(CALENDAR_UNITS[unit]).view(np.int64)
+    else:
+        periods = values.astype("datetime64[us]", copy=False).view(np.int64)
+        multiple *= FREQUENCY_UNITS[unit]
+    return periods // multiple
+
+
+def bucket_starts(ids: np.ndarray, frequency: str, dtype: np.dtype) -> np.ndarray:
+    """
+    Retourne le début des périodes numérotées par `bucket_ids`, dans le type donné
+    """
+    multiple, unit = parse_frequency(frequency)
+    if unit in CALENDAR_UNITS:
+        return (ids * multiple).astype(CALENDAR_UNITS[unit]).astype(dtype)
+    step = multiple * FREQUENCY_UNITS[unit]
+    return (ids * step).astype("datetime64[us]").astype(dtype)
+
+
+def floor_dates(values: np.ndarray, frequency: str) -> np.ndarray:
+    """
+    Arrondit des dates au début de leur période (voir `bucket_ids`)
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Les dates (datetime64)
+    frequency : str
+        La fréquence (voir `parse_frequency`)
+
+    Returns
+    -------
+    np.ndarray
+        Les dates arrondies, de même type
+    """
+    return bucket_starts(bucket_ids(values, frequency), frequency, values.dtype)
+
+
+class DatetimeMethods:
+    """
+    Accesseur `.dt` des opérations vectorisées sur une Serie de dates, calculées
+    sur la représentation entière (datetime64) des dates
+    """
+
+    def __init__(self, serie: Any) -> None:
+        """
+        Fonction __init__ permettant de créer l'accesseur d'une Serie
+
+        Parameters
+        ----------
+        serie : Series
+            La Serie de dates
+
+        Raises
+        ------
+        TypeError
+            La Serie ne contient pas des dates
+        """
+        if serie.dtype.kind != "M":
+            logging.exception(f"Serie de dates attendue. Type reçu : {serie.dtype}")
+            raise TypeError
+        self._serie = serie
+
+    def _series(self, values: np.ndarray) -> Any:
+        """
+        Construit la Serie résultat, de même nom et de mêmes valeurs manquantes
+        """
+        return type(self._serie)(
+            data=values,
+            name=self._serie.name,
+            dtype=values.dtype,
+            mask=self._serie._mask,
+        )
+
+    @property
+    def year(self) -> Any:
+        """
+        Propriété retournant l'année de chaque date (int64)
+        """
+        years = self._serie.values.astype("datetime64[Y]").astype(np.int64)
+        return self._series(years + 1970)
+
+    @property
+    def month(self) -> Any:
+        """
+        Propriété retournant le mois (1 à 12) de chaque date (int64)
+        """
+        months = self._serie.values.astype("datetime64[M]").astype(np.int64)
+        return self._series(months % 12 + 1)
+
+    @property
+    def day(self) -> Any:
+        """
+        Propriété retournant le jour du mois (1 à 31) de chaque date (int64)
+        """
+        values = self._serie.values
+        days = values.astype("datetime64[D]") - values.astype("datetime64[M]")
+        return self._series(days.astype(np.int64) + 1)
+
+    @property
+    def hour(self) -> Any:
+        """
+        Propriété retournant l'heure (0 à 23) de chaque date (int64)
+        """
+        hours = self._serie.values.astype("datetime64[h]").astype(np.int64)
+        return self._series(hours % 24)
+
+    def floor(self, frequency: str) -> Any:
+        """
+        Arrondit chaque date au début de sa période (voir `floor_dates`)
+
+        Parameters
+        ----------
+        frequency : str
+            La fréquence : un entier suivi de us, ms, s, min, h, D, W (durées fixes
+            comptées depuis 1970-01-01) ou de M, Y (mois et années)
+
+        Returns
+        -------
+        Series
+            Les dates arrondies
+
+        Raises
+        ------
+        ValueError
+            Fréquence non conforme
+        """
+        return self._series(floor_dates(self._serie.values, frequency))
+
+    def truncate(self, frequency: str) -> Any:
+        """
+        Synonyme de `floor`
+        """
+        return self.floor(frequency)
@@ -0,0 +1,197 @@
+from functools import partial
+import logging
+from typing import Any
+from typing import Dict
+from typing import List
+
+import numpy as np
+
+from src.executor import parallel_map
+from src.series import _to_python
+from src.series import merge_moments
+from src.series import Series
+
+logging.basicConfig(level=logging.INFO)
+
+# Nombre de valeurs traitées à la fois : chaque bloc reste en cache pendant le calcul
+# de toutes les statistiques
+DESCRIBE_BLOCK_SIZE = 65536
+# Statistiques disponibles dans DataFrame.agg (en plus des quantiles "25%", "90%"...)
+STATISTICS = ("count", "null_count", "sum", "min", "max", "mean", "std", "median")
+NUMERIC_KINDS = ("b", "i", "f")
+
+
+def parse_percentile(name: str) -> float:
+    """
+    Convertit un nom de quantile ("25%") en fraction (0.25)
+
+    Raises
+    ------
+    ValueError
+        Nom de statistique inconnu
+    """
+    if name == "median":
+        return 0.5
+    try:
+        fraction = float(name[:-1]) / 100 if name.endswith("%") else None
+    except ValueError:
+        fraction = None
+    if fraction is None or not 0 <= fraction <= 1:
+        logging.exception(
+            f"Statistique attendue : {' ou '.join(STATISTICS)} ou un quantile (25%). "
+            f"Reçu : {name}"
+        )
+        raise ValueError
+    return fraction
+
+
+def percentile_name(fraction: float) -> str:
+    """
+    Retourne le nom d'un quantile ("25%") à partir de sa fraction (0.25)
+    """
+    return f"{fraction * 100:g}%"
+
+
+def describe_serie(serie: Series, quantiles: Dict[str, float]) -> Dict[str, Any]:
+    """
+    Calcule en un seul passage sur une Serie numérique l'effectif, le nombre de valeurs
+    manquantes, le minimum, le maximum, la somme, la moyenne, l'écart-type et des quantiles.
+    Le buffer est parcouru par blocs, toutes les statistiques d'un bloc étant calculées
+    pendant qu'il est en cache, puis les moments des blocs sont fusionnés
+    (voir `merge_moments`).
+    Les quantiles sont exacts, obtenus par sélection partielle (en O(n)) des valeurs
+    présentes (voir `Series.quantile`). Les autres résultats alimentent le cache de
+    statistiques
+
+    Parameters
+    ----------
+    serie : Series
+        La Serie numérique décrite
+    quantiles : dict:
+        Les fractions des quantiles à calculer, par nom de statistique
+
+    Returns
+    -------
+    dict
+        Les statistiques par nom
+    """
+
+    def compute() -> Dict[str, Any]:
+        values = serie.values
+        mask = serie._mask
+        integer = values.dtype.kind != "f"
+        moments = (0, 0, 0.0)
+        minimum = maximum = None
+        for start in range(0, len(values), DESCRIBE_BLOCK_SIZE):
+            block = values[start : start + DESCRIBE_BLOCK_SIZE]
+            if mask is not None:
+                block = block[mask[start : start + DESCRIBE_BLOCK_SIZE]]
+            if len(block) == 0:
+                continue
+            if values.dtype.kind == "b":
+                block = block.astype(np.int64)
+            block_sum = _to_python(block.sum(dtype=np.int64 if integer else np.float64))
+            deviations = block - block_sum / len(block)
+            block_m2 = float(np.dot(deviations, deviations))
+            moments = merge_moments(moments, (len(block), block_sum, block_m2))
+            block_min, block_max = block.min(), block.max()
+            minimum = block_min if minimum is None else min(minimum, block_min)
+            maximum = block_max if maximum is None else max(maximum, block_max)
+
+        present, total, m2 = moments
+        statistics = {"count": present, "null_count": len(values) - present}
+        statistics["sum"] = total
+        statistics["min"] = _to_python(minimum)
+        statistics["max"] = _to_python(maximum)
+        if values.dtype.kind == "b" and present:
+            statistics["min"], statistics["max"] = bool(minimum), bool(maximum)
+        statistics["mean"] = total / present if present else None
+        statistics["m2"] = m2
+        return statistics
+
+    statistics = dict(serie._statistic("describe", compute))
+    # Les statistiques calculées servent aussi aux réductions de la Serie
+    if statistics["count"]:
+        serie._statistic("null_count", lambda: statistics["null_count"])
+        serie._statistic("min", lambda: statistics["min"])
+        serie._statistic("max", lambda: statistics["max"])
+        serie._statistic(
+            "moments",
+            lambda: {
+                "sum": statistics["sum"],
+                "mean": statistics["mean"],
+                "m2": statistics["m2"],
+            },
+        )
+
+    present = statistics["count"]
+    statistics["std"] = float(np.sqrt(statistics["m2"] / present)) if present else None
+    del statistics["m2"]
+    if quantiles:
+        values = serie.quantile(list(quantiles.values()))
+        statistics.update(zip(quantiles, values))
+    if not present:
+        statistics["sum"] = 0
+    return statistics
+
+
+def _statistics_of(serie: Series, statistics: List[str]) -> List[Any]:
+    """
+    Calcule les statistiques demandées pour une colonne. Une colonne non numérique
+    n'a que l'effectif, le nombre de valeurs manquantes, le minimum et le maximum
+    """
+    if serie.dtype.kind in NUMERIC_KINDS:
+        quantiles = {
+            statistic: parse_percentile(statistic)
+            for statistic in statistics
+            if statistic not in STATISTICS or statistic == "median"
+        }
+        described = describe_serie(serie, quantiles)
+        return [described[statistic] for statistic in statistics]
+
+    values = []
+    for statistic in statistics:
+        if statistic == "count":
+            values.append(len(serie) - serie.null_count())
+        elif statistic == "null_count":
+            values.append(serie.null_count())
+        elif statistic in ("min", "max"):
+            try:
+                values.append(getattr(serie, statistic)())
+            except TypeError:
+                values.append(None)
+        else:
+            values.append(None)
+    return values
+
+
+def describe_columns(series: List[Series], statistics: List[str]) -> List[List[Any]]:
+    """
+    Calcule les statistiques demandées pour chaque colonne, les colonnes étant réparties
+    par l'exécuteur configuré avec `set_options`
+
+    Parameters
+    ----------
+    series : list:
+        Les colonnes décrites
+    statistics : list:
+        Les noms des statistiques (quantiles compris), dans l'ordre des lignes du résultat
+
+    Returns
+    -------
+    list
+        Pour chaque colonne, la liste des valeurs des statistiques
+
+    Raises
+    ------
+    ValueError
+        Nom de statistique inconnu
+    """
+    for statistic in statistics:
+        if statistic not in STATISTICS:
+            parse_percentile(statistic)
+    return parallel_map(
+        partial(_statistics_of, statistics=statistics),
+        series,
+        size=sum(len(serie) for serie in series),
+    )
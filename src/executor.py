@@ -0,0 +1,262 @@
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import math
+import os
+import re
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+from typing import Union
+
+logging.basicConfig(level=logging.INFO)
+
+EXECUTORS = ("serial", "thread", "process")
+# Nombre total de valeurs en deçà duquel le travail par colonne reste séquentiel,
+# le coût de répartition dépassant alors le gain
+PARALLEL_MIN_SIZE = 1 << 16
+# Taille des morceaux d'une colonne réduits en parallèle avant d'être combinés
+REDUCTION_CHUNK_SIZE = 1 << 20
+# Unités acceptées pour le budget mémoire (puissances de 1024)
+MEMORY_UNITS = {"B": 1, "KB": 1 << 10, "MB": 1 << 20, "GB": 1 << 30, "TB": 1 << 40}
+MEMORY_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?B)?\s*$", re.IGNORECASE)
+
+_options = {
+    "num_threads": os.cpu_count() or 1,
+    "executor": "thread",
+    "memory_limit": None,
+}
+_pools = {}
+# Nombre d'appels utilisant chaque pool : un pool remplacé par `set_options` pendant
+# son usage est arrêté par le dernier appel qui l'utilise
+_users: Dict[Executor, int] = {}
+_pools_lock = threading.Lock()
+# Marque les threads des pools : le travail soumis depuis l'un d'eux reste séquentiel,
+# un worker attendant des tâches du pool qu'il occupe pouvant sinon le bloquer
+_local = threading.local()
+
+
+def parse_memory(size: Union[int, str]) -> int:
+    """
+    Convertit une taille mémoire ("4GB", "512 MB", 1024) en nombre d'octets
+
+    Raises
+    ------
+    ValueError
+        Taille non conforme
+    """
+    if isinstance(size, int) and not isinstance(size, bool) and size >= 0:
+        return size
+    match = MEMORY_PATTERN.match(size) if isinstance(size, str) else None
+    if match is None:
+        logging.exception(
+            f"Taille attendue : entier ou nombre suivi de {', '.join(MEMORY_UNITS)}. "
+            f"Reçu : {size}"
+        )
+        raise ValueError
+    unit = MEMORY_UNITS[(match.group(2) or "B").upper()]
+    return math.floor(float(match.group(1)) * unit)
+
+
+def set_options(
+    num_threads: int = None,
+    executor: str = None,
+    memory_limit: Union[int, str] = None,
+) -> None:
+    """
+    Configure l'exécution parallèle utilisée par MyBear pour le travail indépendant
+    par colonne (réductions, résumés, construction des DataFrames) et par morceau
+    d'une même colonne (réductions en arbre), ainsi que le budget mémoire au-delà
+    duquel groupby et join traitent leurs données par partitions écrites sur disque
+
+    Parameters
+    ----------
+    num_threads : int
+        Le nombre de threads ou de processus `nombre de coeurs par défaut`, 1 rendant
+        l'exécution séquentielle
+    executor : str
+        Le type d'exécuteur (serial, thread ou process) `thread par défaut`. Les morceaux
+        d'une colonne sont toujours réduits par des threads, les réductions numpy libérant
+        le GIL sans copie des données
+    memory_limit : int | str
+        Le budget mémoire, en octets ou suivi d'une unité ("4GB"), 0 supprimant
+        la limite `aucune limite par défaut`
+
+    Raises
+    ------
+    ValueError
+        Nombre de threads, type d'exécuteur ou budget mémoire non conforme
+    """
+    if num_threads is not None and (
+        not isinstance(num_threads, int) or num_threads < 1
+    ):
+        logging.exception(
+            f"Nombre de threads attendu : entier positif. Reçu : {num_threads}"
+        )
+        raise ValueError
+    if executor is not None and executor not in EXECUTORS:
+        logging.exception(
+            f"Exécuteur attendu : {' ou '.join(EXECUTORS)}. Reçu : {executor}"
+        )
+        raise ValueError
+    if memory_limit is not None:
+        _options["memory_limit"] = parse_memory(memory_limit) or None
+    if num_threads is None and executor is None:
+        return
+    with _pools_lock:
+        if num_threads is not None:
+            _options["num_threads"] = num_threads
+        if executor is not None:
+            _options["executor"] = executor
+        # Les pools existants ne correspondent plus à la configuration : ils sont
+        # remplacés au prochain usage, ceux qui ne sont pas utilisés étant arrêtés
+        # immédiatement et les autres une fois leur travail achevé (voir `_map`)
+        for pool in _pools.values():
+            if pool not in _users:
+                pool.shutdown(wait=False)
+        _pools.clear()
+
+
+def get_option(name: str) -> Any:
+    """
+    Retourne la valeur d'une option d'exécution (num_threads, executor ou memory_limit)
+    """
+    return _options[name]
+
+
+def _mark_worker() -> None:
+    """
+    Initialise un thread de pool
+    """
+    _local.worker = True
+
+
+def _sequential(count: int) -> bool:
+    """
+    Indique si `count` tâches indépendantes doivent être exécutées séquentiellement
+    """
+    return (
+        count <= 1
+        or _options["executor"] == "serial"
+        or _options["num_threads"] <= 1
+        or getattr(_local, "worker", False)
+    )
+
+
+def _pool(kind: str) -> Executor:
+    """
+    Retourne le pool de threads ou de processus partagé, créé au premier usage
+    (appelé sous `_pools_lock`)
+    """
+    if kind not in _pools:
+        if kind == "thread":
+            _pools[kind] = ThreadPoolExecutor(
+                max_workers=_options["num_threads"], initializer=_mark_worker
+            )
+        else:
+            _pools[kind] = ProcessPoolExecutor(max_workers=_options["num_threads"])
+    return _pools[kind]
+
+
+def _map(
+    kind: str, function: Callable[..., Any], *iterables: Iterable[Any]
+) -> List[Any]:
+    """
+    Applique une fonction aux éléments avec le pool partagé de threads ou de processus.
+    Le pool reste utilisable jusqu'à la fin de l'appel même si `set_options` le remplace
+    entre-temps, puis il est arrêté par le dernier appel qui l'utilisait
+    """
+    with _pools_lock:
+        pool = _pool(kind)
+        _users[pool] = _users.get(pool, 0) + 1
+    try:
+        return list(pool.map(function, *iterables))
+    finally:
+        with _pools_lock:
+            _users[pool] -= 1
+            idle = not _users[pool]
+            if idle:
+                del _users[pool]
+            retired = idle and _pools.get(kind) is not pool
+        if retired:
+            pool.shutdown(wait=False)
+
+
+def parallel_map(
+    function: Callable[..., Any], *iterables: Iterable[Any], size: int = None
+) -> List[Any]:
+    """
+    Applique une fonction à des éléments indépendants (typiquement les colonnes d'un
+    DataFrame) avec l'exécuteur configuré par `set_options`, en conservant l'ordre.
+    Avec l'exécuteur process, la fonction et les éléments doivent être sérialisables
+    et les modifications faites aux éléments ne sont pas répercutées
+
+    Parameters
+    ----------
+    function : Callable
+        La fonction appliquée à chaque élément
+    iterables : Iterable
+        Les éléments, plusieurs itérables fournissant plusieurs arguments comme `map`
+    size : int
+        Le nombre total de valeurs traitées, le travail restant séquentiel en deçà
+        de `PARALLEL_MIN_SIZE`
+
+    Returns
+    -------
+    list
+        Les résultats, dans l'ordre des éléments
+    """
+    arguments = list(zip(*iterables))
+    if _sequential(len(arguments)) or (size is not None and size < PARALLEL_MIN_SIZE):
+        return [function(*argument) for argument in arguments]
+    return _map(_options["executor"], function, *zip(*arguments))
+
+
+def chunk_bounds(length: int) -> List[Tuple[int, int]]:
+    """
+    Découpe les positions d'une colonne en morceaux de `REDUCTION_CHUNK_SIZE` valeurs
+    """
+    return [
+        (start, min(length, start + REDUCTION_CHUNK_SIZE))
+        for start in range(0, length, REDUCTION_CHUNK_SIZE)
+    ]
+
+
+def tree_reduce(
+    reduce_chunk: Callable[[int, int], Any],
+    combine: Callable[[Any, Any], Any],
+    length: int,
+) -> Any:
+    """
+    Réduit une colonne par morceaux réduits en parallèle par des threads, puis combine
+    les résultats partiels deux à deux (réduction en arbre)
+
+    Parameters
+    ----------
+    reduce_chunk : Callable
+        Réduit les positions [début, fin) de la colonne en un résultat partiel
+    combine : Callable
+        Combine deux résultats partiels
+    length : int
+        La taille de la colonne
+
+    Returns
+    -------
+    Any
+        Le résultat de la réduction de toute la colonne
+    """
+    bounds = chunk_bounds(length)
+    if _sequential(len(bounds)):
+        return reduce_chunk(0, length)
+    partials = _map("thread", lambda bound: reduce_chunk(*bound), bounds)
+    while len(partials) > 1:
+        paired = [
+            combine(left, right) for left, right in zip(partials[::2], partials[1::2])
+        ]
+        partials = paired + partials[len(paired) * 2 :]
+    return partials[0]
@@ -0,0 +1,350 @@
+import logging
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from src.series import Series
+from src.sketches import group_cardinalities
+from src.sketches import GROUP_HLL_PRECISION
+from src.sketches import hash_values
+
+logging.basicConfig(level=logging.INFO)
+
+AGGREGATIONS = (
+    "sum",
+    "mean",
+    "min",
+    "max",
+    "count",
+    "std",
+    "first",
+    "last",
+    "approx_nunique",
+)
+
+# Étendue maximale des identifiants entiers, rapportée au nombre de lignes, pour que
+# leurs groupes soient adressés directement plutôt que triés
+DENSE_RANGE_FACTOR = 4
+
+# Fonctions usuelles remplacées par leur agrégation vectorisée équivalente
+CALLABLE_AGGREGATIONS = {
+    sum: "sum",
+    min: "min",
+    max: "max",
+    len: "count",
+    np.sum: "sum",
+    np.mean: "mean",
+    np.min: "min",
+    np.max: "max",
+    np.std: "std",
+}
+
+
+def factorize(serie: Series) -> Tuple[np.ndarray, int]:
+    """
+    Associe à chaque valeur d'une Serie un code entier de groupe, les codes étant
+    attribués dans l'ordre de première apparition. Les valeurs manquantes reçoivent le code -1.
+    Une Serie catégorielle est encodée à partir de ses codes, sans hachage de ses valeurs
+
+    Parameters
+    ----------
+    serie : Series
+        La Serie à encoder
+
+    Returns
+    -------
+    tuple
+        Les codes de chaque ligne et le nombre de valeurs distinctes
+    """
+    valid = serie._validity()
+    codes = np.full(len(serie), -1, dtype=np.int64)
+    if serie.categories is not None:
+        # Les codes d'une Serie catégorielle sont renumérotés par ordre d'apparition
+        present = np.flatnonzero(valid)
+        first = np.full(len(serie.categories), len(serie), dtype=np.int64)
+        np.minimum.at(first, serie.codes[present], present)
+        used = np.flatnonzero(first < len(serie))
+        order = used[np.argsort(first[used])]
+        rank = np.full(len(serie.categories), -1, dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        codes[present] = rank[serie.codes[present]]
+        return codes, len(order)
+
+    values = serie.values
+    if values.dtype == object:
+        # Table de hachage Python pour les valeurs non ordonnables entre elles
+        table = {}
+        present = np.flatnonzero(valid)
+        codes[present] = [
+            table.setdefault(v, len(table)) for v in values[present].tolist()
+        ]
+        return codes, len(table)
+
+    present = values[valid]
+    _, first_index, inverse = np.unique(present, return_index=True, return_inverse=True)
+    order = np.argsort(first_index, kind="stable")
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    codes[valid] = rank[inverse.ravel()]
+    return codes, len(order)
+
+
+def sorted_group_codes(keys: List[Series]) -> Tuple[np.ndarray, int]:
+    """
+    Calcule les codes de groupe de clés dont les lignes sont triées : les lignes égales
+    étant contiguës, un nouveau groupe commence à chaque changement de valeur d'une clé
+    entre deux lignes consécutives, sans hachage. Les groupes sont ainsi numérotés dans
+    l'ordre de première apparition, comme par `factorize`, quels que soient le sens du
+    tri et l'ordre des clés. Une ligne dont l'une des clés est manquante n'appartient à
+    aucun groupe (code -1)
+
+    Parameters
+    ----------
+    keys : list:
+        Les Series clés, triées ensemble
+
+    Returns
+    -------
+    tuple
+        Les codes de groupe de chaque ligne et le nombre de groupes
+    """
+    valid = np.ones(len(keys[0]), dtype=bool)
+    for key in keys:
+        valid &= key._validity()
+    rows = np.flatnonzero(valid)
+    starts = np.zeros(len(rows), dtype=bool)
+    starts[:1] = True
+    for key in keys:
+        values = key.values[rows]
+        changes = values[1:] != values[:-1]
+        if values.dtype.kind == "f":
+            # Des NaN consécutifs forment un même groupe, comme par `factorize`
+            changes &= ~(np.isnan(values[1:]) & np.isnan(values[:-1]))
+        starts[1:] |= changes
+    codes = np.full(len(valid), -1, dtype=np.int64)
+    codes[rows] = np.cumsum(starts) - 1
+    return codes, int(np.count_nonzero(starts))
+
+
+def group_codes(keys: List[Series], presorted: bool = False) -> Tuple[np.ndarray, int]:
+    """
+    Calcule les codes de groupe pour une ou plusieurs colonnes clés. Une ligne dont
+    l'une des clés est manquante n'appartient à aucun groupe (code -1)
+
+    Parameters
+    ----------
+    keys : list:
+        Les Series clés
+    presorted : bool
+        Les lignes sont triées selon les clés (voir `sorted_group_codes`)
+
+    Returns
+    -------
+    tuple
+        Les codes de groupe de chaque ligne et le nombre de groupes
+    """
+    if presorted:
+        return sorted_group_codes(keys)
+    codes, ngroups = factorize(keys[0])
+    for key in keys[1:]:
+        key_codes, key_ngroups = factorize(key)
+        missing = (codes < 0) | (key_codes < 0)
+        combined = codes * key_ngroups + key_codes
+        combined[missing] = -1
+        codes, ngroups = factorize(Series(data=combined, mask=~missing))
+    return codes, ngroups
+
+
+def integer_group_codes(
+    ids: np.ndarray, valid: Optional[np.ndarray], presorted: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcule les codes de groupe d'identifiants entiers (numéros de période...), les groupes
+    étant numérotés dans l'ordre croissant des identifiants et sans hachage : par les
+    changements de valeur entre lignes consécutives si les lignes sont triées, par
+    adressage direct (comptage) si les identifiants sont peu dispersés, par un tri sinon
+
+    Parameters
+    ----------
+    ids : np.ndarray
+        Les identifiants (int64) de chaque ligne
+    valid : np.ndarray
+        Le masque des lignes à grouper, None pour toutes
+    presorted : bool
+        Les lignes sont triées selon les identifiants, qui sont alors groupés par leurs
+        changements de valeur s'ils sont croissants
+
+    Returns
+    -------
+    tuple
+        Les codes de groupe de chaque ligne (-1 hors des groupes) et l'identifiant
+        de chaque groupe
+    """
+    codes = np.full(len(ids), -1, dtype=np.int64)
+    present = ids if valid is None else ids[valid]
+    if not len(present):
+        return codes, present
+    low, high = int(present.min()), int(present.max())
+    if presorted:
+        starts = np.empty(len(present), dtype=bool)
+        starts[0] = True
+        np.not_equal(present[1:], present[:-1], out=starts[1:])
+        keys = present[starts]
+        # Des lignes triées par ordre décroissant gardent la numérotation croissante
+        presorted = bool(np.all(keys[1:] > keys[:-1]))
+    if presorted:
+        group = np.cumsum(starts) - 1
+    elif high - low < DENSE_RANGE_FACTOR * len(present):
+        offsets = present - low
+        used = np.bincount(offsets, minlength=high - low + 1) > 0
+        group = (np.cumsum(used) - 1)[offsets]
+        keys = np.flatnonzero(used) + low
+    else:
+        keys, group = np.unique(present, return_inverse=True)
+        group = group.ravel()
+    if valid is None:
+        return group.astype(np.int64, copy=False), keys
+    codes[valid] = group
+    return codes, keys
+
+
+def first_rows(codes: np.ndarray, ngroups: int) -> np.ndarray:
+    """
+    Retourne la position de la première ligne de chaque groupe
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Les codes de groupe de chaque ligne
+    ngroups : int
+        Le nombre de groupes
+
+    Returns
+    -------
+    np.ndarray
+        La position de la première ligne de chaque groupe
+    """
+    rows = np.full(ngroups, len(codes), dtype=np.int64)
+    grouped = codes >= 0
+    np.minimum.at(rows, codes[grouped], np.flatnonzero(grouped))
+    return rows
+
+
+def aggregate(
+    serie: Series,
+    codes: np.ndarray,
+    ngroups: int,
+    how: Union[str, Callable[[List[Any]], Any]],
+    name: str = None,
+) -> Series:
+    """
+    Agrège les valeurs d'une Serie par groupe en un seul passage vectorisé sur les codes.
+    Les valeurs manquantes sont ignorées et une fonction quelconque est appelée
+    sur la liste des valeurs de chaque groupe
+
+    Parameters
+    ----------
+    serie : Series
+        La Serie à agréger
+    codes : np.ndarray
+        Les codes de groupe de chaque ligne
+    ngroups : int
+        Le nombre de groupes
+    how : str | Callable
+        Le nom de l'agrégation (sum, mean, min, max, count, std, first, last,
+        approx_nunique) ou une fonction
+    name : str
+        Le nom de la Serie résultat (celui de la Serie agrégée par défaut)
+
+    Returns
+    -------
+    Series
+        Une Serie contenant une valeur par groupe
+
+    Raises
+    ------
+    ValueError
+        Agrégation inconnue
+    TypeError
+        Somme, moyenne ou écart-type d'une colonne non numérique
+    """
+    name = name if name is not None else serie.name
+    how = CALLABLE_AGGREGATIONS.get(how, how) if callable(how) else how
+    selected = (codes >= 0) & serie._validity()
+    group = codes[selected]
+    values = serie.values[selected]
+    counts = np.bincount(group, minlength=ngroups)
+
+    if callable(how):
+        if ngroups == 0:
+            return Series(data=[], name=name)
+        order = np.argsort(group, kind="stable")
+        boundaries = np.cumsum(counts)[:-1]
+        chunks = np.split(values[order], boundaries)
+        return Series(data=[how(chunk.tolist()) for chunk in chunks], name=name)
+
+    if how not in AGGREGATIONS:
+        logging.exception(
+            f"Agrégation attendue : {' ou '.join(AGGREGATIONS)}. Reçu : {how}"
+        )
+        raise ValueError
+
+    if how == "count":
+        return Series(data=counts, name=name)
+
+    if how == "approx_nunique":
+        # Un HyperLogLog par groupe, les hachages des valeurs présentes étant restreints
+        # aux lignes groupées
+        hashes = hash_values(serie)[(codes >= 0)[serie._validity()]]
+        estimates = group_cardinalities(hashes, group, ngroups, GROUP_HLL_PRECISION)
+        return Series(data=np.rint(estimates).astype(np.int64), name=name)
+
+    non_empty = counts > 0
+    mask = None if non_empty.all() else non_empty
+
+    if how in ("first", "last", "min", "max"):
+        positions = np.flatnonzero(selected)
+        if how == "last":
+            rows = np.full(ngroups, -1, dtype=np.int64)
+            np.maximum.at(rows, group, positions)
+        else:
+            rows = np.full(ngroups, len(serie.values), dtype=np.int64)
+            np.minimum.at(rows, group, positions)
+        rows[~non_empty] = 0
+        result = serie.values[rows] if len(serie.values) else np.empty(0, serie.dtype)
+        if how in ("min", "max"):
+            result = result.copy()
+            ufunc = np.minimum if how == "min" else np.maximum
+            ufunc.at(result, group, values)
+        return Series(data=result, name=name, dtype=result.dtype, mask=mask)
+
+    if values.dtype.kind not in ("b", "i", "f"):
+        logging.exception(
+            f"Agrégation {how} impossible sur la colonne {serie.name} "
+            f"de type {serie.dtype} : colonne numérique attendue"
+        )
+        raise TypeError
+    if values.dtype.kind == "b":
+        values = values.astype(np.int64)
+    if how == "sum":
+        if values.dtype.kind == "i":
+            result = np.zeros(ngroups, dtype=np.int64)
+            np.add.at(result, group, values)
+        else:
+            result = np.bincount(group, weights=values, minlength=ngroups)
+        return Series(data=result, name=name, dtype=result.dtype)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.bincount(group, weights=values, minlength=ngroups) / counts
+        if how == "mean":
+            return Series(data=means, name=name, dtype=np.float64, mask=mask)
+        deviations = (values - means[group]) ** 2
+        stds = np.sqrt(
+            np.bincount(group, weights=deviations, minlength=ngroups) / counts
+        )
+    return Series(data=stds, name=name, dtype=np.float64, mask=mask)
@@ -0,0 +1,206 @@
+from collections import Counter
+import logging
+from typing import Any
+from typing import List
+from typing import Optional
+
+import numpy as np
+
+from src.categorical import categorize
+from src.dates import detect_format
+from src.dates import FORMAT_KINDS
+from src.dates import parse_dates
+from src.series import _kind_of
+from src.series import Series
+from src.strings import encode_strings
+
+logging.basicConfig(level=logging.INFO)
+
+KIND_DTYPES = {
+    "b": np.dtype(bool),
+    "i": np.dtype(np.int64),
+    "f": np.dtype(np.float64),
+    "D": np.dtype("datetime64[D]"),
+    "M": np.dtype("datetime64[us]"),
+    "O": np.dtype(object),
+}
+
+# Familles de types qu'un buffer peut recevoir sans conversion élément par élément
+COMPATIBLE_KINDS = {
+    "b": {"b"},
+    "i": {"i"},
+    "f": {"i", "f"},
+    "D": {"D"},
+    "M": {"D", "M"},
+    "O": {"b", "i", "f", "D", "M", "O"},
+}
+
+# Écritures des booléens reconnues dans une chaîne de caractères
+BOOLEAN_STRINGS = {"true": True, "false": False}
+
+
+def _to_bool(element: Any) -> bool:
+    """
+    Convertit une chaîne "true" ou "false" (sans tenir compte de la casse) en booléen,
+    toute autre valeur n'étant pas un booléen
+    """
+    if not isinstance(element, str):
+        raise TypeError
+    return BOOLEAN_STRINGS[element.strip().lower()]
+
+
+def _to_int(element: Any) -> int:
+    """
+    Convertit une valeur en entier sans la tronquer : un flottant non entier n'est
+    pas un entier
+    """
+    if isinstance(element, str):
+        try:
+            return int(element)
+        except ValueError:
+            element = float(element)
+    if isinstance(element, float) and not element.is_integer():
+        raise ValueError
+    return int(element)
+
+
+CONVERTERS = {
+    "b": _to_bool,
+    "i": _to_int,
+    "f": float,
+}
+
+
+def _type_histogram(elements: List[Any]) -> Counter:
+    """
+    Compte en un seul parcours les occurences de chaque type Python non nul
+    """
+    histogram = Counter(map(type, elements))
+    histogram.pop(type(None), None)
+    return histogram
+
+
+def infer_kind(elements: List[Any], histogram: Counter = None) -> str:
+    """
+    Détermine en un seul parcours la famille de type d'une colonne selon les règles suivantes :
+
+    - une seule famille présente : elle est retenue
+    - entiers et flottants mélangés : flottant
+    - dates et dates avec heure mélangées : date avec heure
+    - chaînes dans un format de dates reconnu sur un échantillon (voir `detect_format`) :
+      date ou date avec heure selon le format
+    - sinon la famille la plus fréquente, et object en cas d'égalité
+
+    Parameters
+    ----------
+    elements : list:
+        Les valeurs de la colonne
+    histogram : Counter
+        L'histogramme des types Python de la colonne s'il a déjà été calculé
+
+    Returns
+    -------
+    str
+        La famille retenue (b, i, f, D, M ou O)
+    """
+    if histogram is None:
+        histogram = _type_histogram(elements)
+    kinds = Counter()
+    for element_type, occurences in histogram.items():
+        kinds[_kind_of(element_type)] += occurences
+    date_format = detect_format(elements) if str in histogram else None
+    if date_format is not None:
+        kinds["O"] -= histogram[str]
+        kinds[FORMAT_KINDS[date_format]] += histogram[str]
+    kinds = +kinds
+
+    if not kinds:
+        return "O"
+    if len(kinds) == 1:
+        return next(iter(kinds))
+    if set(kinds) == {"i", "f"}:
+        return "f"
+    if set(kinds) == {"D", "M"}:
+        return "M"
+    (first, first_count), (_, second_count) = kinds.most_common(2)
+    return first if first_count > second_count else "O"
+
+
+def infer_series(
+    elements: List[Any], name: str = None, kind: Optional[str] = None
+) -> Series:
+    """
+    Crée une Serie typée à partir d'une colonne de valeurs Python en inférant
+    son type une seule fois puis en convertissant la colonne en bloc.
+    Les valeurs qui ne peuvent pas être converties deviennent des valeurs manquantes
+    et une colonne de chaînes de caractères devient catégorielle si elle a peu
+    de valeurs distinctes (voir `categorize`), une Serie de chaînes sinon
+
+    Parameters
+    ----------
+    elements : list:
+        Les valeurs de la colonne
+    name : str
+        Le nom de la Serie
+    kind : str
+        La famille de type à utiliser, inférée si elle n'est pas précisée
+
+    Returns
+    -------
+    Series
+        La Serie typée dont le type est mémorisé
+    """
+    if isinstance(elements, range):
+        return Series(data=elements, name=name, dtype=KIND_DTYPES["i"])
+    histogram = _type_histogram(elements)
+    if kind is None:
+        kind = infer_kind(elements, histogram)
+    dtype = KIND_DTYPES[kind]
+
+    if kind in ("D", "M") and str in histogram:
+        elements = list(elements)
+        positions = [i for i, e in enumerate(elements) if isinstance(e, str)]
+        dates = parse_dates([elements[i] for i in positions]).tolist()
+        for position, value in zip(positions, dates):
+            elements[position] = value
+        histogram = _type_histogram(elements)
+
+    compatible = COMPATIBLE_KINDS[kind]
+    incompatible_types = {t for t in histogram if _kind_of(t) not in compatible}
+    if incompatible_types:
+        elements = list(elements)
+        converter = CONVERTERS.get(kind)
+        for position, element in enumerate(elements):
+            if type(element) in incompatible_types:
+                try:
+                    elements[position] = converter(element)
+                except (KeyError, OverflowError, TypeError, ValueError):
+                    elements[position] = None
+
+    serie = Series(data=elements, name=name, dtype=dtype)
+    if kind == "O" and set(histogram) == {str}:
+        serie = categorize(serie)
+        return serie if serie.categories is not None else to_strings(serie)
+    return serie
+
+
+def to_strings(serie: Series) -> Series:
+    """
+    Convertit une Serie object de chaînes de caractères en Serie de chaînes, stockée
+    dans un buffer UTF-8 contigu plutôt qu'en un objet Python par valeur
+
+    Parameters
+    ----------
+    serie : Series
+        La Serie, dont toutes les valeurs présentes sont des chaînes de caractères
+
+    Returns
+    -------
+    Series
+        La Serie de chaînes
+    """
+    values = serie.values
+    if serie._mask is not None:
+        values = np.where(serie._mask, values, "")
+    data, spans = encode_strings(values.tolist())
+    return Series(data=spans, name=serie.name, mask=serie._mask, strings=data)
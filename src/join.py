@@ -0,0 +1,336 @@
+import logging
+import tempfile
+from typing import List
+from typing import Tuple
+
+import numpy as np
+
+from src.groupby import first_rows
+from src.groupby import group_codes
+from src.series import Series
+from src.spill import load
+from src.spill import partition_rows
+from src.spill import row_hashes
+from src.spill import spill
+
+logging.basicConfig(level=logging.INFO)
+
+HOW = ("left", "right", "inner", "outer")
+
+
+def _expand(
+    probe_starts: np.ndarray, matches: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Développe chaque ligne sondée en autant de lignes qu'elle a de correspondances.
+    Retourne la position de la ligne sondée et la position (relative au début
+    de son groupe) de la correspondance pour chaque ligne produite
+    """
+    probe_rows = np.repeat(np.arange(len(matches)), matches)
+    offsets = np.arange(len(probe_rows)) - np.repeat(
+        np.cumsum(matches) - matches, matches
+    )
+    return probe_rows, np.repeat(probe_starts, matches) + offsets
+
+
+def merge_indexers(left: Series, right: Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Jointure interne par fusion de deux Series déjà triées : chaque bloc de clés égales
+    à gauche est apparié au bloc correspondant à droite par recherche dichotomique
+
+    Parameters
+    ----------
+    left : Series
+        La clé triée de gauche
+    right : Series
+        La clé triée de droite
+
+    Returns
+    -------
+    tuple
+        Les positions appariées à gauche et à droite, dans l'ordre de la gauche
+    """
+    starts = np.searchsorted(right.values, left.values, side="left")
+    stops = np.searchsorted(right.values, left.values, side="right")
+    return _expand(starts, stops - starts)
+
+
+def _build_table(hashes: np.ndarray) -> np.ndarray:
+    """
+    Construit une table de hachage à adressage ouvert (sondage linéaire) des clés
+    distinctes du côté construit, de capacité au moins double de leur nombre. Toutes les
+    clés sont insérées ensemble, chaque tour plaçant au plus une clé par case libre :
+    les clés en collision passent à la case suivante au tour d'après
+
+    Parameters
+    ----------
+    hashes : np.ndarray
+        Le hachage (uint64) de chaque clé distincte
+
+    Returns
+    -------
+    np.ndarray
+        Le numéro de la clé occupant chaque case, -1 pour une case libre
+    """
+    capacity = 1 << (2 * len(hashes)).bit_length()
+    table = np.full(capacity, -1, dtype=np.int64)
+    pending = np.arange(len(hashes))
+    slots = (hashes & np.uint64(capacity - 1)).astype(np.int64)
+    while len(pending):
+        free = table[slots] < 0
+        table[slots[free]] = pending[free]
+        # Une seule des clés visant la même case libre y est écrite
+        placed = free & (table[slots] == pending)
+        pending, slots = pending[~placed], (slots[~placed] + 1) & (capacity - 1)
+    return table
+
+
+def _same_keys(
+    build_keys: List[Series],
+    build_rows: np.ndarray,
+    probe_keys: List[Series],
+    probe_rows: np.ndarray,
+) -> np.ndarray:
+    """
+    Compare les clés de lignes des deux côtés, deux valeurs NaN étant égales
+    """
+    same = np.ones(len(probe_rows), dtype=bool)
+    for build_key, probe_key in zip(build_keys, probe_keys):
+        build_values = build_key.take(build_rows).values
+        probe_values = probe_key.take(probe_rows).values
+        equal = build_values == probe_values
+        if build_values.dtype.kind == "f" and probe_values.dtype.kind == "f":
+            equal |= np.isnan(build_values) & np.isnan(probe_values)
+        same &= equal
+    return same
+
+
+def _probe_table(
+    table: np.ndarray,
+    build_hashes: np.ndarray,
+    build_rows: np.ndarray,
+    build_keys: List[Series],
+    probe_keys: List[Series],
+) -> np.ndarray:
+    """
+    Cherche la clé de chaque ligne sondée dans la table, toutes les lignes avançant
+    ensemble d'une case par tour jusqu'à une case libre ou une clé égale (même hachage,
+    puis mêmes valeurs)
+
+    Parameters
+    ----------
+    table : np.ndarray
+        La table (voir `_build_table`)
+    build_hashes : np.ndarray
+        Le hachage de chaque clé distincte du côté construit
+    build_rows : np.ndarray
+        Une ligne du côté construit portant chaque clé distincte
+    build_keys : list:
+        Les Series clés du côté construit
+    probe_keys : list:
+        Les Series clés du côté sondé
+
+    Returns
+    -------
+    np.ndarray
+        Le numéro de la clé distincte de chaque ligne sondée, -1 sans correspondance
+    """
+    found = np.full(len(probe_keys[0]), -1, dtype=np.int64)
+    valid = np.ones(len(found), dtype=bool)
+    for key in probe_keys:
+        valid &= key._validity()
+    pending = np.flatnonzero(valid)
+    hashes = row_hashes(probe_keys)[pending]
+    slots = (hashes & np.uint64(len(table) - 1)).astype(np.int64)
+    while len(pending):
+        candidates = table[slots]
+        done = candidates < 0
+        checked = np.flatnonzero(~done)
+        checked = checked[build_hashes[candidates[checked]] == hashes[checked]]
+        matched = _same_keys(
+            build_keys,
+            build_rows[candidates[checked]],
+            probe_keys,
+            pending[checked],
+        )
+        checked = checked[matched]
+        found[pending[checked]] = candidates[checked]
+        done[checked] = True
+        pending, hashes = pending[~done], hashes[~done]
+        slots = (slots[~done] + 1) & (len(table) - 1)
+    return found
+
+
+def hash_indexers(
+    left_keys: List[Series], right_keys: List[Series]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Jointure interne par hachage : les clés distinctes du plus petit côté sont encodées
+    en codes de groupe et placées dans une table de hachage (voir `_build_table`), que
+    sonde ensuite chaque ligne de l'autre côté (voir `_probe_table`). Seul le plus petit
+    côté est encodé et indexé. Les clés manquantes ne correspondent à aucune ligne
+
+    Parameters
+    ----------
+    left_keys : list:
+        Les Series clés de gauche
+    right_keys : list:
+        Les Series clés de droite
+
+    Returns
+    -------
+    tuple
+        Les positions appariées à gauche et à droite, dans l'ordre de la gauche
+    """
+    build_on_left = len(left_keys[0]) < len(right_keys[0])
+    build_keys, probe_keys = (
+        (left_keys, right_keys) if build_on_left else (right_keys, left_keys)
+    )
+    build, ngroups = group_codes(build_keys)
+    if not ngroups:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    representatives = first_rows(build, ngroups)
+    build_hashes = row_hashes(build_keys)[representatives]
+    table = _build_table(build_hashes)
+    probe = _probe_table(table, build_hashes, representatives, build_keys, probe_keys)
+
+    valid = build >= 0
+    order = np.flatnonzero(valid)[np.argsort(build[valid], kind="stable")]
+    counts = np.bincount(build[valid], minlength=ngroups)
+    starts = np.cumsum(counts) - counts
+
+    probe_valid = probe >= 0
+    matches = np.where(probe_valid, counts[np.where(probe_valid, probe, 0)], 0)
+    probe_rows, build_positions = _expand(
+        starts[np.where(probe_valid, probe, 0)], matches
+    )
+    build_rows = order[build_positions]
+
+    if not build_on_left:
+        return probe_rows, build_rows
+    # La table a été construite à gauche : remise des paires dans l'ordre de la gauche
+    resorted = np.argsort(build_rows, kind="stable")
+    return build_rows[resorted], probe_rows[resorted]
+
+
+def join_indexers(
+    left_keys: List[Series], right_keys: List[Series], how: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcule les positions des lignes de gauche et de droite composant le résultat d'une
+    jointure, -1 désignant une ligne absente d'un des côtés. Une jointure par fusion
+    est utilisée lorsque les deux clés (simples) sont déjà triées, ce qui est connu sans
+    vérification après `sort_values`, une jointure par hachage sinon
+
+    Parameters
+    ----------
+    left_keys : list:
+        Les Series clés de gauche
+    right_keys : list:
+        Les Series clés de droite
+    how : str
+        Le type de jointure (left, right, inner ou outer)
+
+    Returns
+    -------
+    tuple
+        Les positions des lignes de gauche et de droite du résultat
+    """
+    if (
+        len(left_keys) == 1
+        and left_keys[0].dtype == right_keys[0].dtype
+        and left_keys[0].is_sorted()
+        and right_keys[0].is_sorted()
+    ):
+        left_rows, right_rows = merge_indexers(left_keys[0], right_keys[0])
+    else:
+        left_rows, right_rows = hash_indexers(left_keys, right_keys)
+
+    if how in ("left", "outer"):
+        unmatched = np.ones(len(left_keys[0]), dtype=bool)
+        unmatched[left_rows] = False
+        missing_left = np.flatnonzero(unmatched)
+        left_rows = np.concatenate([left_rows, missing_left])
+        right_rows = np.concatenate(
+            [right_rows, np.full(len(missing_left), -1, dtype=np.int64)]
+        )
+        order = np.argsort(left_rows, kind="stable")
+        left_rows, right_rows = left_rows[order], right_rows[order]
+
+    if how in ("right", "outer"):
+        unmatched = np.ones(len(right_keys[0]), dtype=bool)
+        unmatched[right_rows[right_rows >= 0]] = False
+        missing_right = np.flatnonzero(unmatched)
+        left_rows = np.concatenate(
+            [left_rows, np.full(len(missing_right), -1, dtype=np.int64)]
+        )
+        right_rows = np.concatenate([right_rows, missing_right])
+        if how == "right":
+            order = np.argsort(right_rows, kind="stable")
+            left_rows, right_rows = left_rows[order], right_rows[order]
+
+    return left_rows, right_rows
+
+
+def _original_rows(positions: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """
+    Convertit les positions de lignes d'une partition en positions d'origine,
+    -1 (ligne absente) étant conservé
+    """
+    original = np.full(len(rows), -1, dtype=np.int64)
+    present = rows >= 0
+    original[present] = positions[rows[present]]
+    return original
+
+
+def partitioned_join_indexers(
+    left_keys: List[Series], right_keys: List[Series], how: str, npartitions: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcule les positions des lignes d'une jointure (voir `join_indexers`) partition par
+    partition : les clés des deux côtés sont réparties par hachage dans des fichiers
+    temporaires, chaque paire de partitions est relue puis jointe seule, et les positions
+    obtenues sont remises dans l'ordre de la jointure en mémoire. La mémoire de travail
+    (encodage des clés, table de hachage, tris) est ainsi celle d'une partition
+
+    Parameters
+    ----------
+    left_keys : list:
+        Les Series clés de gauche
+    right_keys : list:
+        Les Series clés de droite
+    how : str
+        Le type de jointure (left, right, inner ou outer)
+    npartitions : int
+        Le nombre de partitions
+
+    Returns
+    -------
+    tuple
+        Les positions des lignes de gauche et de droite du résultat
+    """
+    left_parts, right_parts = [], []
+    with tempfile.TemporaryDirectory(prefix="mybear-") as directory:
+        left_paths = spill(
+            left_keys, partition_rows(left_keys, npartitions), directory, "left"
+        )
+        right_paths = spill(
+            right_keys, partition_rows(right_keys, npartitions), directory, "right"
+        )
+        for left_path, right_path in zip(left_paths, right_paths):
+            *left_part, left_positions = load(left_path)
+            *right_part, right_positions = load(right_path)
+            left_rows, right_rows = join_indexers(left_part, right_part, how)
+            left_parts.append(_original_rows(left_positions.values, left_rows))
+            right_parts.append(_original_rows(right_positions.values, right_rows))
+
+    left_rows = np.concatenate(left_parts)
+    right_rows = np.concatenate(right_parts)
+    # Ordre de la jointure en mémoire : celui de la gauche (puis de la droite pour une
+    # même ligne de gauche), les lignes de droite seules en fin pour une jointure pleine,
+    # celui de la droite pour une jointure à droite
+    if how == "right":
+        order = np.lexsort((left_rows, right_rows))
+    else:
+        order = np.lexsort((right_rows, left_rows, left_rows < 0))
+    return left_rows[order], right_rows[order]
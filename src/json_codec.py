@@ -0,0 +1,56 @@
+from datetime import date
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    orjson = None
+
+
+def loads(document: bytes) -> Any:
+    """
+    Décode un document JSON avec orjson s'il est installé, le module json sinon
+
+    Parameters
+    ----------
+    document : bytes
+        Le document JSON encodé en UTF-8
+
+    Returns
+    -------
+    Any
+        L'objet Python correspondant
+    """
+    if orjson is not None:
+        return orjson.loads(document)
+    return json.loads(document)
+
+
+def _default(value: Any) -> Any:
+    """
+    Sérialise les valeurs que le module json ne sait pas encoder
+    """
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Type non sérialisable en JSON : {type(value)}")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encode un objet Python en JSON (UTF-8) avec orjson s'il est installé, le module json sinon.
+    Les dates sont écrites au format ISO
+
+    Parameters
+    ----------
+    value : Any
+        L'objet à encoder
+
+    Returns
+    -------
+    bytes
+        Le document JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=_default)
+    return json.dumps(value, default=_default, ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,632 @@
+import logging
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from src.groupby import AGGREGATIONS
+from src.join import HOW
+from src.predicates import check_filters
+from src.predicates import Filter
+from src.predicates import filters_mask
+
+logging.basicConfig(level=logging.INFO)
+
+
+class Source:
+    """
+    Feuille d'un plan logique : un DataFrame déjà en mémoire
+    """
+
+    def __init__(self, frame: Any) -> None:
+        self.frame = frame
+
+    def __str__(self) -> str:
+        return f"DataFrame {self.frame.colonnes}"
+
+
+class Scan:
+    """
+    Feuille d'un plan logique : la lecture d'un fichier par `read_csv` ou `read_json`,
+    à laquelle l'optimiseur transmet les colonnes et les filtres utiles
+    """
+
+    def __init__(
+        self,
+        reader: Callable[..., Any],
+        path: str,
+        options: Dict[str, Any],
+        schema: Optional[List[str]],
+        columns: Optional[List[str]] = None,
+        filters: List[Filter] = None,
+    ) -> None:
+        self.reader = reader
+        self.path = path
+        self.options = options
+        self.schema = schema
+        self.columns = columns
+        self.filters = filters if filters is not None else []
+
+    def __str__(self) -> str:
+        description = f"Scan {self.reader.__name__} {self.path}"
+        if self.columns is not None:
+            description += f" columns={self.columns}"
+        if self.filters:
+            description += f" filters={self.filters}"
+        return description
+
+
+class Select:
+    """
+    Projection sur une liste de colonnes
+    """
+
+    def __init__(self, child: Any, columns: List[str]) -> None:
+        self.child = child
+        self.columns = columns
+
+    def __str__(self) -> str:
+        return f"Select {self.columns}"
+
+
+class Where:
+    """
+    Sélection des lignes satisfaisant tous les filtres (colonne, opérateur, valeur)
+    """
+
+    def __init__(self, child: Any, filters: List[Filter]) -> None:
+        self.child = child
+        self.filters = filters
+
+    def __str__(self) -> str:
+        return f"Filter {self.filters}"
+
+
+class GroupBy:
+    """
+    Agrégation par groupe, exécutée par `DataFrame.groupby`
+    """
+
+    def __init__(self, child: Any, by: List[str], agg: Dict[str, Any]) -> None:
+        self.child = child
+        self.by = by
+        self.agg = agg
+
+    def __str__(self) -> str:
+        return f"GroupBy {self.by} agg={self.agg}"
+
+
+class Join:
+    """
+    Jointure de deux plans, exécutée par `DataFrame.join`
+    """
+
+    def __init__(
+        self,
+        left: Any,
+        right: Any,
+        left_on: List[str],
+        right_on: List[str],
+        how: str,
+        suffixes: Tuple[str, str],
+    ) -> None:
+        self.left = left
+        self.right = right
+        self.left_on = left_on
+        self.right_on = right_on
+        self.how = how
+        self.suffixes = suffixes
+
+    def __str__(self) -> str:
+        return f"Join {self.how} {self.left_on} = {self.right_on}"
+
+
+class Reduce:
+    """
+    Réduction de chaque colonne (sum, min, max, mean ou std) en une ligne
+    """
+
+    def __init__(self, child: Any, how: str) -> None:
+        self.child = child
+        self.how = how
+
+    def __str__(self) -> str:
+        return f"Reduce {self.how}"
+
+
+def _agg_outputs(column: str, strategies: Any) -> List[str]:
+    """
+    Retourne le nom des colonnes produites par `DataFrame.groupby` pour une colonne agrégée
+    """
+    if not isinstance(strategies, list):
+        return [column]
+    return [
+        f"{column}_{strategy if isinstance(strategy, str) else strategy.__name__}"
+        for strategy in strategies
+    ]
+
+
+def _join_outputs(node: Join, left: List[str], right: List[str]) -> List[Tuple]:
+    """
+    Retourne, pour chaque colonne produite par `DataFrame.join`, son nom, son côté
+    (left, right ou both pour une clé commune) et son nom d'origine
+    """
+    shared_keys = {lk for lk, rk in zip(node.left_on, node.right_on) if lk == rk}
+    outputs = []
+    for column in left:
+        if column in shared_keys:
+            outputs.append((column, "both", column))
+        elif column in right:
+            outputs.append((column + node.suffixes[0], "left", column))
+        else:
+            outputs.append((column, "left", column))
+    for column in right:
+        if column not in shared_keys:
+            name = column + node.suffixes[1] if column in left else column
+            outputs.append((name, "right", column))
+    return outputs
+
+
+def schema(node: Any) -> Optional[List[str]]:
+    """
+    Retourne les colonnes produites par un nœud du plan, ou None si elles ne sont pas
+    connues avant l'exécution (fichier JSON)
+    """
+    if isinstance(node, Source):
+        return list(node.frame.colonnes)
+    if isinstance(node, Scan):
+        return node.columns if node.columns is not None else node.schema
+    if isinstance(node, Select):
+        return node.columns
+    if isinstance(node, (Where, Reduce)):
+        return schema(node.child)
+    if isinstance(node, GroupBy):
+        columns = schema(node.child)
+        if columns is None:
+            return None
+        return node.by + [
+            output
+            for column in columns
+            if column not in node.by
+            for output in _agg_outputs(column, node.agg.get(column, "first"))
+        ]
+    left, right = schema(node.left), schema(node.right)
+    if left is None or right is None:
+        return None
+    return [name for name, _, _ in _join_outputs(node, left, right)]
+
+
+def _children(node: Any) -> List[Any]:
+    """
+    Retourne les nœuds fils d'un nœud du plan
+    """
+    if isinstance(node, Join):
+        return [node.left, node.right]
+    if isinstance(node, (Source, Scan)):
+        return []
+    return [node.child]
+
+
+def _push_filters(node: Any, pending: List[Filter]) -> Any:
+    """
+    Descend les filtres le plus près possible des lectures de fichiers : à travers les
+    projections, sur les clés d'un groupby et du côté conservé d'une jointure
+    """
+    if isinstance(node, Where):
+        return _push_filters(node.child, pending + node.filters)
+    if isinstance(node, Scan):
+        return Scan(
+            node.reader,
+            node.path,
+            node.options,
+            node.schema,
+            node.columns,
+            node.filters + pending,
+        )
+    if isinstance(node, Source):
+        return Where(node, pending) if pending else node
+    if isinstance(node, Select):
+        return Select(_push_filters(node.child, pending), node.columns)
+
+    remaining = []
+    if isinstance(node, GroupBy):
+        keys = [f for f in pending if f[0] in node.by]
+        remaining = [f for f in pending if f[0] not in node.by]
+        node = GroupBy(_push_filters(node.child, keys), node.by, node.agg)
+    elif isinstance(node, Join):
+        left, right = schema(node.left), schema(node.right)
+        outputs = {}
+        if left is not None and right is not None:
+            outputs = {n: (s, c) for n, s, c in _join_outputs(node, left, right)}
+        to_left, to_right = [], []
+        for column, op, value in pending:
+            side, source = outputs.get(column, (None, None))
+            if side == "both" and node.how != "outer":
+                right_key = node.right_on[node.left_on.index(source)]
+                to_left.append((source, op, value))
+                to_right.append((right_key, op, value))
+            elif side == "left" and node.how in ("inner", "left"):
+                to_left.append((source, op, value))
+            elif side == "right" and node.how in ("inner", "right"):
+                to_right.append((source, op, value))
+            else:
+                remaining.append((column, op, value))
+        node = Join(
+            _push_filters(node.left, to_left),
+            _push_filters(node.right, to_right),
+            node.left_on,
+            node.right_on,
+            node.how,
+            node.suffixes,
+        )
+    else:
+        remaining = pending
+        node = Reduce(_push_filters(node.child, []), node.how)
+    return Where(node, remaining) if remaining else node
+
+
+def _unique(columns: List[str]) -> List[str]:
+    """
+    Retire les doublons d'une liste de colonnes en conservant l'ordre
+    """
+    return list(dict.fromkeys(columns))
+
+
+def _push_columns(node: Any, required: Optional[List[str]]) -> Any:
+    """
+    Descend les colonnes nécessaires jusqu'aux lectures de fichiers (paramètre usecols)
+    et aux DataFrames sources, en fusionnant les projections successives.
+    `required` vaut None lorsque toutes les colonnes sont nécessaires
+    """
+    if isinstance(node, Select):
+        columns = required if required is not None else node.columns
+        child = _push_columns(node.child, columns)
+        # Projection redondante après fusion avec une projection inférieure
+        return child if schema(child) == columns else Select(child, columns)
+    if isinstance(node, Scan):
+        columns = required
+        if required is not None and node.schema is not None:
+            columns = [column for column in node.schema if column in required]
+        return Scan(
+            node.reader, node.path, node.options, node.schema, columns, node.filters
+        )
+    if isinstance(node, Source):
+        if required is None or required == node.frame.colonnes:
+            return node
+        return Select(node, [c for c in node.frame.colonnes if c in required])
+    if isinstance(node, Where):
+        needed = None
+        if required is not None:
+            needed = _unique(required + [column for column, _, _ in node.filters])
+        return Where(_push_columns(node.child, needed), node.filters)
+    if isinstance(node, Reduce):
+        return Reduce(_push_columns(node.child, required), node.how)
+
+    if isinstance(node, GroupBy):
+        if required is None:
+            return GroupBy(_push_columns(node.child, None), node.by, node.agg)
+        outputs = {
+            column: _agg_outputs(column, strategies)
+            for column, strategies in node.agg.items()
+        }
+        produced = {output for names in outputs.values() for output in names}
+        agg = {
+            column: node.agg[column]
+            for column, names in outputs.items()
+            if any(name in required for name in names)
+        }
+        needed = _unique(
+            node.by
+            + list(agg)
+            + [c for c in required if c not in node.by and c not in produced]
+        )
+        return GroupBy(_push_columns(node.child, needed), node.by, agg)
+
+    left, right = schema(node.left), schema(node.right)
+    left_needed = right_needed = None
+    if required is not None and left is not None and right is not None:
+        # Les colonnes présentes des deux côtés sont conservées pour que les suffixes
+        # des colonnes produites restent inchangés
+        left_needed = list(node.left_on) + [c for c in left if c in right]
+        right_needed = list(node.right_on) + [c for c in right if c in left]
+        for name, side, source in _join_outputs(node, left, right):
+            if name in required and side == "left":
+                left_needed.append(source)
+            elif name in required and side == "right":
+                right_needed.append(source)
+        left_needed = [c for c in left if c in left_needed]
+        right_needed = [c for c in right if c in right_needed]
+    return Join(
+        _push_columns(node.left, left_needed),
+        _push_columns(node.right, right_needed),
+        node.left_on,
+        node.right_on,
+        node.how,
+        node.suffixes,
+    )
+
+
+def optimize(node: Any) -> Any:
+    """
+    Optimise un plan logique : descente des filtres (predicate pushdown) puis des
+    colonnes nécessaires (projection pushdown) jusqu'aux lectures de fichiers
+
+    Parameters
+    ----------
+    node : Any
+        La racine du plan
+
+    Returns
+    -------
+    Any
+        La racine du plan optimisé
+    """
+    return _push_columns(_push_filters(node, []), None)
+
+
+def execute(node: Any) -> Any:
+    """
+    Exécute un plan logique et retourne le DataFrame résultat
+
+    Parameters
+    ----------
+    node : Any
+        La racine du plan
+
+    Returns
+    -------
+    DataFrame
+        Le résultat du plan
+    """
+    if isinstance(node, Source):
+        return node.frame
+    if isinstance(node, Scan):
+        return node.reader(
+            node.path,
+            usecols=node.columns,
+            filters=node.filters if node.filters else None,
+            **node.options,
+        )
+    if isinstance(node, Join):
+        return execute(node.left).join(
+            execute(node.right),
+            left_on=node.left_on,
+            right_on=node.right_on,
+            how=node.how,
+            suffixes=node.suffixes,
+        )
+
+    frame = execute(node.child)
+    if isinstance(node, Select):
+        return type(frame)(series=[frame.data[column] for column in node.columns])
+    if isinstance(node, Where):
+        return frame.filter(filters_mask(frame.data, node.filters))
+    if isinstance(node, GroupBy):
+        return frame.groupby(node.by, agg=node.agg)
+    return getattr(frame, node.how)()
+
+
+class LazyFrame:
+    """
+    DataFrame différé : les opérations sont enregistrées dans un plan logique,
+    optimisé puis exécuté en une fois par `collect`
+    """
+
+    def __init__(self, plan: Any) -> None:
+        """
+        Fonction __init__ permettant de créer une nouvelle instance de la classe LazyFrame
+
+        Parameters
+        ----------
+        plan : Any
+            La racine du plan logique
+        """
+        self.plan = plan
+
+    def _check_columns(self, columns: List[str]) -> None:
+        """
+        Vérifie que des colonnes existent lorsque les colonnes du plan sont connues
+
+        Raises
+        ------
+        ValueError
+            Colonnes introuvables
+        """
+        known = schema(self.plan)
+        missing_columns = [c for c in columns if known is not None and c not in known]
+        if missing_columns:
+            logging.exception(f"Colonnes introuvables : {missing_columns}")
+            raise ValueError
+
+    def select(self, columns: Union[List[str], str]) -> Any:
+        """
+        Enregistre une projection sur une ou plusieurs colonnes
+
+        Parameters
+        ----------
+        columns : list | str
+            Les colonnes conservées
+
+        Returns
+        -------
+        LazyFrame
+            Le nouveau LazyFrame
+        """
+        columns = [columns] if isinstance(columns, str) else list(columns)
+        self._check_columns(columns)
+        return LazyFrame(Select(self.plan, columns))
+
+    def filter(self, column: str, op: str, value: Any) -> Any:
+        """
+        Enregistre un filtre sur les lignes, les filtres successifs se cumulant
+
+        Parameters
+        ----------
+        column : str
+            La colonne filtrée
+        op : str
+            L'opérateur de comparaison (==, !=, <, <=, >, >=, in, not in)
+        value : Any
+            La valeur comparée
+
+        Returns
+        -------
+        LazyFrame
+            Le nouveau LazyFrame
+
+        Raises
+        ------
+        ValueError
+            Opérateur inconnu ou colonne introuvable
+        """
+        filters = check_filters([(column, op, value)])
+        self._check_columns([column])
+        return LazyFrame(Where(self.plan, filters))
+
+    def groupby(
+        self,
+        by: Union[List[str], str],
+        agg: Dict[str, Union[str, Callable[[List[Any]], Any], List[Any]]] = None,
+    ) -> Any:
+        """
+        Enregistre une agrégation par groupe (voir `DataFrame.groupby`)
+
+        Returns
+        -------
+        LazyFrame
+            Le nouveau LazyFrame
+        """
+        by = [by] if isinstance(by, str) else by
+        if not isinstance(by, list) or not by:
+            logging.exception(
+                f"Type attendu pour by : {list} ou {str}. Reçu : {type(by)}"
+            )
+            raise TypeError
+        agg = dict(agg) if agg is not None else {}
+        unknown = [
+            strategy
+            for strategies in agg.values()
+            for strategy in (
+                strategies if isinstance(strategies, list) else [strategies]
+            )
+            if isinstance(strategy, str) and strategy not in AGGREGATIONS
+        ]
+        if unknown:
+            logging.exception(f"Agrégations inconnues : {unknown}")
+            raise ValueError
+        self._check_columns(by + list(agg))
+        return LazyFrame(GroupBy(self.plan, by, agg))
+
+    def join(
+        self,
+        other: Any,
+        left_on: Union[List[str], str],
+        right_on: Union[List[str], str],
+        how: str = "left",
+        suffixes: Tuple[str, str] = ("_x", "_y"),
+    ) -> Any:
+        """
+        Enregistre une jointure avec un autre LazyFrame ou DataFrame (voir `DataFrame.join`)
+
+        Returns
+        -------
+        LazyFrame
+            Le nouveau LazyFrame
+        """
+        if how not in HOW:
+            logging.exception(
+                f"Argument attendu pour how : {' ou '.join(HOW)}. Reçu : {how}"
+            )
+            raise ValueError
+        other = other if isinstance(other, LazyFrame) else other.lazy()
+        left_on = [left_on] if isinstance(left_on, str) else list(left_on)
+        right_on = [right_on] if isinstance(right_on, str) else list(right_on)
+        if len(left_on) != len(right_on) or not left_on:
+            logging.exception(
+                "left_on et right_on doivent avoir le même nombre de clés"
+            )
+            raise ValueError
+        self._check_columns(left_on)
+        other._check_columns(right_on)
+        return LazyFrame(
+            Join(self.plan, other.plan, left_on, right_on, how, tuple(suffixes))
+        )
+
+    def sum(self) -> Any:
+        """
+        Enregistre le calcul de la somme de chaque colonne
+        """
+        return LazyFrame(Reduce(self.plan, "sum"))
+
+    def min(self) -> Any:
+        """
+        Enregistre le calcul du minimum de chaque colonne
+        """
+        return LazyFrame(Reduce(self.plan, "min"))
+
+    def max(self) -> Any:
+        """
+        Enregistre le calcul du maximum de chaque colonne
+        """
+        return LazyFrame(Reduce(self.plan, "max"))
+
+    def mean(self) -> Any:
+        """
+        Enregistre le calcul de la moyenne de chaque colonne
+        """
+        return LazyFrame(Reduce(self.plan, "mean"))
+
+    def std(self) -> Any:
+        """
+        Enregistre le calcul de l'écart-type de chaque colonne
+        """
+        return LazyFrame(Reduce(self.plan, "std"))
+
+    def explain(self, optimized: bool = True) -> str:
+        """
+        Retourne la représentation textuelle du plan, un nœud par ligne
+
+        Parameters
+        ----------
+        optimized : bool
+            Représentation du plan optimisé plutôt que du plan enregistré
+
+        Returns
+        -------
+        str
+            Le plan
+        """
+        lines = []
+
+        def describe(node: Any, depth: int) -> None:
+            lines.append("  " * depth + str(node))
+            for child in _children(node):
+                describe(child, depth + 1)
+
+        describe(optimize(self.plan) if optimized else self.plan, 0)
+        return "\n".join(lines)
+
+    def collect(self) -> Any:
+        """
+        Optimise puis exécute le plan
+
+        Returns
+        -------
+        DataFrame
+            Le résultat du plan
+        """
+        return execute(optimize(self.plan))
+
+    def __str__(self) -> str:
+        """
+        Redéfinition de la méthode __str__ affichant le plan enregistré
+
+        Returns
+        -------
+        str
+            Le plan non optimisé
+        """
+        return self.explain(optimized=False)
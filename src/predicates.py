@@ -0,0 +1,106 @@
+import logging
+import operator
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import numpy as np
+
+from src.dates import parse_dates
+from src.series import Series
+
+logging.basicConfig(level=logging.INFO)
+
+# Opérateurs de comparaison utilisables dans un filtre (colonne, opérateur, valeur)
+OPERATORS = {
+    "==": Series.eq,
+    "!=": Series.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": Series.isin,
+    "not in": lambda serie, values: serie.notna() & ~serie.isin(values),
+}
+
+Filter = Tuple[str, str, Any]
+
+
+def check_filters(filters: List[Filter]) -> List[Filter]:
+    """
+    Vérifie qu'une liste de filtres est composée de triplets (colonne, opérateur, valeur)
+
+    Raises
+    ------
+    ValueError
+        Filtre non conforme ou opérateur inconnu
+    """
+    filters = [tuple(f) for f in filters]
+    for f in filters:
+        if len(f) != 3 or not isinstance(f[0], str) or f[1] not in OPERATORS:
+            logging.exception(
+                f"Filtre attendu : (colonne, {' ou '.join(OPERATORS)}, valeur). Reçu : {f}"
+            )
+            raise ValueError
+    return filters
+
+
+def _comparable(serie: Series, value: Any) -> Any:
+    """
+    Convertit la valeur comparée au type des dates de la Serie si nécessaire
+    """
+    if serie.dtype.kind == "M" and isinstance(value, str):
+        parsed = parse_dates([value])[0]
+        return parsed if not np.isnat(parsed) else np.datetime64(value)
+    return value
+
+
+def predicate_mask(serie: Series, op: str, value: Any) -> np.ndarray:
+    """
+    Évalue la comparaison de chaque valeur d'une Serie avec une valeur à l'aide des
+    opérateurs vectorisés de la Serie. Une valeur manquante, ou non comparable dans
+    une colonne object, ne satisfait jamais le filtre
+
+    Parameters
+    ----------
+    serie : Series
+        La Serie filtrée
+    op : str
+        L'opérateur de comparaison
+    value : Any
+        La valeur comparée (une collection pour in et not in)
+
+    Returns
+    -------
+    np.ndarray
+        Le masque des lignes satisfaisant le filtre
+    """
+    if op in ("in", "not in"):
+        value = [_comparable(serie, element) for element in value]
+    else:
+        value = _comparable(serie, value)
+    return OPERATORS[op](serie, value).values
+
+
+def filters_mask(columns: Dict[str, Series], filters: List[Filter]) -> np.ndarray:
+    """
+    Calcule le masque des lignes satisfaisant tous les filtres (conjonction)
+
+    Parameters
+    ----------
+    columns : dict:
+        Les Series filtrées, par nom de colonne
+    filters : list:
+        Les filtres (colonne, opérateur, valeur)
+
+    Returns
+    -------
+    np.ndarray
+        Le masque des lignes conservées
+    """
+    mask = None
+    for column, op, value in filters:
+        selected = predicate_mask(columns[column], op, value)
+        mask = selected if mask is None else mask & selected
+    return mask
@@ -1,31 +1,219 @@
+from datetime import date
+from datetime import datetime
 import logging
+import math
+import operator
 from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import numpy as np
 
+from src.dates import DatetimeMethods
+from src.executor import tree_reduce
+from src.sketches import HyperLogLog
+from src.sketches import QuantileSketch
+from src.sort import check_na_position
+from src.sort import lexsort_indexer
+from src.sort import smallest_indexer
+from src.strings import decode_strings
+from src.strings import equals
+from src.strings import StringMethods
+from src.window import Rolling
+
 logging.basicConfig(level=logging.INFO)
 
+# Nombre de valeurs converties à la fois lors d'une itération sur une Serie
+ITER_BLOCK_SIZE = 4096
+
+# Valeur de remplissage du buffer typé aux positions des valeurs manquantes
+FILL_VALUES = {
+    "b": False,
+    "i": 0,
+    "f": np.nan,
+    "M": None,
+    "O": None,
+    "V": 0,
+}
+
+# Divisions entières dont le résultat est manquant pour un diviseur nul
+INTEGER_DIVISIONS = (np.floor_divide, np.remainder)
+
+# Familles de types Python qu'un buffer numpy peut recevoir sans changer de type
+ASSIGNABLE_KINDS = {
+    "b": {"b"},
+    "i": {"b", "i"},
+    "f": {"b", "i", "f"},
+    "M": {"D", "M"},
+    "O": {"b", "i", "f", "D", "M", "O"},
+}
+
+
+def _nonzero_divisors(
+    valid: Optional[np.ndarray], divisor: Any, ufunc: np.ufunc, length: int
+) -> Optional[np.ndarray]:
+    """
+    Retire du masque des positions présentes celles d'une division entière par zéro,
+    dont numpy donne 0 au lieu d'une erreur
+    """
+    if ufunc not in INTEGER_DIVISIONS:
+        return valid
+    zero = np.broadcast_to(np.asarray(divisor) == 0, (length,))
+    if not zero.any():
+        return valid
+    return ~zero if valid is None else valid & ~zero
+
+
+def _kind_of(value_type: type) -> str:
+    """
+    Associe un type Python à la famille de buffer numpy qui pourra le stocker
+    """
+    if issubclass(value_type, (bool, np.bool_)):
+        return "b"
+    if issubclass(value_type, (int, np.integer)):
+        return "i"
+    if issubclass(value_type, (float, np.floating)):
+        return "f"
+    if issubclass(value_type, (datetime, np.datetime64)):
+        return "M"
+    if issubclass(value_type, date):
+        return "D"
+    return "O"
+
+
+def _dtype_of(kinds: set) -> np.dtype:
+    """
+    Choisit le type numpy du buffer à partir des familles de types rencontrées
+    """
+    if not kinds:
+        return np.dtype(object)
+    if kinds == {"b"}:
+        return np.dtype(bool)
+    if kinds == {"i"}:
+        return np.dtype(np.int64)
+    if kinds <= {"i", "f"}:
+        return np.dtype(np.float64)
+    if kinds == {"D"}:
+        return np.dtype("datetime64[D]")
+    if kinds <= {"D", "M"}:
+        return np.dtype("datetime64[us]")
+    return np.dtype(object)
+
+
+def _build_buffer(
+    data: Union[range, List[Any], np.ndarray], dtype: Any = None
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Convertit les données d'entrée en un buffer numpy contigu et typé
+    accompagné d'un masque de validité (None si aucune valeur n'est manquante)
+    """
+    if isinstance(data, range):
+        return np.arange(data.start, data.stop, data.step, dtype=np.int64), None
+
+    if isinstance(data, np.ndarray):
+        values = data if data.ndim == 1 else data.ravel()
+        if values.dtype.kind in ("U", "S"):
+            values = values.astype(object)
+        if dtype is not None:
+            values = values.astype(dtype, copy=False)
+        return values, None
+
+    types = set(map(type, data))
+    has_missing = type(None) in types
+    if dtype is None:
+        dtype = _dtype_of({_kind_of(t) for t in types if t is not type(None)})
+    dtype = np.dtype(dtype)
+
+    mask = None
+    if has_missing:
+        mask = np.fromiter(
+            (element is not None for element in data), dtype=bool, count=len(data)
+        )
+        fill = FILL_VALUES.get(dtype.kind)
+        data = [fill if element is None else element for element in data]
+
+    try:
+        values = np.array(data, dtype=dtype)
+    except (OverflowError, ValueError, TypeError):
+        values = np.empty(len(data), dtype=object)
+        values[:] = data
+    return values, mask
+
+
+def merge_moments(
+    left: Tuple[int, Any, float], right: Tuple[int, Any, float]
+) -> Tuple[int, Any, float]:
+    """
+    Fusionne les moments (effectif, somme, somme des carrés des écarts à la moyenne)
+    de deux ensembles de valeurs (formule de Chan, généralisation de Welford à des blocs)
+    """
+    n_left, total_left, m2_left = left
+    n_right, total_right, m2_right = right
+    if n_left == 0 or n_right == 0:
+        return left if n_right == 0 else right
+    n = n_left + n_right
+    delta = total_right / n_right - total_left / n_left
+    m2 = m2_left + m2_right + delta * delta * n_left * n_right / n
+    return n, total_left + total_right, m2
+
+
+def _to_python(value: Any) -> Any:
+    """
+    Convertit un scalaire numpy en son équivalent Python natif
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
 
 class Series:
     """
     Colonne dans un DataFrame qui contient en plus des données,
-    une étiquette (un nom), et des informations statistiques déjà
-    présentes et calculées automatiquement lors de la création de
-    la Serie (taille, nombre de valeurs manquantes et type de données)
+    une étiquette (un nom), et des informations statistiques (taille, type de données,
+    nombre de valeurs manquantes, minimum, maximum, somme et moments) calculées
+    au premier appel puis conservées en cache jusqu'à la prochaine modification de la Serie
     """
 
-    def __init__(self, data: Union[range, List[Any]], name: str = None) -> Any:
+    def __init__(
+        self,
+        data: Union[range, List[Any], np.ndarray],
+        name: str = None,
+        dtype: Any = None,
+        mask: np.ndarray = None,
+        categories: np.ndarray = None,
+        strings: np.ndarray = None,
+    ) -> Any:
         """
         Fonction __init__ permettant de créer une nouvelle instance de la classe Series
 
+        Les valeurs sont stockées dans un buffer numpy contigu et typé
+        (int64, float64, bool, datetime64 ou object en dernier recours)
+        accompagné d'un masque de validité pour les valeurs manquantes.
+        Une Serie catégorielle stocke le code entier de chaque valeur dans un
+        dictionnaire de valeurs distinctes (type object). Une Serie de chaînes stocke
+        ses valeurs dans un buffer UTF-8 contigu et la position (début, taille) de chacune
+
         Parameters
         ----------
         data : list:
-            Les données qui peuvent être un range ou bien une liste d'élements
+            Les données qui peuvent être un range, une liste d'élements ou un tableau numpy
         name : str
             Le nom qui sera attribué à la série (Valeur None par défaut)
+        dtype : str | np.dtype
+            Le type du buffer, déduit des données s'il n'est pas précisé
+        mask : np.ndarray
+            Masque de validité (True si la valeur est présente), None si aucune valeur ne manque
+        categories : np.ndarray
+            Le dictionnaire des valeurs distinctes d'une Serie catégorielle, data étant
+            alors le tableau des codes
+        strings : np.ndarray
+            Le buffer d'octets UTF-8 d'une Serie de chaînes, data étant alors
+            le tableau des positions (type `SPAN_DTYPE`)
 
         Returns
         -------
@@ -38,16 +226,179 @@ class Series:
             Paramètre data non conforme.
         """
 
-        if isinstance(data, range) or isinstance(data, list):
-            self.data = list(data)
-            self.index = range(len(data))
+        if isinstance(data, (range, list, np.ndarray)):
+            self._values, self._mask = _build_buffer(data, dtype)
+            self._categories = categories
+            self._strings = strings
+            if mask is not None:
+                self._mask = None if mask.all() else mask
+            # Le type d'une Serie typée ou explicitement fournie n'a plus à être inféré
+            self._inferred = dtype is not None or self._values.dtype != object
+            # Un tableau numpy reçu peut être partagé : il sera copié avant toute écriture
+            self._shared = isinstance(data, np.ndarray)
+            # Statistiques calculées à la demande, valables pour une version des données
+            self._version = 0
+            self._stats_version = 0
+            self._stats = {"null_count": 0} if self._mask is None else {}
+            self.index = range(len(self._values))
             self.name = name
         else:
             logging.exception(
-                f"Type attendu : {range} ou {list}. Type reçu : {type(data)}"
+                f"Type attendu : {range}, {list} ou {np.ndarray}. Type reçu : {type(data)}"
             )
             raise AttributeError
 
+    @property
+    def data(self) -> List[Any]:
+        """
+        Propriété retournant les valeurs de la Serie sous forme de liste Python,
+        les valeurs manquantes étant représentées par None
+
+        Returns
+        -------
+        list
+            Les valeurs de la Serie
+        """
+        values = self.values.tolist()
+        if self._mask is not None:
+            for position in np.flatnonzero(~self._mask).tolist():
+                values[position] = None
+        return values
+
+    @data.setter
+    def data(self, data: Union[range, List[Any], np.ndarray]) -> None:
+        """
+        Setter remplaçant les valeurs de la Serie par de nouvelles données
+
+        Parameters
+        ----------
+        data : list:
+            Les nouvelles données de la Serie
+        """
+        self._values, self._mask = _build_buffer(data)
+        self._categories = None
+        self._strings = None
+        self._inferred = self._values.dtype != object
+        self._shared = isinstance(data, np.ndarray)
+        self._version += 1
+        self.index = range(len(self._values))
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Propriété retournant le buffer numpy typé de la Serie (sans copie). Il doit être
+        considéré en lecture seule : les modifications passent par la Serie, qui tient
+        ainsi à jour ses statistiques. Les valeurs d'une Serie catégorielle ou de chaînes
+        sont décodées dans un nouveau tableau object
+
+        Returns
+        -------
+        np.ndarray
+            Le buffer des valeurs
+        """
+        if not self._encoded():
+            return self._values
+        values = self._decode(self._values)
+        if self._mask is not None:
+            values[~self._mask] = None
+        return values
+
+    def _encoded(self) -> bool:
+        """
+        Indique si le buffer de la Serie est encodé (codes ou positions de chaînes)
+        """
+        return self._categories is not None or self._strings is not None
+
+    def _decode(self, buffer: np.ndarray) -> np.ndarray:
+        """
+        Décode une partie du buffer d'une Serie catégorielle ou de chaînes
+        """
+        if self._categories is not None:
+            return self._categories[buffer]
+        if self._strings is not None:
+            return decode_strings(self._strings, buffer)
+        return buffer
+
+    @property
+    def categories(self) -> Optional[np.ndarray]:
+        """
+        Propriété retournant le dictionnaire des valeurs distinctes d'une Serie
+        catégorielle, None pour une autre Serie
+
+        Returns
+        -------
+        np.ndarray
+            Les valeurs distinctes, indexées par leur code
+        """
+        return self._categories
+
+    @property
+    def codes(self) -> Optional[np.ndarray]:
+        """
+        Propriété retournant le buffer des codes entiers d'une Serie catégorielle
+        (position de chaque valeur dans `categories`), None pour une autre Serie
+
+        Returns
+        -------
+        np.ndarray
+            Les codes, quelconques aux positions manquantes
+        """
+        return self._values if self._categories is not None else None
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        Propriété retournant le type des données stockées dans la Serie
+        (object pour une Serie catégorielle ou de chaînes)
+
+        Returns
+        -------
+        np.dtype
+            Le type du buffer
+        """
+        if self._encoded():
+            return np.dtype(object)
+        return self._values.dtype
+
+    def _validity(self) -> np.ndarray:
+        """
+        Retourne le masque de validité complet de la Serie
+        """
+        if self._mask is None:
+            return np.ones(len(self._values), dtype=bool)
+        return self._mask
+
+    def _valid_values(self) -> np.ndarray:
+        """
+        Retourne les valeurs présentes (non manquantes) de la Serie
+        """
+        if self._mask is None:
+            return self.values
+        return self.values[self._mask]
+
+    def _materialize(self) -> None:
+        """
+        Remplace le buffer encodé d'une Serie catégorielle ou de chaînes
+        par ses valeurs décodées
+        """
+        if self._encoded():
+            self._values = self.values
+            self._categories = None
+            self._strings = None
+            self._shared = False
+
+    def _sort_buffer(self) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Retourne le buffer et le masque utilisés pour trier la Serie, le buffer d'une
+        Serie catégorielle étant le rang de la valeur de chaque code
+        """
+        if self._strings is not None:
+            return self.values, self._mask
+        if self._categories is None:
+            return self._values, self._mask
+        _, ranks = np.unique(self._categories, return_inverse=True)
+        return ranks.ravel()[self._values], self._mask
+
     def set_name(self, name: str) -> Any:
         """
         Setter permettant de définir l'attribut name de la classe Series
@@ -82,19 +433,235 @@ class Series:
             Paramètre index non conforme.
         """
 
-        if isinstance(index, int):
-            return self.data[index]
+        if isinstance(index, (int, np.integer)):
+            if self._mask is not None and not self._mask[index]:
+                return None
+            if self._encoded():
+                return self._decode(self._values[[index]])[0]
+            return _to_python(self._values[index])
         elif isinstance(index, slice):
-            return Series(
-                data=self.data[index],
+            # Vue partageant le buffer de la Serie : aucune copie avant une écriture
+            serie = Series(
+                data=self._values[index],
                 name=self.name if self.name is not None else "Undefined",
+                mask=self._mask[index] if self._mask is not None else None,
+                categories=self._categories,
+                strings=self._strings,
             )
+            serie._inferred = self._inferred
+            self._shared = True
+            return serie
         else:
-            logging.exception(
-                logging.ERROR, f"Type attendu : {slice} ou {int}. Reçu : {type(index)}"
-            )
+            logging.exception(f"Type attendu : {slice} ou {int}. Reçu : {type(index)}")
+            raise AttributeError
+
+    def __setitem__(self, index: Union[slice, int], value: Any) -> None:
+        """
+        Fonction permettant de modifier un ou plusieurs éléments d'une Serie.
+        Si le buffer est partagé avec une autre Serie (vue), il est d'abord copié
+        afin que l'écriture ne soit visible que dans cette Serie
+
+        Parameters
+        ----------
+        index : slice | int:
+            L'index ou le slice d'index qui sera modifié
+        value : Any
+            La nouvelle valeur, None pour une valeur manquante
+
+        Raises
+        ------
+        AttributeError
+            Paramètre index non conforme.
+        """
+        if not isinstance(index, (int, np.integer, slice)):
+            logging.exception(f"Type attendu : {slice} ou {int}. Reçu : {type(index)}")
             raise AttributeError
 
+        if self._strings is not None or (
+            self._categories is not None and not isinstance(value, (str, type(None)))
+        ):
+            self._materialize()
+        if self._shared:
+            self._values = self._values.copy()
+            self._mask = self._mask.copy() if self._mask is not None else None
+            self._shared = False
+        self._version += 1
+
+        if value is None:
+            if self._mask is None:
+                self._mask = np.ones(len(self._values), dtype=bool)
+            self._mask[index] = False
+            return
+
+        if self._categories is not None:
+            # Une valeur absente est ajoutée à une copie du dictionnaire, partagé
+            # avec les vues de la Serie
+            found = np.flatnonzero(self._categories == value)
+            if len(found) == 0:
+                self._categories = np.append(
+                    self._categories, np.array([value], object)
+                )
+                found = [len(self._categories) - 1]
+            value = found[0]
+        else:
+            kind = _kind_of(type(value))
+            if kind not in ASSIGNABLE_KINDS.get(self.dtype.kind, set()):
+                dtype = _dtype_of({kind, self.dtype.kind})
+                self._values = self._values.astype(dtype)
+        self._values[index] = value
+        if self._mask is not None:
+            self._mask[index] = True
+
+    def take(
+        self, positions: Union[List[int], np.ndarray], allow_fill: bool = False
+    ) -> Any:
+        """
+        Récupère les éléments situés aux positions données en un seul passage vectorisé
+
+        Parameters
+        ----------
+        positions : list | np.ndarray:
+            Les positions des éléments à récupérer
+        allow_fill : bool
+            Si vrai, la position -1 produit une valeur manquante
+
+        Returns
+        -------
+        Series
+            Nouvel objet de type Series de même type et de même nom
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        mask = self._mask[positions] if self._mask is not None else None
+        if allow_fill:
+            missing = positions < 0
+            if missing.any():
+                mask = ~missing if mask is None else mask & ~missing
+                positions = np.where(missing, 0, positions)
+        dtype = self._values.dtype
+        if len(self._values) == 0:
+            values = np.full(len(positions), FILL_VALUES[dtype.kind], dtype)
+        else:
+            values = self._values[positions]
+        serie = Series(
+            data=values,
+            name=self.name,
+            dtype=dtype,
+            mask=mask,
+            categories=self._categories,
+            strings=self._strings,
+        )
+        serie._inferred = self._inferred
+        return serie
+
+    def is_sorted(self) -> bool:
+        """
+        Indique si une Serie sans valeur manquante est triée par ordre croissant.
+        Le résultat est conservé en cache, et connu sans calcul après `sort_values`
+
+        Returns
+        -------
+        bool
+            Vrai si la Serie est triée
+        """
+        values = self._values
+        if self._mask is not None or self.dtype == object:
+            return False
+        return self._statistic(
+            "sorted", lambda: bool(np.all(values[:-1] <= values[1:]))
+        )
+
+    def argsort(self, ascending: bool = True, na_position: str = "last") -> Any:
+        """
+        Calcule les positions des éléments dans l'ordre trié, par un tri stable
+        sur le buffer typé de la Serie
+
+        Parameters
+        ----------
+        ascending : bool
+            Ordre croissant `vrai par défaut`
+        na_position : str
+            La position des valeurs manquantes (first ou last) `last par défaut`
+
+        Returns
+        -------
+        Series
+            Les positions des éléments triés
+
+        Raises
+        ------
+        ValueError
+            Position des valeurs manquantes non conforme
+        TypeError
+            Valeurs non ordonnables entre elles
+        """
+        check_na_position(na_position)
+        order = lexsort_indexer([self._sort_buffer()], [ascending], na_position)
+        return Series(data=order, name=self.name, dtype=np.int64)
+
+    def sort_values(self, ascending: bool = True, na_position: str = "last") -> Any:
+        """
+        Trie les éléments d'une Serie (tri stable : les éléments égaux restent
+        dans leur ordre d'origine)
+
+        Parameters
+        ----------
+        ascending : bool
+            Ordre croissant `vrai par défaut`
+        na_position : str
+            La position des valeurs manquantes (first ou last) `last par défaut`
+
+        Returns
+        -------
+        Series
+            Nouvel objet de type Series trié
+
+        Raises
+        ------
+        ValueError
+            Position des valeurs manquantes non conforme
+        TypeError
+            Valeurs non ordonnables entre elles
+        """
+        serie = self.take(self.argsort(ascending, na_position).values)
+        if ascending:
+            # Les jointures par fusion n'ont pas à vérifier l'ordre de la Serie
+            serie._statistic("sorted", lambda: True)
+        return serie
+
+    def nsmallest(self, n: int = 5) -> Any:
+        """
+        Récupère les `n` plus petits éléments présents d'une Serie, triés, par une
+        sélection partielle plutôt qu'un tri complet. À égalité, le premier élément l'emporte
+
+        Parameters
+        ----------
+        n : int
+            Le nombre d'éléments `5 par défaut`
+
+        Returns
+        -------
+        Series
+            Les plus petits éléments
+        """
+        return self.take(smallest_indexer([self._sort_buffer()], n))
+
+    def nlargest(self, n: int = 5) -> Any:
+        """
+        Récupère les `n` plus grands éléments présents d'une Serie, triés par ordre
+        décroissant (voir `nsmallest`)
+
+        Parameters
+        ----------
+        n : int
+            Le nombre d'éléments `5 par défaut`
+
+        Returns
+        -------
+        Series
+            Les plus grands éléments
+        """
+        return self.take(smallest_indexer([self._sort_buffer()], n, largest=True))
+
     @property
     def iloc(self) -> Any:
         """
@@ -117,39 +684,189 @@ class Series:
         int
             Le nombre d'éléments de la serie
         """
-        return len(self.data)
+        return len(self._values)
+
+    def _statistic(self, name: Any, compute: Callable[[], Any]) -> Any:
+        """
+        Retourne une statistique du cache, calculée au premier appel. Le cache est vidé
+        dès que le numéro de version des données a changé (écriture dans la Serie)
+        """
+        if self._stats_version != self._version:
+            self._stats = {}
+            self._stats_version = self._version
+        if name not in self._stats:
+            self._stats[name] = compute()
+        return self._stats[name]
+
+    def null_count(self) -> int:
+        """
+        Récupère le nombre de valeurs manquantes d'une Serie (mis en cache)
+
+        Returns
+        -------
+        int
+            Le nombre de valeurs manquantes
+        """
+        return self._statistic(
+            "null_count",
+            lambda: 0
+            if self._mask is None
+            else len(self._mask) - int(np.count_nonzero(self._mask)),
+        )
+
+    def _moments(self) -> Dict[str, Any]:
+        """
+        Calcule la somme, la moyenne et la somme des carrés des écarts à la moyenne
+        des valeurs présentes d'une Serie numérique. Une grande Serie est réduite
+        par morceaux en parallèle (voir `tree_reduce`)
+        """
+        values = self._values
+        mask = self._mask
+        dtype = np.float64 if values.dtype.kind == "f" else np.int64
+
+        def reduce_chunk(start: int, end: int) -> Tuple[int, Any, float]:
+            chunk = values[start:end]
+            where = mask[start:end] if mask is not None else True
+            present = (
+                len(chunk) if mask is None else int(np.count_nonzero(mask[start:end]))
+            )
+            if present == 0:
+                return 0, 0, 0.0
+            total = _to_python(np.sum(chunk, where=where, dtype=dtype))
+            deviations = chunk - total / present
+            np.multiply(deviations, deviations, out=deviations)
+            return present, total, float(np.sum(deviations, where=where))
+
+        present, total, m2 = tree_reduce(reduce_chunk, merge_moments, len(values))
+        return {"sum": total, "mean": total / present, "m2": m2}
+
+    def _reduce(
+        self, how: str, skipna: bool, min_count: int, ddof: int = 0
+    ) -> Optional[Any]:
+        """
+        Réduit la Serie en un scalaire en un passage vectorisé, les valeurs manquantes
+        étant exclues par le masque de validité (paramètre where des réductions numpy)
+        plutôt que par une copie des valeurs présentes. Retourne None s'il y a moins de
+        `min_count` valeurs présentes, ou une valeur manquante avec `skipna=False`.
+        Les résultats sont conservés dans le cache de statistiques de la Serie
+        """
+        present = len(self._values) - self.null_count()
+        if not skipna and present < len(self._values):
+            return None
+        minimum = 1 if how != "sum" else 0
+        if present < max(min_count, minimum) or (how == "std" and present <= ddof):
+            return None
+        if how == "sum" and present == 0:
+            return 0
+
+        values = self._values
+        where = self._mask if self._mask is not None else True
+        if self.dtype.kind in ("b", "i", "f"):
+            if how in ("sum", "mean", "std"):
+                moments = self._statistic("moments", self._moments)
+                if how == "std":
+                    return math.sqrt(moments["m2"] / (present - ddof))
+                return moments[how]
+            if values.dtype.kind == "b":
+                initial = how == "min"
+            elif values.dtype.kind == "i":
+                info = np.iinfo(values.dtype)
+                initial = info.max if how == "min" else info.min
+            else:
+                initial = np.inf if how == "min" else -np.inf
+            reduction = np.min if how == "min" else np.max
+
+            def reduce_chunk(start: int, end: int) -> Any:
+                chunk_where = where if self._mask is None else where[start:end]
+                return reduction(values[start:end], where=chunk_where, initial=initial)
+
+            return self._statistic(
+                how,
+                lambda: _to_python(
+                    tree_reduce(reduce_chunk, min if how == "min" else max, len(values))
+                ),
+            )
+
+        # Dates et objets : réduction sur les seules valeurs présentes
+        reductions = {"min": np.min, "max": np.max, "sum": np.sum, "mean": np.mean}
+
+        def compute() -> Any:
+            present_values = self._valid_values()
+            if how == "std":
+                return _to_python(np.std(present_values, ddof=ddof))
+            return _to_python(reductions[how](present_values))
+
+        return self._statistic((how, ddof), compute)
+
+    def sum(self, skipna: bool = True, min_count: int = 0) -> Any:
+        """
+        Récupère la somme des éléments présents d'une Serie
+
+        Parameters
+        ----------
+        skipna : bool
+            Si faux, la somme est manquante dès qu'une valeur l'est
+        min_count : int
+            Le nombre minimal de valeurs présentes, la somme étant manquante en deçà
+
+        Returns
+        -------
+        int | float
+            La somme (0 pour une Serie vide), None si elle est manquante
+        """
+        return self._reduce("sum", skipna, min_count)
 
-    def min(self) -> int:
+    def min(self, skipna: bool = True, min_count: int = 0) -> Any:
         """
         Récupère le plus petit élément présent dans une Serie
 
+        Parameters
+        ----------
+        skipna : bool
+            Si faux, le résultat est manquant dès qu'une valeur l'est
+        min_count : int
+            Le nombre minimal de valeurs présentes, le résultat étant manquant en deçà
+
         Returns
         -------
         int
-            L'élement le plus petit
+            L'élement le plus petit, None si aucune valeur n'est présente
         """
-        if isinstance(self.data, list):
-            return min(self.data)
+        return self._reduce("min", skipna, min_count)
 
-    def max(self) -> int:
+    def max(self, skipna: bool = True, min_count: int = 0) -> Any:
         """
         Récupère le plus grand élément présent dans une Serie
 
+        Parameters
+        ----------
+        skipna : bool
+            Si faux, le résultat est manquant dès qu'une valeur l'est
+        min_count : int
+            Le nombre minimal de valeurs présentes, le résultat étant manquant en deçà
+
         Returns
         -------
         int
-            L'élement le plus grand
+            L'élement le plus grand, None si aucune valeur n'est présente
         """
-        return max(self.data)
+        return self._reduce("max", skipna, min_count)
 
-    def mean(self) -> float:
+    def mean(self, skipna: bool = True, min_count: int = 0) -> float:
         """
         Récupère la moyenne des éléments d'une Serie
 
+        Parameters
+        ----------
+        skipna : bool
+            Si faux, le résultat est manquant dès qu'une valeur l'est
+        min_count : int
+            Le nombre minimal de valeurs présentes, le résultat étant manquant en deçà
+
         Returns
         -------
         float
-            La moyenne des éléments de l'instance Serie
+            La moyenne des éléments de l'instance Serie, None si aucune valeur n'est présente
 
         Raises
         ------
@@ -158,21 +875,28 @@ class Series:
         """
 
         try:
-            return np.mean(self.data)
+            return self._reduce("mean", skipna, min_count)
         except Exception as e:
-            logging.exception(
-                logging.ERROR, f"La moyenne ne peut pas être calculé car : {e}"
-            )
+            logging.exception(f"La moyenne ne peut pas être calculé car : {e}")
             raise e
 
-    def std(self) -> float:
+    def std(self, skipna: bool = True, min_count: int = 0, ddof: int = 0) -> float:
         """
         Récupère l'écart-type des éléments d'une Serie
 
+        Parameters
+        ----------
+        skipna : bool
+            Si faux, le résultat est manquant dès qu'une valeur l'est
+        min_count : int
+            Le nombre minimal de valeurs présentes, le résultat étant manquant en deçà
+        ddof : int
+            Le nombre de degrés de liberté retranché au dénominateur `0 par défaut`
+
         Returns
         -------
         float
-            L'écart-type des éléments de l'instance Serie
+            L'écart-type des éléments de l'instance Serie, None si aucune valeur n'est présente
 
         Raises
         ------
@@ -181,70 +905,943 @@ class Series:
         """
 
         try:
-            return np.std(self.data)
+            return self._reduce("std", skipna, min_count, ddof)
         except Exception as e:
-            logging.exception(
-                logging.ERROR, f"L'écart-type ne peut pas être calculé car : {e}"
-            )
+            logging.exception(f"L'écart-type ne peut pas être calculé car : {e}")
             raise e
 
-    def __str__(self) -> str:
+    def nunique(self, approx: bool = False) -> int:
         """
-        Redéfinition de la méthode __str__ permettant de formatter l'affichage de l'instance d'une classe Series
+        Récupère le nombre de valeurs distinctes présentes dans une Serie (mis en cache).
+        Le calcul exact trie les valeurs (ou compte les codes utilisés d'une Serie
+        catégorielle) ; le calcul approché remplit un HyperLogLog par morceau de
+        la Serie, fusionnés ensuite, en mémoire constante (erreur d'environ 1 %)
+
+        Parameters
+        ----------
+        approx : bool
+            Estimation par un sketch HyperLogLog (voir `HyperLogLog`)
 
         Returns
         -------
-        str
-            Une chaîne de caractères correspondant à l'instance de la classe Series
+        int
+            Le nombre de valeurs distinctes
         """
-        str_builder = ["{}\t{}".format(i, val) for i, val in enumerate(self.data)]
-        str_builder.append(f"Name: {self.name}, dtype: {type(self.data[0])}")
-        return "\n".join(str_builder)
+        if approx:
 
-    def __len__(self) -> int:
+            def sketch_chunk(start: int, end: int) -> HyperLogLog:
+                return HyperLogLog().update(self[start:end])
+
+            return self._statistic(
+                "approx_nunique",
+                lambda: tree_reduce(
+                    sketch_chunk, HyperLogLog.merge, len(self._values)
+                ).estimate(),
+            )
+
+        def compute() -> int:
+            if self._categories is not None:
+                codes = self._values if self._mask is None else self._values[self._mask]
+                used = np.bincount(codes, minlength=len(self._categories))
+                return int(np.count_nonzero(used))
+            present = self._valid_values()
+            if present.dtype == object:
+                return len(set(present.tolist()))
+            return len(np.unique(present))
+
+        return self._statistic("nunique", compute)
+
+    def quantile(
+        self, q: Union[float, List[float]] = 0.5, approx: bool = False
+    ) -> Union[float, List[float]]:
         """
-        Redéfinition de la méthode __len__ permettant d'utiliser len() pour une instance de la classe Series
+        Récupère un ou plusieurs quantiles des valeurs présentes d'une Serie numérique.
+        Le calcul exact interpole linéairement entre les valeurs triées ; le calcul
+        approché remplit un sketch KLL par morceau de la Serie, fusionnés ensuite, en
+        mémoire bornée (erreur de rang d'environ 0.2 %)
+
+        Parameters
+        ----------
+        q : float | list
+            La fraction ou les fractions des quantiles, entre 0 et 1 `0.5 par défaut`
+        approx : bool
+            Estimation par un sketch de quantiles (voir `QuantileSketch`)
 
         Returns
         -------
-        int
-            Le nombre d'élements
-        """
-        return self.count()
+        float | list
+            Le ou les quantiles, None si aucune valeur n'est présente
 
-    def __eq__(self, other) -> bool:
+        Raises
+        ------
+        TypeError
+            La Serie n'est pas numérique
+        ValueError
+            Fraction en dehors de [0, 1]
         """
-        Redéfinition de la méthode __eq__ permettant de comparer deux instances de la classe Serie
+        if self.dtype.kind not in ("b", "i", "f"):
+            logging.exception(f"Serie numérique attendue. Type reçu : {self.dtype}")
+            raise TypeError
+        fractions = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        if ((fractions < 0) | (fractions > 1)).any():
+            logging.exception(f"Fraction de quantile attendue dans [0, 1]. Reçu : {q}")
+            raise ValueError
+        if approx:
 
-        Returns
+            def sketch_chunk(start: int, end: int) -> QuantileSketch:
+                return QuantileSketch().update(self[start:end])
+
+            sketch = tree_reduce(sketch_chunk, QuantileSketch.merge, len(self._values))
+            return sketch.quantile(q)
+        present = self._valid_values()
+        if not len(present):
+            results = [None] * len(fractions)
+        else:
+            results = np.quantile(present.astype(np.float64), fractions).tolist()
+        return results if np.ndim(q) else results[0]
+
+    def __str__(self) -> str:
+        """
+        Redéfinition de la méthode __str__ permettant de formatter l'affichage de l'instance d'une classe Series
+
+        Returns
+        -------
+        str
+            Une chaîne de caractères correspondant à l'instance de la classe Series
+        """
+        str_builder = ["{}\t{}".format(i, val) for i, val in enumerate(self.data)]
+        str_builder.append(f"Name: {self.name}, dtype: {self.dtype}")
+        return "\n".join(str_builder)
+
+    def __len__(self) -> int:
+        """
+        Redéfinition de la méthode __len__ permettant d'utiliser len() pour une instance de la classe Series
+
+        Returns
+        -------
+        int
+            Le nombre d'élements
+        """
+        return self.count()
+
+    def equals(self, other: Any) -> bool:
+        """
+        Indique si deux Series sont identiques : même nom, même taille, mêmes positions
+        manquantes et mêmes valeurs présentes
+
+        Parameters
+        ----------
+        other : Series
+            La Serie comparée
+
+        Returns
         -------
         bool
             True or False
         """
-        return self.data == other.data and self.name == other.name
+        if not isinstance(other, Series):
+            return False
+        if self.name != other.name or len(self) != len(other):
+            return False
+        if not np.array_equal(self._validity(), other._validity()):
+            return False
+        try:
+            return bool(np.array_equal(self._valid_values(), other._valid_values()))
+        except (TypeError, ValueError):
+            return self.data == other.data
+
+    def __eq__(self, other) -> Any:
+        """
+        Redéfinition de l'opérateur == élément par élément, avec une Serie de même taille
+        ou un scalaire diffusé sur toute la Serie (voir `eq`, et `equals` pour comparer
+        deux Series dans leur ensemble)
+
+        Returns
+        -------
+        Series
+            Le masque booléen des éléments égaux
+        """
+        return self.eq(other)
+
+    def __ne__(self, other) -> Any:
+        """
+        Redéfinition de l'opérateur != élément par élément (voir `ne`)
+
+        Returns
+        -------
+        Series
+            Le masque booléen des éléments différents
+        """
+        return self.ne(other)
+
+    def __bool__(self) -> bool:
+        """
+        Une Serie n'a pas de valeur de vérité : deux Series se comparent dans leur
+        ensemble par `equals`
+
+        Raises
+        ------
+        ValueError
+            Valeur de vérité d'une Serie
+        """
+        logging.exception(
+            "La valeur de vérité d'une Serie est ambiguë : utiliser equals() pour "
+            "comparer deux Series"
+        )
+        raise ValueError
+
+    def _operand(self, other: Any) -> Tuple[Optional[np.ndarray], Any]:
+        """
+        Retourne le masque des positions où la Serie et l'opérande sont présents (None si
+        aucune valeur ne manque), ainsi que l'opérande (buffer d'une Serie ou scalaire
+        converti au type de la Serie)
+
+        Raises
+        ------
+        ValueError
+            Les deux Series n'ont pas la même taille
+        """
+        if isinstance(other, np.ndarray):
+            other = Series(data=other)
+        if isinstance(other, Series):
+            if len(other) != len(self):
+                logging.exception(
+                    f"Tailles de Series différentes : {len(self)} et {len(other)}"
+                )
+                raise ValueError
+            if self._mask is None or other._mask is None:
+                valid = self._mask if other._mask is None else other._mask
+            else:
+                valid = self._mask & other._mask
+            return valid, other.values
+        if other is None:
+            return np.zeros(len(self._values), dtype=bool), other
+        if self.dtype.kind == "M" and isinstance(other, (date, datetime)):
+            other = np.datetime64(other)
+        return self._mask, other
+
+    def _compare(self, other: Any, compare: Callable[[Any, Any], Any]) -> Any:
+        """
+        Compare élément par élément la Serie à une autre Serie ou à un scalaire en un
+        passage vectorisé. Une position où l'un des deux opérandes est manquant donne False,
+        de même que deux valeurs non comparables d'une colonne object. Une Serie
+        catégorielle est comparée à un scalaire sur son seul dictionnaire, et l'égalité
+        d'une Serie de chaînes à une chaîne est évaluée sur son buffer d'octets
+
+        Raises
+        ------
+        TypeError
+            Opérandes de types non comparables
+        """
+        if self._categories is not None and not isinstance(
+            other, (Series, np.ndarray, type(None))
+        ):
+            # Une seule comparaison par valeur distincte, propagée aux lignes par les codes
+            categories = Series(data=self._categories)._compare(other, compare)
+            result = categories.values[self._values]
+            if self._mask is not None:
+                result &= self._mask
+            return Series(data=result, name=self.name, dtype=bool)
+        if (
+            self._strings is not None
+            and isinstance(other, str)
+            and compare in (operator.eq, operator.ne)
+        ):
+            result = equals(self._strings, self._values, other.encode("utf-8"))
+            if compare is operator.ne:
+                result = ~result
+            if self._mask is not None:
+                result &= self._mask
+            return Series(data=result, name=self.name, dtype=bool)
+
+        valid, right = self._operand(other)
+        valid = valid if valid is not None else slice(None)
+        left = self.values[valid]
+        if isinstance(right, np.ndarray):
+            right = right[valid]
+        result = np.zeros(len(self._values), dtype=bool)
+        if left.dtype == object or getattr(right, "dtype", None) == object:
+            pairs = (
+                zip(left.tolist(), right.tolist())
+                if isinstance(right, np.ndarray)
+                else ((element, right) for element in left.tolist())
+            )
+
+            def safe(pair: Tuple[Any, Any]) -> bool:
+                try:
+                    return bool(compare(*pair))
+                except TypeError:
+                    return False
+
+            result[valid] = np.fromiter(map(safe, pairs), dtype=bool, count=len(left))
+        else:
+            try:
+                result[valid] = compare(left, right)
+            except TypeError as te:
+                logging.exception(
+                    f"Comparaison impossible entre {self.dtype} et {type(other)}"
+                )
+                raise te
+        return Series(data=result, name=self.name, dtype=bool)
+
+    def eq(self, other: Any) -> Any:
+        """
+        Compare élément par élément la Serie à une Serie ou à un scalaire (==)
+
+        Parameters
+        ----------
+        other : Series | Any
+            La Serie de même taille ou le scalaire comparé
+
+        Returns
+        -------
+        Series
+            Le masque booléen des éléments égaux
+        """
+        return self._compare(other, operator.eq)
+
+    def ne(self, other: Any) -> Any:
+        """
+        Compare élément par élément la Serie à une Serie ou à un scalaire (!=),
+        une valeur manquante n'étant jamais différente
+
+        Returns
+        -------
+        Series
+            Le masque booléen des éléments différents
+        """
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur < élément par élément
+
+        Returns
+        -------
+        Series
+            Le masque booléen des éléments strictement inférieurs
+        """
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur <= élément par élément
+
+        Returns
+        -------
+        Series
+            Le masque booléen des éléments inférieurs ou égaux
+        """
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur > élément par élément
+
+        Returns
+        -------
+        Series
+            Le masque booléen des éléments strictement supérieurs
+        """
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur >= élément par élément
+
+        Returns
+        -------
+        Series
+            Le masque booléen des éléments supérieurs ou égaux
+        """
+        return self._compare(other, operator.ge)
+
+    def isin(self, values: List[Any]) -> Any:
+        """
+        Indique pour chaque élément s'il appartient à une collection de valeurs
+
+        Parameters
+        ----------
+        values : list:
+            Les valeurs recherchées
+
+        Returns
+        -------
+        Series
+            Le masque booléen des éléments présents dans la collection
+        """
+        candidates = np.empty(len(values), dtype=object)
+        candidates[:] = [
+            np.datetime64(value)
+            if self.dtype.kind == "M" and isinstance(value, (date, datetime))
+            else value
+            for value in values
+        ]
+        if self.dtype != object:
+            candidates = np.asarray(candidates.tolist())
+        if self._categories is not None:
+            result = np.isin(self._categories, candidates)[self._values]
+            if self._mask is not None:
+                result &= self._mask
+            return Series(data=result, name=self.name, dtype=bool)
+        valid = self._validity()
+        result = np.zeros(len(self._values), dtype=bool)
+        result[valid] = np.isin(self.values[valid], candidates)
+        return Series(data=result, name=self.name, dtype=bool)
+
+    def isna(self) -> Any:
+        """
+        Indique pour chaque élément s'il est manquant
+
+        Returns
+        -------
+        Series
+            Le masque booléen des valeurs manquantes
+        """
+        return Series(data=~self._validity(), name=self.name, dtype=bool)
+
+    def notna(self) -> Any:
+        """
+        Indique pour chaque élément s'il est présent
+
+        Returns
+        -------
+        Series
+            Le masque booléen des valeurs présentes
+        """
+        return Series(data=self._validity().copy(), name=self.name, dtype=bool)
+
+    def _mask_values(self) -> np.ndarray:
+        """
+        Retourne le buffer d'une Serie booléenne, une valeur manquante valant False
+
+        Raises
+        ------
+        TypeError
+            La Serie n'est pas booléenne
+        """
+        if self.dtype.kind != "b":
+            logging.exception(f"Serie booléenne attendue. Type reçu : {self.dtype}")
+            raise TypeError
+        if self._mask is None:
+            return self._values
+        return self._values & self._mask
+
+    def _logical(self, other: Any, combine: Callable[[Any, Any], Any]) -> Any:
+        """
+        Combine élément par élément deux masques booléens (ou un masque et un booléen)
+        """
+        if isinstance(other, Series):
+            if len(other) != len(self):
+                logging.exception(
+                    f"Tailles de Series différentes : {len(self)} et {len(other)}"
+                )
+                raise ValueError
+            other = other._mask_values()
+        elif not isinstance(other, (bool, np.bool_)):
+            logging.exception(
+                f"Type attendu : {Series} ou {bool}. Reçu : {type(other)}"
+            )
+            raise TypeError
+        return Series(
+            data=combine(self._mask_values(), other), name=self.name, dtype=bool
+        )
+
+    def __and__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur & (et logique) entre masques booléens
+
+        Returns
+        -------
+        Series
+            Le masque booléen combiné
+        """
+        return self._logical(other, np.logical_and)
+
+    def __or__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur | (ou logique) entre masques booléens
+
+        Returns
+        -------
+        Series
+            Le masque booléen combiné
+        """
+        return self._logical(other, np.logical_or)
+
+    def __xor__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur ^ (ou exclusif) entre masques booléens
+
+        Returns
+        -------
+        Series
+            Le masque booléen combiné
+        """
+        return self._logical(other, np.logical_xor)
 
-    def __iter__(self):
+    def __invert__(self) -> Any:
         """
-        Redéfinition de la méthode __iter__ permettant d'itérer sur chaque élément d'une Serie
+        Redéfinition de l'opérateur ~ (négation) d'un masque booléen, une valeur
+        manquante devenant True
+
         Returns
         -------
         Series
-            self (L'instance par laquelle la méthode a été appelée)
+            Le masque booléen inversé
+        """
+        return Series(data=~self._mask_values(), name=self.name, dtype=bool)
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    # Les opérations entre un tableau numpy et une Serie sont confiées à la Serie
+    __array_ufunc__ = None
+
+    def _arithmetic(self, other: Any, ufunc: np.ufunc, reflected: bool = False) -> Any:
+        """
+        Applique une opération arithmétique élément par élément entre la Serie et une
+        autre Serie de même taille, un tableau numpy ou un scalaire (diffusé), en un
+        passage vectorisé sur les buffers. Une position où l'un des opérandes est
+        manquant, ou une division entière (//, %) par zéro, donne une valeur manquante
+
+        Raises
+        ------
+        TypeError
+            Opérandes de types incompatibles
+        """
+        valid, right = self._operand(other)
+        left = self.values
+        if left.dtype.kind == "b":
+            left = left.astype(np.int64)
+        if isinstance(right, np.ndarray) and right.dtype.kind == "b":
+            right = right.astype(np.int64)
+        elif isinstance(right, (bool, np.bool_)):
+            right = int(right)
+        if right is None:
+            return Series(
+                data=self.values.copy(),
+                name=self.name,
+                dtype=self.dtype,
+                mask=np.zeros(len(self._values), dtype=bool),
+            )
+
+        try:
+            if left.dtype == object or getattr(right, "dtype", None) == object:
+                # Opérations Python limitées aux positions présentes
+                present = valid if valid is not None else slice(None)
+                result = np.empty(len(left), dtype=object)
+                right = right[present] if isinstance(right, np.ndarray) else right
+                operands = (
+                    (right, left[present]) if reflected else (left[present], right)
+                )
+                result[present] = ufunc(*operands)
+            else:
+                operands = (right, left) if reflected else (left, right)
+                with np.errstate(all="ignore"):
+                    result = ufunc(*operands)
+                if result.dtype.kind == "i":
+                    valid = _nonzero_divisors(valid, operands[1], ufunc, len(result))
+        except TypeError as te:
+            logging.exception(
+                f"Opération {ufunc.__name__} impossible entre {self.dtype} et {type(other)}"
+            )
+            raise te
+
+        mask = None
+        if valid is not None and not valid.all():
+            mask = valid.copy()
+            if result.dtype.kind in FILL_VALUES and result.dtype != object:
+                result[~valid] = FILL_VALUES[result.dtype.kind]
+        serie = Series(data=result, name=self.name, dtype=result.dtype, mask=mask)
+        # Le buffer résultat appartient à la nouvelle Serie : pas de copie à l'écriture
+        serie._shared = False
+        return serie
+
+    def _inplace(self, other: Any, ufunc: np.ufunc) -> Any:
+        """
+        Applique une opération arithmétique en écrivant directement dans le buffer de la
+        Serie (après copie s'il est partagé). Si le type du résultat ne tient pas dans
+        le buffer (entier divisé, par exemple), un nouveau buffer est alloué. Une
+        division entière par zéro donne une valeur manquante
         """
-        self.index = 0
+        self._materialize()
+        valid, right = self._operand(other)
+        if self._shared:
+            self._values = self._values.copy()
+            self._mask = self._mask.copy() if self._mask is not None else None
+            self._shared = False
+        self._version += 1
+        if self.dtype.kind not in ("i", "f") or right is None:
+            result = self._arithmetic(other, ufunc)
+            self._values, self._mask = result._values, result._mask
+            return self
+        if self.dtype.kind == "i":
+            valid = _nonzero_divisors(valid, right, ufunc, len(self._values))
+        try:
+            with np.errstate(all="ignore"):
+                ufunc(self._values, right, out=self._values, casting="same_kind")
+        except TypeError:
+            result = self._arithmetic(other, ufunc)
+            self._values, self._mask = result._values, result._mask
+            return self
+        if valid is None or valid is self._mask:
+            return self
+        if self._mask is not None:
+            np.logical_and(self._mask, valid, out=self._mask)
+        elif not valid.all():
+            self._mask = valid.copy()
+        if self._mask is not None:
+            self._values[~self._mask] = FILL_VALUES[self.dtype.kind]
         return self
 
-    def __next__(self) -> Any:
+    def __add__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur + élément par élément, avec une Serie de même taille
+        ou un scalaire diffusé sur toute la Serie
+
+        Returns
+        -------
+        Series
+            La Serie résultat, manquante là où l'un des opérandes l'est
+        """
+        return self._arithmetic(other, np.add)
+
+    def __sub__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur - élément par élément
+
+        Returns
+        -------
+        Series
+            La Serie résultat
+        """
+        return self._arithmetic(other, np.subtract)
+
+    def __mul__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur * élément par élément
+
+        Returns
+        -------
+        Series
+            La Serie résultat
+        """
+        return self._arithmetic(other, np.multiply)
+
+    def __truediv__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur / élément par élément, une division par zéro
+        donnant inf ou nan
+
+        Returns
+        -------
+        Series
+            La Serie résultat (flottante)
+        """
+        return self._arithmetic(other, np.true_divide)
+
+    def __floordiv__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur // élément par élément
+
+        Returns
+        -------
+        Series
+            La Serie résultat
+        """
+        return self._arithmetic(other, np.floor_divide)
+
+    def __mod__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur % élément par élément
+
+        Returns
+        -------
+        Series
+            La Serie résultat
+        """
+        return self._arithmetic(other, np.remainder)
+
+    def __pow__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur ** élément par élément
+
+        Returns
+        -------
+        Series
+            La Serie résultat
+        """
+        return self._arithmetic(other, np.power)
+
+    def __radd__(self, other: Any) -> Any:
+        return self._arithmetic(other, np.add, reflected=True)
+
+    def __rsub__(self, other: Any) -> Any:
+        return self._arithmetic(other, np.subtract, reflected=True)
+
+    def __rmul__(self, other: Any) -> Any:
+        return self._arithmetic(other, np.multiply, reflected=True)
+
+    def __rtruediv__(self, other: Any) -> Any:
+        return self._arithmetic(other, np.true_divide, reflected=True)
+
+    def __rfloordiv__(self, other: Any) -> Any:
+        return self._arithmetic(other, np.floor_divide, reflected=True)
+
+    def __rmod__(self, other: Any) -> Any:
+        return self._arithmetic(other, np.remainder, reflected=True)
+
+    def __rpow__(self, other: Any) -> Any:
+        return self._arithmetic(other, np.power, reflected=True)
+
+    def __iadd__(self, other: Any) -> Any:
+        """
+        Redéfinition de l'opérateur += écrivant dans le buffer existant sans allocation
+
+        Returns
+        -------
+        Series
+            L'instance modifiée
+        """
+        return self._inplace(other, np.add)
+
+    def __isub__(self, other: Any) -> Any:
+        return self._inplace(other, np.subtract)
+
+    def __imul__(self, other: Any) -> Any:
+        return self._inplace(other, np.multiply)
+
+    def __itruediv__(self, other: Any) -> Any:
+        return self._inplace(other, np.true_divide)
+
+    def __ifloordiv__(self, other: Any) -> Any:
+        return self._inplace(other, np.floor_divide)
+
+    def __imod__(self, other: Any) -> Any:
+        return self._inplace(other, np.remainder)
+
+    def __ipow__(self, other: Any) -> Any:
+        return self._inplace(other, np.power)
+
+    def _unary(self, ufunc: np.ufunc, *args: Any) -> Any:
         """
-        Redéfinition de la méthode __next__ permettant de passer à la valeur suivant d'un DataFrame
+        Applique une fonction mathématique à chaque valeur présente en un passage vectorisé
+
         Raises
+        ------
+        TypeError
+            La Serie n'est pas numérique
+        """
+        values = self.values
+        if values.dtype.kind == "b":
+            values = values.astype(np.int64)
+        if values.dtype.kind not in ("i", "f"):
+            logging.exception(f"Serie numérique attendue. Type reçu : {self.dtype}")
+            raise TypeError
+        with np.errstate(all="ignore"):
+            result = ufunc(values, *args)
+        mask = self._mask.copy() if self._mask is not None else None
+        if mask is not None:
+            result[~mask] = FILL_VALUES[result.dtype.kind]
+        serie = Series(data=result, name=self.name, dtype=result.dtype, mask=mask)
+        serie._shared = False
+        return serie
+
+    def __neg__(self) -> Any:
+        """
+        Redéfinition de l'opérateur - unaire
+
+        Returns
         -------
-        StopIteration
-            Arrêt de la boucle lorsque l'index est supérieur au nombre d'éléments
+        Series
+            La Serie opposée
         """
-        if self.index >= len(self.data):
-            raise StopIteration
-        else:
-            element = self.iloc[self.index]
-            self.index += 1
-            return element
+        return self._unary(np.negative)
+
+    def __pos__(self) -> Any:
+        return self._unary(np.positive)
+
+    def __abs__(self) -> Any:
+        """
+        Redéfinition de abs() élément par élément
+
+        Returns
+        -------
+        Series
+            La Serie des valeurs absolues
+        """
+        return self._unary(np.absolute)
+
+    def abs(self) -> Any:
+        """
+        Calcule la valeur absolue de chaque élément
+
+        Returns
+        -------
+        Series
+            La Serie des valeurs absolues
+        """
+        return self._unary(np.absolute)
+
+    def sqrt(self) -> Any:
+        """
+        Calcule la racine carrée de chaque élément (nan pour une valeur négative)
+
+        Returns
+        -------
+        Series
+            La Serie des racines carrées
+        """
+        return self._unary(np.sqrt)
+
+    def exp(self) -> Any:
+        """
+        Calcule l'exponentielle de chaque élément
+
+        Returns
+        -------
+        Series
+            La Serie des exponentielles
+        """
+        return self._unary(np.exp)
+
+    def log(self) -> Any:
+        """
+        Calcule le logarithme népérien de chaque élément (nan ou -inf hors du domaine)
+
+        Returns
+        -------
+        Series
+            La Serie des logarithmes
+        """
+        return self._unary(np.log)
+
+    def round(self, decimals: int = 0) -> Any:
+        """
+        Arrondit chaque élément au nombre de décimales donné
+
+        Parameters
+        ----------
+        decimals : int
+            Le nombre de décimales `0 par défaut`
+
+        Returns
+        -------
+        Series
+            La Serie arrondie
+        """
+        return self._unary(np.round, decimals)
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Redéfinition de la méthode __iter__ permettant d'itérer sur chaque élément d'une Serie.
+        Chaque appel retourne un nouvel itérateur indépendant qui ne modifie pas la Serie,
+        les valeurs étant converties par blocs depuis le buffer
+
+        Returns
+        -------
+        Iterator
+            Un itérateur sur les valeurs de la Serie (None pour une valeur manquante)
+        """
+        return self._iter_values()
+
+    def _iter_values(self) -> Iterator[Any]:
+        """
+        Générateur convertissant le buffer en valeurs Python par blocs de taille fixe
+        """
+        for start in range(0, len(self._values), ITER_BLOCK_SIZE):
+            block = self._decode(self._values[start : start + ITER_BLOCK_SIZE])
+            block = block.tolist()
+            if self._mask is not None:
+                valid = self._mask[start : start + ITER_BLOCK_SIZE]
+                for position in np.flatnonzero(~valid).tolist():
+                    block[position] = None
+            yield from block
+
+    def rolling(self, window: int, min_periods: int = None) -> Rolling:
+        """
+        Retourne les calculs par fenêtre glissante (count, sum, mean, std, min, max)
+        de la Serie, chacun en O(n) quelle que soit la taille de la fenêtre
+
+        Parameters
+        ----------
+        window : int
+            Le nombre de valeurs consécutives de chaque fenêtre
+        min_periods : int
+            Le nombre minimal de valeurs présentes dans une fenêtre, le résultat étant
+            manquant en deçà (taille de la fenêtre par défaut)
+
+        Returns
+        -------
+        Rolling
+            Les fenêtres de la Serie
+
+        Raises
+        ------
+        TypeError
+            La Serie n'est pas numérique
+        ValueError
+            Taille de fenêtre ou nombre minimal non conforme
+        """
+        return Rolling(self, window, min_periods)
+
+    def expanding(self, min_periods: int = 1) -> Rolling:
+        """
+        Retourne les calculs par fenêtre croissante (de la première valeur à chaque
+        position) de la Serie, avec les mêmes statistiques que `rolling`
+
+        Parameters
+        ----------
+        min_periods : int
+            Le nombre minimal de valeurs présentes dans une fenêtre
+
+        Returns
+        -------
+        Rolling
+            Les fenêtres de la Serie
+
+        Raises
+        ------
+        TypeError
+            La Serie n'est pas numérique
+        """
+        return Rolling(self, None, min_periods)
+
+    # Défini en dernier : le nom masque le type str dans le corps de la classe
+    @property
+    def str(self) -> StringMethods:
+        """
+        Propriété retournant l'accesseur des opérations vectorisées sur les chaînes
+        de caractères (contains, startswith, lower, len, split)
+
+        Returns
+        -------
+        StringMethods
+            L'accesseur de la Serie
+
+        Raises
+        ------
+        TypeError
+            La Serie ne contient pas des chaînes de caractères
+        """
+        return StringMethods(self)
+
+    @property
+    def dt(self) -> DatetimeMethods:
+        """
+        Propriété retournant l'accesseur des opérations vectorisées sur les dates
+        (year, month, day, hour, floor)
+
+        Returns
+        -------
+        DatetimeMethods
+            L'accesseur de la Serie
+
+        Raises
+        ------
+        TypeError
+            La Serie ne contient pas des dates
+        """
+        return DatetimeMethods(self)
@@ -0,0 +1,433 @@
+import logging
+import math
+from typing import Any
+from typing import List
+from typing import Union
+
+import numpy as np
+
+from src.strings import encode_strings
+from src.strings import hash_strings
+
+logging.basicConfig(level=logging.INFO)
+
+# Précision (log2 du nombre de registres) par défaut d'un HyperLogLog : 16 Ko,
+# erreur relative d'environ 1.04 / sqrt(2 ** 14) = 0.8 %
+HLL_PRECISION = 14
+HLL_PRECISIONS = range(4, 19)
+# Précision des HyperLogLog calculés par groupe (1 Ko par groupe, erreur d'environ 3 %)
+GROUP_HLL_PRECISION = 10
+# Nombre d'éléments conservés par le niveau supérieur d'un sketch de quantiles
+# (erreur de rang de l'ordre de 0.2 %, environ 8 Ko)
+KLL_CAPACITY = 1000
+# Familles de types dont les quantiles sont estimés
+QUANTILE_KINDS = ("b", "i", "f")
+# Décroissance de la capacité des niveaux inférieurs d'un sketch de quantiles
+KLL_DECAY = 2 / 3
+
+# Constantes du mélangeur splitmix64
+GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+MIX_MULTIPLIERS = (np.uint64(0xBF58476D1CE4E5B9), np.uint64(0x94D049BB133111EB))
+
+
+def mix(hashes: np.ndarray) -> np.ndarray:
+    """
+    Mélange des entiers de 64 bits (finaliseur splitmix64) pour que chaque bit
+    du résultat dépende de tous les bits de l'entrée
+    """
+    mixed = hashes.astype(np.uint64) + GOLDEN_GAMMA
+    mixed ^= mixed >> np.uint64(30)
+    mixed *= MIX_MULTIPLIERS[0]
+    mixed ^= mixed >> np.uint64(27)
+    mixed *= MIX_MULTIPLIERS[1]
+    mixed ^= mixed >> np.uint64(31)
+    return mixed
+
+
+def _object_hashes(values: np.ndarray) -> np.ndarray:
+    """
+    Hache des valeurs object par leur représentation textuelle (voir `hash_strings`)
+    """
+    texts = [value if isinstance(value, str) else str(value) for value in values]
+    return hash_strings(*encode_strings(texts))
+
+
+def hash_values(serie: Any) -> np.ndarray:
+    """
+    Calcule un hachage de 64 bits, identique d'un processus à l'autre, de chaque valeur
+    présente d'une Serie : sur la représentation binaire du buffer typé, sur les octets
+    d'une colonne de chaînes, et sur les seules valeurs distinctes d'une Serie catégorielle.
+    Des valeurs égales ont le même hachage quel que soit leur stockage (entier ou flottant,
+    unité des dates, chaînes catégorielles ou non)
+
+    Parameters
+    ----------
+    serie : Series
+        La Serie
+
+    Returns
+    -------
+    np.ndarray
+        Le hachage (uint64) de chaque valeur présente, dans l'ordre de la Serie
+    """
+    valid = serie._mask if serie._mask is not None else slice(None)
+    buffer = serie._values[valid]
+    if serie._strings is not None:
+        hashes = hash_strings(serie._strings, buffer)
+    elif serie._categories is not None:
+        hashes = _object_hashes(serie._categories)[buffer]
+    elif buffer.dtype.kind == "O":
+        hashes = _object_hashes(buffer)
+    elif buffer.dtype.kind == "M":
+        hashes = buffer.astype("datetime64[us]").view(np.uint64)
+    else:
+        # Les entiers et booléens sont hachés comme les flottants égaux, et -0.0 comme 0.0
+        hashes = (buffer.astype(np.float64) + 0.0).view(np.uint64)
+    return mix(hashes)
+
+
+def _leading_zeros(words: np.ndarray) -> np.ndarray:
+    """
+    Compte les bits nuls de poids fort d'entiers de 64 bits non nuls, chaque moitié
+    de 32 bits étant convertie exactement en flottant (exposant de np.frexp)
+    """
+    high = (words >> np.uint64(32)).astype(np.float64)
+    low = (words & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    high_zeros = 32 - np.frexp(high)[1]
+    low_zeros = 64 - np.frexp(low)[1]
+    return np.where(high > 0, high_zeros, low_zeros)
+
+
+def _register_updates(hashes: np.ndarray, precision: int) -> Any:
+    """
+    Retourne le registre et le rang (position du premier bit à 1 des bits restants)
+    de chaque hachage. Un bit sentinelle borne le rang à 64 - precision + 1
+    """
+    shift = np.uint64(64 - precision)
+    registers = (hashes >> shift).astype(np.intp)
+    remaining = (hashes << np.uint64(precision)) | np.uint64(1 << (precision - 1))
+    return registers, (_leading_zeros(remaining) + 1).astype(np.uint8)
+
+
+def estimate_cardinality(registers: np.ndarray) -> np.ndarray:
+    """
+    Estime le nombre de valeurs distinctes à partir des registres d'un ou plusieurs
+    HyperLogLog (une ligne par sketch), avec la correction de comptage linéaire
+    des petites cardinalités
+
+    Parameters
+    ----------
+    registers : np.ndarray
+        Les registres (uint8), de dernière dimension 2 ** precision
+
+    Returns
+    -------
+    np.ndarray
+        L'estimation (float64) de chaque sketch
+    """
+    size = registers.shape[-1]
+    alpha = 0.7213 / (1 + 1.079 / size)
+    raw = alpha * size * size / np.sum(np.ldexp(1.0, -registers.astype(np.int64)), -1)
+    zeros = np.count_nonzero(registers == 0, axis=-1)
+    with np.errstate(divide="ignore"):
+        linear = size * np.log(size / np.maximum(zeros, 1))
+    return np.where((raw <= 2.5 * size) & (zeros > 0), linear, raw)
+
+
+def group_cardinalities(
+    hashes: np.ndarray, group: np.ndarray, ngroups: int, precision: int
+) -> np.ndarray:
+    """
+    Estime le nombre de valeurs distinctes de chaque groupe en un passage : les
+    registres des HyperLogLog de tous les groupes forment une matrice mise à jour
+    par un maximum indexé
+
+    Parameters
+    ----------
+    hashes : np.ndarray
+        Les hachages des valeurs (voir `hash_values`)
+    group : np.ndarray
+        Le code de groupe de chaque valeur
+    ngroups : int
+        Le nombre de groupes
+    precision : int
+        La précision des HyperLogLog
+
+    Returns
+    -------
+    np.ndarray
+        L'estimation (float64) de chaque groupe
+    """
+    size = 1 << precision
+    registers = np.zeros(ngroups * size, dtype=np.uint8)
+    positions, ranks = _register_updates(hashes, precision)
+    np.maximum.at(registers, group * size + positions, ranks)
+    return estimate_cardinality(registers.reshape(ngroups, size))
+
+
+class HyperLogLog:
+    """
+    Sketch HyperLogLog estimant le nombre de valeurs distinctes en mémoire constante
+    (2 ** precision registres d'un octet). Deux sketches de même précision se combinent
+    par le maximum de leurs registres : le sketch de plusieurs morceaux (chunks d'un
+    fichier, groupes...) est la fusion de leurs sketches
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION) -> None:
+        """
+        Fonction __init__ permettant de créer un sketch vide
+
+        Parameters
+        ----------
+        precision : int
+            Le log2 du nombre de registres, entre 4 et 18 `14 par défaut`
+
+        Raises
+        ------
+        ValueError
+            Précision non conforme
+        """
+        if precision not in HLL_PRECISIONS:
+            logging.exception(
+                f"Précision attendue entre {HLL_PRECISIONS.start} et "
+                f"{HLL_PRECISIONS.stop - 1}. Reçu : {precision}"
+            )
+            raise ValueError
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, serie: Any) -> Any:
+        """
+        Ajoute au sketch les valeurs présentes d'une Serie
+
+        Parameters
+        ----------
+        serie : Series
+            La Serie
+
+        Returns
+        -------
+        HyperLogLog
+            Le sketch mis à jour
+        """
+        positions, ranks = _register_updates(hash_values(serie), self.precision)
+        np.maximum.at(self.registers, positions, ranks)
+        return self
+
+    def merge(self, other: Any) -> Any:
+        """
+        Fusionne un autre sketch dans celui-ci
+
+        Parameters
+        ----------
+        other : HyperLogLog
+            Le sketch fusionné, de même précision
+
+        Returns
+        -------
+        HyperLogLog
+            Le sketch mis à jour
+
+        Raises
+        ------
+        ValueError
+            Précisions différentes
+        """
+        if other.precision != self.precision:
+            logging.exception(
+                f"Précision attendue : {self.precision}. Reçu : {other.precision}"
+            )
+            raise ValueError
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> int:
+        """
+        Estime le nombre de valeurs distinctes ajoutées au sketch
+
+        Returns
+        -------
+        int
+            Le nombre estimé de valeurs distinctes
+        """
+        return int(round(float(estimate_cardinality(self.registers))))
+
+
+class QuantileSketch:
+    """
+    Sketch KLL estimant les quantiles d'une distribution en mémoire bornée. Les valeurs
+    sont rangées par niveaux, un élément du niveau h représentant 2 ** h valeurs : un
+    niveau plein est trié et un élément sur deux est promu au niveau supérieur. Deux
+    sketches de même capacité se combinent par la concaténation de leurs niveaux
+    """
+
+    def __init__(self, capacity: int = KLL_CAPACITY) -> None:
+        """
+        Fonction __init__ permettant de créer un sketch vide
+
+        Parameters
+        ----------
+        capacity : int
+            Le nombre d'éléments du niveau supérieur `1000 par défaut`, l'erreur
+            de rang décroissant avec la capacité
+
+        Raises
+        ------
+        ValueError
+            Capacité non conforme
+        """
+        if not isinstance(capacity, int) or capacity < 2:
+            logging.exception(
+                f"Capacité entière d'au moins 2 attendue. Reçu : {capacity}"
+            )
+            raise ValueError
+        self.capacity = capacity
+        self.count = 0
+        self.levels = []
+        self._offsets = []
+        self._min = math.inf
+        self._max = -math.inf
+
+    def _level_capacity(self, level: int) -> int:
+        """
+        Retourne la capacité d'un niveau, décroissante sous le niveau supérieur
+        """
+        depth = len(self.levels) - 1 - level
+        return max(2, math.ceil(self.capacity * KLL_DECAY**depth))
+
+    def _add_level(self) -> None:
+        """
+        Ajoute un niveau vide au-dessus des niveaux existants
+        """
+        self.levels.append(np.empty(0, dtype=np.float64))
+        self._offsets.append(0)
+
+    def _compress(self) -> None:
+        """
+        Compacte les niveaux pleins, du plus bas au plus haut : les éléments d'un
+        niveau sont triés et un sur deux (en alternant le premier retenu d'un
+        compactage à l'autre) est promu au niveau supérieur
+        """
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._level_capacity(level):
+                items = np.sort(items)
+                offset = self._offsets[level]
+                self._offsets[level] = 1 - offset
+                # Un nombre impair d'éléments laisse un élément au niveau courant
+                if len(items) % 2:
+                    kept, items = (
+                        (items[-1:], items[:-1]) if offset else (items[:1], items[1:])
+                    )
+                else:
+                    kept = items[:0]
+                if level + 1 == len(self.levels):
+                    self._add_level()
+                promoted = items[offset::2]
+                self.levels[level + 1] = np.concatenate(
+                    [self.levels[level + 1], promoted]
+                )
+                self.levels[level] = kept
+            level += 1
+
+    def update(self, serie: Any) -> Any:
+        """
+        Ajoute au sketch les valeurs présentes d'une Serie numérique
+
+        Parameters
+        ----------
+        serie : Series
+            La Serie
+
+        Returns
+        -------
+        QuantileSketch
+            Le sketch mis à jour
+
+        Raises
+        ------
+        TypeError
+            La Serie n'est pas numérique
+        """
+        if serie.dtype.kind not in QUANTILE_KINDS:
+            logging.exception(f"Serie numérique attendue. Type reçu : {serie.dtype}")
+            raise TypeError
+        values = serie._values if serie._mask is None else serie._values[serie._mask]
+        values = values.astype(np.float64)
+        if not len(values):
+            return self
+        if not self.levels:
+            self._add_level()
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += len(values)
+        self._min = min(self._min, float(values.min()))
+        self._max = max(self._max, float(values.max()))
+        self._compress()
+        return self
+
+    def merge(self, other: Any) -> Any:
+        """
+        Fusionne un autre sketch dans celui-ci
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            Le sketch fusionné, de même capacité
+
+        Returns
+        -------
+        QuantileSketch
+            Le sketch mis à jour
+
+        Raises
+        ------
+        ValueError
+            Capacités différentes
+        """
+        if other.capacity != self.capacity:
+            logging.exception(
+                f"Capacité attendue : {self.capacity}. Reçu : {other.capacity}"
+            )
+            raise ValueError
+        while len(self.levels) < len(other.levels):
+            self._add_level()
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._compress()
+        return self
+
+    def quantile(self, q: Union[float, List[float]]) -> Any:
+        """
+        Estime un ou plusieurs quantiles : l'élément dont le rang pondéré (chaque
+        élément du niveau h comptant pour 2 ** h valeurs) atteint la fraction demandée.
+        Les quantiles 0 et 1 sont le minimum et le maximum exacts
+
+        Parameters
+        ----------
+        q : float | list
+            La fraction ou les fractions des quantiles, entre 0 et 1
+
+        Returns
+        -------
+        float | list
+            Le ou les quantiles estimés, None si le sketch est vide
+        """
+        fractions = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        if self.count == 0:
+            results = [None] * len(fractions)
+        else:
+            items = np.concatenate(self.levels)
+            weights = np.concatenate(
+                [np.full(len(level), 1 << h) for h, level in enumerate(self.levels)]
+            )
+            order = np.argsort(items, kind="stable")
+            ranks = np.cumsum(weights[order])
+            positions = np.searchsorted(ranks, fractions * ranks[-1], side="left")
+            results = items[order][np.minimum(positions, len(items) - 1)]
+            results = np.where(fractions <= 0, self._min, results)
+            results = np.where(fractions >= 1, self._max, results).tolist()
+        return results if np.ndim(q) else results[0]
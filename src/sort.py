@@ -0,0 +1,158 @@
+import logging
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+logging.basicConfig(level=logging.INFO)
+
+NA_POSITIONS = ("first", "last")
+
+# Une clé de tri : le buffer typé d'une Serie et son masque de validité
+Key = Tuple[np.ndarray, Optional[np.ndarray]]
+
+
+def check_na_position(na_position: str) -> None:
+    """
+    Vérifie la position des valeurs manquantes demandée pour un tri
+
+    Raises
+    ------
+    ValueError
+        Position non conforme
+    """
+    if na_position not in NA_POSITIONS:
+        logging.exception(
+            f"Position attendue : {' ou '.join(NA_POSITIONS)}. Reçu : {na_position}"
+        )
+        raise ValueError
+
+
+def sort_key(key: Key, ascending: bool = True) -> np.ndarray:
+    """
+    Convertit le buffer d'une Serie en un tableau numérique dont l'ordre croissant est l'ordre
+    de tri demandé. L'ordre décroissant est obtenu sans dépassement par le complément
+    binaire des entiers et des dates et par l'opposé des flottants ; une colonne object
+    est remplacée par le rang de ses valeurs. La valeur aux positions manquantes
+    est quelconque
+
+    Parameters
+    ----------
+    key : tuple:
+        Le buffer typé et le masque de validité de la Serie triée
+    ascending : bool
+        Ordre croissant
+
+    Returns
+    -------
+    np.ndarray
+        La clé de tri
+
+    Raises
+    ------
+    TypeError
+        Valeurs non ordonnables entre elles
+    """
+    values, mask = key
+    if values.dtype == object:
+        valid = mask if mask is not None else slice(None)
+        ranks = np.zeros(len(values), dtype=np.int64)
+        try:
+            _, inverse = np.unique(values[valid], return_inverse=True)
+        except TypeError:
+            logging.exception("Les valeurs triées ne sont pas ordonnables entre elles")
+            raise TypeError
+        ranks[valid] = inverse.ravel()
+        return ranks if ascending else -ranks
+    if values.dtype.kind == "M":
+        values = values.view(np.int64)
+    if ascending:
+        return values
+    return -values if values.dtype.kind == "f" else ~values
+
+
+def lexsort_indexer(
+    keys: List[Key], ascending: List[bool], na_position: str = "last"
+) -> np.ndarray:
+    """
+    Calcule l'ordre stable des lignes triées selon plusieurs clés, la première
+    étant la plus significative. Chaque clé est triée sur son buffer typé (voir `sort_key`),
+    un indicateur de valeur manquante plus significatif que la clé plaçant les valeurs
+    manquantes en tête ou en fin quel que soit le sens du tri
+
+    Parameters
+    ----------
+    keys : list:
+        Les clés (buffer typé et masque de validité de chaque Serie)
+    ascending : list:
+        Le sens du tri de chaque clé
+    na_position : str
+        La position des valeurs manquantes (first ou last)
+
+    Returns
+    -------
+    np.ndarray
+        Les positions des lignes dans l'ordre trié
+    """
+    if len(keys) == 1:
+        mask = keys[0][1]
+        values = sort_key(keys[0], ascending[0])
+        if mask is None:
+            return np.argsort(values, kind="stable")
+        present = np.flatnonzero(mask)
+        order = present[np.argsort(values[present], kind="stable")]
+        missing = np.flatnonzero(~mask)
+        parts = [order, missing] if na_position == "last" else [missing, order]
+        return np.concatenate(parts)
+
+    # Tris stables successifs de la clé la moins significative à la plus significative
+    # (plus rapide que np.lexsort), l'ordre courant étant conservé à égalité
+    order = None
+    for key, direction in zip(reversed(keys), reversed(ascending)):
+        values = sort_key(key, direction)
+        if order is None:
+            order = np.argsort(values, kind="stable")
+        else:
+            order = order[np.argsort(values[order], kind="stable")]
+        if key[1] is not None:
+            missing = ~key[1] if na_position == "last" else key[1]
+            order = order[np.argsort(missing[order], kind="stable")]
+    return order
+
+
+def smallest_indexer(keys: List[Key], n: int, largest: bool = False) -> np.ndarray:
+    """
+    Retourne les positions des `n` plus petites (ou plus grandes) lignes selon les
+    clés, sans trier toutes les lignes : une sélection partielle sur la première clé
+    retient les candidats (égalités comprises) qui sont seuls triés. Les lignes dont
+    la première clé est manquante sont exclues et, à égalité, la première ligne l'emporte
+
+    Parameters
+    ----------
+    keys : list:
+        Les clés (buffer typé et masque de validité), la première étant la plus significative
+    n : int
+        Le nombre de lignes retenues
+    largest : bool
+        Sélection des plus grandes lignes
+
+    Returns
+    -------
+    np.ndarray
+        Les positions des lignes retenues, dans l'ordre trié
+    """
+    ascending = [not largest] * len(keys)
+    values, mask = keys[0]
+    present = np.arange(len(values)) if mask is None else np.flatnonzero(mask)
+    if n <= 0:
+        return present[:0]
+    if n < len(present):
+        first = sort_key(keys[0], ascending[0])[present]
+        threshold = np.partition(first, n - 1)[n - 1]
+        present = present[first <= threshold]
+    candidates = [
+        (key_values[present], key_mask[present] if key_mask is not None else None)
+        for key_values, key_mask in keys
+    ]
+    return present[lexsort_indexer(candidates, ascending)[:n]]
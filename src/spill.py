@@ -0,0 +1,163 @@
+import logging
+import math
+import os
+from typing import List
+
+import numpy as np
+
+from src.binary import read_binary
+from src.binary import write_binary
+from src.executor import get_option
+from src.series import Series
+from src.sketches import hash_values
+from src.sketches import mix
+
+logging.basicConfig(level=logging.INFO)
+
+# Mémoire de travail d'un groupby ou d'une jointure (codes, tris, tables, copies des clés)
+# rapportée à la taille de ses données
+SPILL_FACTOR = 3
+# Nombre maximal de partitions écrites sur disque par un groupby ou une jointure
+MAX_SPILL_PARTITIONS = 1024
+# Taille estimée d'une valeur Python d'une colonne object
+OBJECT_ITEM_SIZE = 64
+# Hachage des clés manquantes, placées ensemble dans une même partition
+MISSING_HASH = np.uint64(0)
+# Multiplicateur combinant les hachages de plusieurs clés
+KEY_MULTIPLIER = np.uint64(0x100000001B3)
+
+
+def memory_usage(serie: Series) -> int:
+    """
+    Estime la mémoire (en octets) occupée par une Serie : buffer typé, masque,
+    buffer UTF-8 ou dictionnaire, et valeurs Python d'une colonne object
+    """
+    nbytes = serie._values.nbytes
+    if serie._mask is not None:
+        nbytes += serie._mask.nbytes
+    if serie._strings is not None:
+        nbytes += serie._strings.nbytes
+    if serie._categories is not None:
+        nbytes += len(serie._categories) * OBJECT_ITEM_SIZE
+    elif serie._values.dtype == object:
+        nbytes += len(serie._values) * OBJECT_ITEM_SIZE
+    return nbytes
+
+
+def spill_partitions(series: List[Series]) -> int:
+    """
+    Retourne le nombre de partitions nécessaires pour que la mémoire de travail d'un
+    groupby ou d'une jointure sur ces Series tienne dans le budget mémoire (option
+    `memory_limit`), 1 s'il n'y a pas de budget ou si tout tient en mémoire. Une
+    partition contient au moins une ligne
+
+    Raises
+    ------
+    ValueError
+        Budget mémoire trop faible : plus de `MAX_SPILL_PARTITIONS` partitions nécessaires
+    """
+    limit = get_option("memory_limit")
+    if limit is None:
+        return 1
+    working = SPILL_FACTOR * sum(memory_usage(serie) for serie in series)
+    nrows = max(len(serie) for serie in series) if series else 0
+    npartitions = max(1, min(math.ceil(working / limit), nrows))
+    if npartitions > MAX_SPILL_PARTITIONS:
+        logging.exception(
+            f"Budget mémoire trop faible : {limit} octets pour {working} octets de travail. "
+            f"Budget minimal : {math.ceil(working / MAX_SPILL_PARTITIONS)} octets"
+        )
+        raise ValueError
+    return npartitions
+
+
+def row_hashes(keys: List[Series]) -> np.ndarray:
+    """
+    Calcule un hachage de 64 bits des clés de chaque ligne, égal pour des clés égales
+    quel que soit leur stockage (voir `hash_values`), de sorte que les lignes
+    correspondantes de deux DataFrames tombent dans la même partition
+
+    Parameters
+    ----------
+    keys : list:
+        Les Series clés
+
+    Returns
+    -------
+    np.ndarray
+        Le hachage (uint64) de chaque ligne
+    """
+    combined = np.zeros(len(keys[0]), dtype=np.uint64)
+    for key in keys:
+        hashes = np.full(len(key), MISSING_HASH, dtype=np.uint64)
+        hashes[key._validity()] = hash_values(key)
+        combined = mix(combined * KEY_MULTIPLIER ^ hashes)
+    return combined
+
+
+def partition_rows(keys: List[Series], npartitions: int) -> List[np.ndarray]:
+    """
+    Répartit les lignes en partitions selon le hachage de leurs clés, toutes les lignes
+    de mêmes clés appartenant à la même partition
+
+    Parameters
+    ----------
+    keys : list:
+        Les Series clés
+    npartitions : int
+        Le nombre de partitions
+
+    Returns
+    -------
+    list
+        Les positions (croissantes) des lignes de chaque partition
+    """
+    partitions = (row_hashes(keys) % np.uint64(npartitions)).astype(np.int64)
+    order = np.argsort(partitions, kind="stable")
+    bounds = np.cumsum(np.bincount(partitions, minlength=npartitions))
+    return np.split(order, bounds[:-1])
+
+
+def spill(
+    series: List[Series], partitions: List[np.ndarray], directory: str, prefix: str
+) -> List[str]:
+    """
+    Écrit chaque partition des Series dans un fichier binaire MyBear du répertoire,
+    suivie d'une colonne des positions d'origine de ses lignes
+
+    Parameters
+    ----------
+    series : list:
+        Les Series à partitionner
+    partitions : list:
+        Les positions des lignes de chaque partition (voir `partition_rows`)
+    directory : str
+        Le répertoire des fichiers (temporaire)
+    prefix : str
+        Le préfixe du nom des fichiers
+
+    Returns
+    -------
+    list
+        Le chemin du fichier de chaque partition
+    """
+    paths = []
+    for index, rows in enumerate(partitions):
+        path = os.path.join(directory, f"{prefix}-{index}.mybear")
+        columns = [serie.take(rows) for serie in series]
+        write_binary(columns + [Series(data=rows, dtype=np.int64)], path)
+        paths.append(path)
+    return paths
+
+
+def load(path: str) -> List[Series]:
+    """
+    Relit entièrement en mémoire une partition écrite par `spill` (sans projection
+    du fichier, supprimé à la fin du traitement)
+
+    Returns
+    -------
+    list
+        Les Series de la partition suivies de la Serie des positions d'origine
+    """
+    return read_binary(path, mmap=False)
@@ -0,0 +1,487 @@
+import logging
+from typing import Any
+from typing import List
+from typing import Tuple
+
+import numpy as np
+
+logging.basicConfig(level=logging.INFO)
+
+# Type du buffer d'une colonne de chaînes : position et taille (en octets) de chaque
+# chaîne dans le buffer UTF-8 partagé par la colonne et ses vues
+SPAN_DTYPE = np.dtype([("start", np.int64), ("length", np.int64)])
+# Séparateur utilisé pour encoder une colonne en une seule opération
+SEPARATOR = "\x00"
+# Table de conversion des octets ASCII majuscules en minuscules
+LOWER_TABLE = np.arange(256, dtype=np.uint8)
+LOWER_TABLE[ord("A") : ord("Z") + 1] += ord("a") - ord("A")
+# Multiplicateur (impair) du hachage polynomial des chaînes
+HASH_MULTIPLIER = np.uint64(0x100000001B3)
+
+Strings = Tuple[np.ndarray, np.ndarray]
+
+
+def encode_strings(strings: List[str]) -> Strings:
+    """
+    Encode des chaînes de caractères en un buffer UTF-8 contigu et leurs positions.
+    Les chaînes sont jointes puis encodées en une seule opération, les séparateurs
+    donnant les positions, sans objet intermédiaire par chaîne
+
+    Parameters
+    ----------
+    strings : list:
+        Les chaînes de caractères
+
+    Returns
+    -------
+    tuple
+        Le buffer d'octets et les positions (début, taille) de chaque chaîne
+    """
+    joined = SEPARATOR.join(strings).encode("utf-8")
+    data = np.frombuffer(joined, dtype=np.uint8)
+    ends = np.flatnonzero(data == 0)
+    if len(ends) != max(len(strings) - 1, 0):
+        # Une chaîne contient le séparateur : encodage chaîne par chaîne
+        encoded = [string.encode("utf-8") for string in strings]
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        return data, spans_of(lengths)
+    spans = np.empty(len(strings), dtype=SPAN_DTYPE)
+    if len(strings):
+        starts = np.concatenate([[0], ends + 1])
+        spans["start"] = starts
+        spans["length"] = np.append(ends, len(data)) - starts
+    return data, spans
+
+
+def spans_of(lengths: np.ndarray) -> np.ndarray:
+    """
+    Calcule les positions de chaînes contiguës à partir de leurs tailles en octets
+    """
+    spans = np.empty(len(lengths), dtype=SPAN_DTYPE)
+    spans["length"] = lengths
+    spans["start"] = np.cumsum(lengths) - lengths
+    return spans
+
+
+def spans_from_offsets(offsets: np.ndarray) -> np.ndarray:
+    """
+    Convertit les offsets (n + 1 positions croissantes) de chaînes contiguës en positions
+    """
+    spans = np.empty(len(offsets) - 1, dtype=SPAN_DTYPE)
+    spans["start"] = offsets[:-1]
+    spans["length"] = np.diff(offsets)
+    return spans
+
+
+def offsets_of(spans: np.ndarray) -> np.ndarray:
+    """
+    Convertit les positions de chaînes contiguës depuis le début du buffer (voir `compact`)
+    en offsets (n + 1 positions croissantes)
+    """
+    offsets = np.zeros(len(spans) + 1, dtype=np.int64)
+    np.cumsum(spans["length"], out=offsets[1:])
+    return offsets
+
+
+def decode_strings(data: np.ndarray, spans: np.ndarray) -> np.ndarray:
+    """
+    Décode les chaînes d'un buffer UTF-8 en un tableau object
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Le buffer d'octets
+    spans : np.ndarray
+        Les positions (début, taille) des chaînes
+
+    Returns
+    -------
+    np.ndarray
+        Les chaînes de caractères
+    """
+    raw = data.tobytes()
+    starts = spans["start"].tolist()
+    ends = (spans["start"] + spans["length"]).tolist()
+    values = np.empty(len(spans), dtype=object)
+    values[:] = [raw[a:b].decode("utf-8") for a, b in zip(starts, ends)]
+    return values
+
+
+def compact(data: np.ndarray, spans: np.ndarray) -> Strings:
+    """
+    Copie les seules chaînes référencées (une vue filtrée ou réordonnée peut ne désigner
+    qu'une partie du buffer) dans un nouveau buffer contigu, dans leur ordre
+    """
+    lengths = spans["length"]
+    total = int(lengths.sum())
+    contiguous = spans_of(lengths)
+    if np.array_equal(contiguous["start"], spans["start"]) and total == len(data):
+        return data, spans
+    # Position source de chaque octet : début de sa chaîne plus son rang dans la chaîne
+    shift = np.repeat(spans["start"] - contiguous["start"], lengths)
+    return data[np.arange(total) + shift], contiguous
+
+
+def concat_strings(parts: List[Strings]) -> Strings:
+    """
+    Concatène plusieurs colonnes de chaînes en un seul buffer contigu
+
+    Parameters
+    ----------
+    parts : list:
+        Les buffers et positions de chaque colonne
+
+    Returns
+    -------
+    tuple
+        Le buffer d'octets et les positions des chaînes concaténées
+    """
+    compacted = [compact(data, spans) for data, spans in parts]
+    data = np.concatenate([data for data, _ in compacted])
+    lengths = np.concatenate([spans["length"] for _, spans in compacted])
+    return data, spans_of(lengths)
+
+
+def hash_strings(data: np.ndarray, spans: np.ndarray) -> np.ndarray:
+    """
+    Calcule un hachage polynomial (modulo 2**64) de chaque chaîne, indépendant du
+    processus contrairement à `hash`. Chaque octet est pondéré par une puissance du
+    multiplicateur selon son rang dans sa chaîne, et la somme de chaque chaîne est
+    obtenue par différence d'une somme cumulée sur le buffer (arithmétique modulaire)
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Le buffer d'octets
+    spans : np.ndarray
+        Les positions des chaînes
+
+    Returns
+    -------
+    np.ndarray
+        Le hachage de chaque chaîne (uint64)
+    """
+    data, spans = compact(data, spans)
+    lengths = spans["length"]
+    offsets = offsets_of(spans)
+    powers = np.cumprod(np.full(int(lengths.max(initial=0)), HASH_MULTIPLIER))
+    ranks = np.arange(len(data)) - np.repeat(spans["start"], lengths)
+    terms = (data.astype(np.uint64) + np.uint64(1)) * powers[ranks]
+    sums = np.zeros(len(data) + 1, dtype=np.uint64)
+    np.cumsum(terms, out=sums[1:])
+    return sums[offsets[1:]] - sums[offsets[:-1]] + lengths.astype(np.uint64)
+
+
+def char_lengths(data: np.ndarray, spans: np.ndarray) -> np.ndarray:
+    """
+    Compte les caractères de chaque chaîne : les octets de continuation UTF-8
+    (10xxxxxx) sont exclus par une somme cumulée sur le buffer
+    """
+    starts_char = np.concatenate([[0], np.cumsum((data & 0xC0) != 0x80)])
+    return starts_char[spans["start"] + spans["length"]] - starts_char[spans["start"]]
+
+
+def occurrences(data: np.ndarray, pattern: bytes) -> np.ndarray:
+    """
+    Retourne les positions (croissantes, chevauchements compris) du motif dans le buffer,
+    les candidats retenus sur le premier octet étant vérifiés octet par octet
+    """
+    size = len(pattern)
+    if size == 0 or size > len(data):
+        return np.arange(len(data) + 1) if size == 0 else np.empty(0, np.int64)
+    candidates = np.flatnonzero(data[: len(data) - size + 1] == pattern[0])
+    for offset in range(1, size):
+        candidates = candidates[data[candidates + offset] == pattern[offset]]
+    return candidates
+
+
+def contains(data: np.ndarray, spans: np.ndarray, pattern: bytes) -> np.ndarray:
+    """
+    Indique si chaque chaîne contient le motif : la première occurrence située après
+    le début de la chaîne doit se terminer avant sa fin
+    """
+    found = occurrences(data, pattern)
+    if len(found) == 0:
+        return np.zeros(len(spans), dtype=bool)
+    ends = spans["start"] + spans["length"]
+    first = np.searchsorted(found, spans["start"])
+    exists = first < len(found)
+    position = found[np.minimum(first, len(found) - 1)]
+    return exists & (position + len(pattern) <= ends)
+
+
+def startswith(data: np.ndarray, spans: np.ndarray, prefix: bytes) -> np.ndarray:
+    """
+    Indique si chaque chaîne commence par le préfixe, par comparaison vectorisée
+    de chacun de ses octets
+    """
+    result = spans["length"] >= len(prefix)
+    last = max(len(data) - 1, 0)
+    for offset, byte in enumerate(prefix):
+        if not len(data):
+            break
+        result &= data[np.minimum(spans["start"] + offset, last)] == byte
+    return result
+
+
+def equals(data: np.ndarray, spans: np.ndarray, value: bytes) -> np.ndarray:
+    """
+    Indique si chaque chaîne est égale à la valeur (même taille et même préfixe)
+    """
+    return (spans["length"] == len(value)) & startswith(data, spans, value)
+
+
+def lower(data: np.ndarray, spans: np.ndarray) -> Strings:
+    """
+    Met les chaînes en minuscules : par une table de conversion sur le buffer si tous
+    ses octets sont ASCII, chaîne par chaîne sinon (la taille en octets peut changer)
+    """
+    data, spans = compact(data, spans)
+    if not len(data) or data.max() < 0x80:
+        return LOWER_TABLE[data], spans
+    return encode_strings([s.lower() for s in decode_strings(data, spans).tolist()])
+
+
+def split(
+    data: np.ndarray, spans: np.ndarray, separator: bytes
+) -> Tuple[Strings, np.ndarray]:
+    """
+    Découpe chaque chaîne selon un séparateur. Les morceaux sont des positions
+    dans le buffer compacté, calculées à partir des occurrences du séparateur
+
+    Returns
+    -------
+    tuple
+        Le buffer et les positions des morceaux, et le nombre de morceaux de chaque chaîne
+    """
+    data, spans = compact(data, spans)
+    ends = spans["start"] + spans["length"]
+    found = _separators(data, separator)
+    # Chaque octet appartient à une seule chaîne d'un buffer compacté
+    owners = np.searchsorted(ends, found, side="right")
+    inside = owners < len(spans)
+    inside[inside] &= found[inside] + len(separator) <= ends[owners[inside]]
+    found, owners = found[inside], owners[inside]
+    counts = np.bincount(owners, minlength=len(spans)) + 1
+    # Les morceaux d'une chaîne sont consécutifs dans le buffer : il suffit de trier
+    # ensemble leurs débuts et leurs fins
+    starts = np.sort(np.concatenate([spans["start"], found + len(separator)]))
+    stops = np.sort(np.concatenate([ends, found]))
+    pieces = np.empty(len(starts), dtype=SPAN_DTYPE)
+    pieces["start"] = starts
+    pieces["length"] = stops - starts
+    return (data, pieces), counts
+
+
+def _separators(data: np.ndarray, separator: bytes) -> np.ndarray:
+    """
+    Retourne les positions des occurrences sans chevauchement du séparateur
+    """
+    found = occurrences(data, separator)
+    if len(separator) <= 1 or np.all(np.diff(found) >= len(separator)):
+        return found
+    kept = []
+    following = -1
+    for position in found.tolist():
+        if position >= following:
+            kept.append(position)
+            following = position + len(separator)
+    return np.array(kept, dtype=np.int64)
+
+
+def as_bytes(value: Any, name: str) -> bytes:
+    """
+    Encode en UTF-8 le motif d'une opération sur les chaînes
+
+    Raises
+    ------
+    TypeError
+        Le motif n'est pas une chaîne de caractères
+    """
+    if not isinstance(value, str):
+        logging.exception(f"Chaîne de caractères attendue pour {name}. Reçu : {value}")
+        raise TypeError
+    return value.encode("utf-8")
+
+
+class StringMethods:
+    """
+    Accesseur `.str` des opérations vectorisées sur une Serie de chaînes de caractères.
+    Une Serie de chaînes est traitée directement sur son buffer d'octets, une Serie
+    catégorielle sur son seul dictionnaire (le résultat étant propagé aux lignes par
+    les codes) et une Serie object est d'abord encodée
+    """
+
+    def __init__(self, serie: Any) -> None:
+        """
+        Fonction __init__ permettant de créer l'accesseur d'une Serie
+
+        Parameters
+        ----------
+        serie : Series
+            La Serie de chaînes de caractères
+
+        Raises
+        ------
+        TypeError
+            La Serie ne contient pas des chaînes de caractères
+        """
+        self._serie = serie
+        self._codes = None
+        if serie._strings is not None:
+            self._data, self._spans = serie._strings, serie._values
+            return
+        if serie.dtype != object:
+            logging.exception(f"Serie de chaînes attendue. Type reçu : {serie.dtype}")
+            raise TypeError
+        if serie.categories is not None:
+            strings = serie.categories.tolist()
+            self._codes = serie.codes
+        else:
+            strings = ["" if value is None else value for value in serie.data]
+        try:
+            self._data, self._spans = encode_strings(strings)
+        except TypeError:
+            logging.exception(
+                "La Serie contient des valeurs qui ne sont pas des chaînes"
+            )
+            raise TypeError
+
+    def _rows(self, result: np.ndarray) -> np.ndarray:
+        """
+        Propage aux lignes un résultat calculé sur le dictionnaire d'une Serie catégorielle
+        """
+        if self._codes is None:
+            return result
+        if len(result) == 0:
+            return np.zeros(len(self._codes), dtype=result.dtype)
+        return result[self._codes]
+
+    def _series(self, values: np.ndarray, **kwargs: Any) -> Any:
+        """
+        Construit la Serie résultat, de même nom et de mêmes valeurs manquantes
+        """
+        return type(self._serie)(
+            data=values, name=self._serie.name, mask=self._serie._mask, **kwargs
+        )
+
+    def _predicate(self, result: np.ndarray) -> Any:
+        """
+        Construit le masque booléen résultat, faux aux positions manquantes
+        """
+        result = self._rows(result)
+        if self._serie._mask is not None:
+            result &= self._serie._mask
+        return type(self._serie)(data=result, name=self._serie.name, dtype=bool)
+
+    def len(self) -> Any:
+        """
+        Calcule le nombre de caractères de chaque chaîne
+
+        Returns
+        -------
+        Series
+            Les tailles (int64), manquantes aux positions manquantes
+        """
+        lengths = self._rows(char_lengths(self._data, self._spans))
+        return self._series(lengths, dtype=np.int64)
+
+    def contains(self, pattern: str) -> Any:
+        """
+        Indique pour chaque chaîne si elle contient un motif (recherche littérale)
+
+        Parameters
+        ----------
+        pattern : str
+            Le motif recherché
+
+        Returns
+        -------
+        Series
+            Le masque booléen, faux aux positions manquantes
+
+        Raises
+        ------
+        TypeError
+            Motif non conforme
+        """
+        pattern = as_bytes(pattern, "contains")
+        return self._predicate(contains(self._data, self._spans, pattern))
+
+    def startswith(self, prefix: str) -> Any:
+        """
+        Indique pour chaque chaîne si elle commence par un préfixe
+
+        Parameters
+        ----------
+        prefix : str
+            Le préfixe recherché
+
+        Returns
+        -------
+        Series
+            Le masque booléen, faux aux positions manquantes
+
+        Raises
+        ------
+        TypeError
+            Préfixe non conforme
+        """
+        prefix = as_bytes(prefix, "startswith")
+        return self._predicate(startswith(self._data, self._spans, prefix))
+
+    def lower(self) -> Any:
+        """
+        Met chaque chaîne en minuscules
+
+        Returns
+        -------
+        Series
+            Nouvelle Serie de chaînes
+        """
+        data, spans = lower(self._data, self._spans)
+        return self._series(self._rows(spans), strings=data)
+
+    def split(self, separator: str = " ") -> Any:
+        """
+        Découpe chaque chaîne selon un séparateur littéral
+
+        Parameters
+        ----------
+        separator : str
+            Le séparateur `espace par défaut`
+
+        Returns
+        -------
+        Series
+            La liste des morceaux de chaque chaîne (type object), None aux positions manquantes
+
+        Raises
+        ------
+        TypeError
+            Séparateur non conforme
+        ValueError
+            Séparateur vide
+        """
+        separator = as_bytes(separator, "split")
+        if not separator:
+            logging.exception("Le séparateur de split ne peut pas être vide")
+            raise ValueError
+        (data, pieces), counts = split(self._data, self._spans, separator)
+        words = decode_strings(data, pieces).tolist()
+        bounds = np.cumsum(counts) - counts
+        if self._codes is not None:
+            # Chaque ligne reçoit sa propre liste, modifiable sans effet sur les autres
+            bounds, counts = self._rows(bounds), self._rows(counts)
+        lists = np.fromiter(
+            (
+                words[start : start + count]
+                for start, count in zip(bounds.tolist(), counts.tolist())
+            ),
+            dtype=object,
+            count=len(counts),
+        )
+        if self._serie._mask is not None:
+            lists[~self._serie._mask] = None
+        return type(self._serie)(data=lists, name=self._serie.name, dtype=object)
@@ -0,0 +1,491 @@
+from functools import partial
+import logging
+import math
+from typing import Any
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+from src.executor import parallel_map
+
+logging.basicConfig(level=logging.INFO)
+
+# Familles de types sur lesquelles portent les calculs par fenêtre glissante
+WINDOW_KINDS = ("b", "i", "f")
+
+# Les moments d'un ensemble de valeurs : nombre, moyenne et somme des carrés des écarts
+# à la moyenne (M2), chacun sous forme de tableau
+Moments = Tuple[np.ndarray, np.ndarray, np.ndarray]
+# Taille maximale des lignes dont les moments des préfixes sont accumulés position
+# par position
+SCAN_BLOCK_SIZE = 64
+# Nombre de valeurs traitées à la fois par le calcul des moments des préfixes
+SCAN_CHUNK_SIZE = 1 << 16
+
+
+def sliding_reduce(
+    values: np.ndarray, window: Optional[int], ufunc: np.ufunc
+) -> np.ndarray:
+    """
+    Réduit chaque fenêtre de `window` valeurs consécutives (tronquée en début de Serie)
+    par une opération associative (np.add, np.minimum, np.maximum) en O(n), sans
+    recalculer chaque fenêtre. Les valeurs sont découpées en blocs de la taille de la
+    fenêtre, sur lesquels sont accumulés un préfixe et un suffixe (algorithme de van Herk
+    et Gil-Werman) : une fenêtre à cheval sur deux blocs combine le suffixe du premier
+    et le préfixe du second. Une somme n'accumule ainsi jamais plus de deux fenêtres
+    de valeurs, sans la dérive d'une somme cumulée sur toute la Serie
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Les valeurs
+    window : int
+        La taille de la fenêtre, None pour une fenêtre croissante depuis la première valeur
+    ufunc : np.ufunc
+        L'opération de réduction
+
+    Returns
+    -------
+    np.ndarray
+        La réduction de la fenêtre se terminant à chaque position
+    """
+    length = len(values)
+    if window is None or window >= length:
+        return ufunc.accumulate(values)
+    nblocks = -(-length // window)
+    padded = np.zeros(nblocks * window, dtype=values.dtype)
+    padded[:length] = values
+    blocks = padded.reshape(nblocks, window)
+    prefix = ufunc.accumulate(blocks, axis=1)
+    suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1]
+    # La fenêtre finissant à la position j du bloc b commence à la position j + 1
+    # du bloc b - 1, sauf en fin de bloc où elle coïncide avec le bloc
+    ufunc(suffix[:-1, 1:], prefix[1:, :-1], out=prefix[1:, :-1])
+    return prefix.ravel()[:length]
+
+
+def merge_moments(left: Moments, right: Moments) -> Moments:
+    """
+    Fusionne les moments de deux ensembles de valeurs (formule de Chan), sans les
+    pertes de précision d'une différence de sommes de carrés. Un ensemble vide a
+    des moments nuls
+    """
+    left_count, left_mean, left_m2 = left
+    right_count, right_mean, right_m2 = right
+    count = left_count + right_count
+    ratio = right_count / np.maximum(count, 1)
+    delta = right_mean - left_mean
+    mean = delta * ratio
+    mean += left_mean
+    m2 = delta * delta
+    m2 *= ratio
+    m2 *= left_count
+    m2 += left_m2
+    m2 += right_m2
+    return count, mean, m2
+
+
+def _scan_moments(moments: Moments) -> Moments:
+    """
+    Calcule les moments de chaque préfixe des lignes d'une matrice de moments en O(n).
+    Une ligne courte est accumulée par mises à jour de Welford (une boucle sur les
+    positions, vectorisée sur toutes les lignes) ; une ligne longue est découpée en
+    sous-blocs d'environ sqrt(taille) positions dont les préfixes, puis les totaux,
+    sont calculés récursivement, chaque sous-bloc étant enfin fusionné avec le total
+    des sous-blocs qui le précèdent
+    """
+    nrows, length = moments[0].shape
+    # Les lignes sont traitées par paquets tenant en cache
+    chunk = max(1, SCAN_CHUNK_SIZE // length)
+    if nrows > chunk:
+        scanned = tuple(np.empty((nrows, length)) for _ in moments)
+        for start in range(0, nrows, chunk):
+            rows = slice(start, start + chunk)
+            parts = _scan_moments(tuple(array[rows] for array in moments))
+            for array, part in zip(scanned, parts):
+                array[rows] = part
+        return scanned
+    if length <= SCAN_BLOCK_SIZE:
+        by_position = [np.ascontiguousarray(array.T) for array in moments]
+        for position in range(1, length):
+            merged = merge_moments(
+                tuple(array[position - 1] for array in by_position),
+                tuple(array[position] for array in by_position),
+            )
+            for array, part in zip(by_position, merged):
+                array[position] = part
+        return tuple(array.T for array in by_position)
+
+    step = math.isqrt(length - 1) + 1
+    nsteps = -(-length // step)
+    blocks = []
+    for array in moments:
+        padded = np.zeros((nrows, nsteps * step))
+        padded[:, :length] = array
+        blocks.append(padded.reshape(nrows * nsteps, step))
+    prefix = _scan_moments(tuple(blocks))
+    totals = _scan_moments(
+        tuple(array[:, -1].reshape(nrows, nsteps) for array in prefix)
+    )
+    # Total des sous-blocs précédant chaque sous-bloc (nul pour le premier)
+    carry = []
+    for array in totals:
+        shifted = np.zeros((nrows, nsteps, 1))
+        shifted[:, 1:, 0] = array[:, :-1]
+        carry.append(shifted)
+    merged = merge_moments(
+        tuple(carry), tuple(array.reshape(nrows, nsteps, step) for array in prefix)
+    )
+    return tuple(array.reshape(nrows, -1)[:, :length] for array in merged)
+
+
+def sliding_moments(moments: Moments, window: Optional[int]) -> Moments:
+    """
+    Calcule les moments de chaque fenêtre de `window` valeurs consécutives (tronquée en
+    début de Serie) selon le découpage en blocs de `sliding_reduce`, les préfixes et
+    suffixes de chaque bloc étant fusionnés par la formule de Chan. La précision de
+    la variance d'une fenêtre ne dépend ainsi que de ses propres valeurs
+
+    Parameters
+    ----------
+    moments : tuple
+        Les moments de chaque valeur : (1, valeur, 0), ou (0, 0, 0) si elle manque
+    window : int
+        La taille de la fenêtre, None pour une fenêtre croissante
+
+    Returns
+    -------
+    tuple
+        Le nombre de valeurs, la moyenne et le M2 de la fenêtre finissant à chaque position
+    """
+    length = len(moments[0])
+    if window is None or window >= length:
+        return tuple(
+            array[0] for array in _scan_moments(tuple(a[None] for a in moments))
+        )
+    nblocks = -(-length // window)
+    blocks = []
+    for array in moments:
+        padded = np.zeros(nblocks * window)
+        padded[:length] = array
+        blocks.append(padded.reshape(nblocks, window))
+    prefix = _scan_moments(tuple(blocks))
+    suffix = tuple(
+        array[:, ::-1]
+        for array in _scan_moments(tuple(block[:, ::-1] for block in blocks))
+    )
+    # Fenêtres à cheval sur deux blocs (voir `sliding_reduce`)
+    merged = merge_moments(
+        tuple(array[:-1, 1:] for array in suffix),
+        tuple(array[1:, :-1] for array in prefix),
+    )
+    for array, part in zip(prefix, merged):
+        array[1:, :-1] = part
+    return tuple(array.ravel()[:length] for array in prefix)
+
+
+def _extremum_fill(dtype: np.dtype, how: str) -> Any:
+    """
+    Retourne la valeur neutre du minimum ou du maximum pour un type, placée aux
+    positions des valeurs manquantes
+    """
+    if dtype.kind == "b":
+        return how == "min"
+    if dtype.kind == "i":
+        info = np.iinfo(dtype)
+        return info.max if how == "min" else info.min
+    return np.inf if how == "min" else -np.inf
+
+
+def check_window(window: int, min_periods: Optional[int]) -> None:
+    """
+    Vérifie la taille d'une fenêtre glissante et le nombre minimal de valeurs présentes
+
+    Raises
+    ------
+    ValueError
+        Taille ou nombre minimal non conforme
+    """
+    if window is not None and (not isinstance(window, int) or window < 1):
+        logging.exception(
+            f"Taille de fenêtre entière positive attendue. Reçu : {window}"
+        )
+        raise ValueError
+    if min_periods is not None and (
+        not isinstance(min_periods, int)
+        or min_periods < 0
+        or (window is not None and min_periods > window)
+    ):
+        logging.exception(
+            f"Nombre minimal de valeurs attendu entre 0 et {window}. Reçu : {min_periods}"
+        )
+        raise ValueError
+
+
+class Rolling:
+    """
+    Calculs par fenêtre glissante (`Series.rolling`) ou croissante (`Series.expanding`)
+    d'une Serie numérique, chaque statistique étant calculée en O(n) sur le buffer typé
+    (voir `sliding_reduce`). Les valeurs manquantes sont exclues des fenêtres
+    """
+
+    def __init__(
+        self, serie: Any, window: Optional[int], min_periods: Optional[int] = None
+    ) -> None:
+        """
+        Fonction __init__ permettant de créer les fenêtres d'une Serie
+
+        Parameters
+        ----------
+        serie : Series
+            La Serie numérique
+        window : int
+            La taille de la fenêtre, None pour une fenêtre croissante
+        min_periods : int
+            Le nombre minimal de valeurs présentes dans une fenêtre, le résultat étant
+            manquant en deçà (taille de la fenêtre par défaut, 1 pour une fenêtre
+            croissante)
+
+        Raises
+        ------
+        TypeError
+            La Serie n'est pas numérique
+        ValueError
+            Taille de fenêtre ou nombre minimal non conforme
+        """
+        if serie.dtype.kind not in WINDOW_KINDS:
+            logging.exception(f"Serie numérique attendue. Type reçu : {serie.dtype}")
+            raise TypeError
+        check_window(window, min_periods)
+        self._serie = serie
+        self._window = window
+        self._min_periods = min_periods if min_periods is not None else window or 1
+
+    def _series(self, values: np.ndarray, valid: np.ndarray) -> Any:
+        """
+        Construit la Serie résultat, de même nom, manquante là où `valid` est faux
+        """
+        return type(self._serie)(
+            data=values,
+            name=self._serie.name,
+            dtype=values.dtype,
+            mask=None if valid.all() else valid,
+        )
+
+    def _filled(self, fill: Any, dtype: Any = None) -> np.ndarray:
+        """
+        Retourne le buffer typé, la valeur `fill` remplaçant les valeurs manquantes
+        """
+        values = self._serie._values.astype(dtype or self._serie._values.dtype)
+        if self._serie._mask is not None:
+            values[~self._serie._mask] = fill
+        return values
+
+    def _counts(self) -> np.ndarray:
+        """
+        Retourne le nombre de valeurs présentes de chaque fenêtre
+        """
+        mask = self._serie._mask
+        if mask is None:
+            counts = np.arange(1, len(self._serie) + 1)
+            return counts if self._window is None else np.minimum(counts, self._window)
+        return sliding_reduce(mask.astype(np.int64), self._window, np.add)
+
+    def _moments(self) -> Moments:
+        """
+        Calcule le nombre de valeurs présentes, la moyenne et le M2 de chaque fenêtre
+        (voir `sliding_moments`)
+        """
+        present = self._serie._validity().astype(np.float64)
+        values = self._filled(0, np.float64)
+        return sliding_moments((present, values, np.zeros(len(values))), self._window)
+
+    def count(self) -> Any:
+        """
+        Calcule le nombre de valeurs présentes de chaque fenêtre
+
+        Returns
+        -------
+        Series
+            Les nombres de valeurs (int64)
+        """
+        counts = self._counts()
+        return self._series(counts, counts >= self._min_periods)
+
+    def sum(self) -> Any:
+        """
+        Calcule la somme de chaque fenêtre, nulle pour une fenêtre vide si `min_periods`
+        vaut 0
+
+        Returns
+        -------
+        Series
+            Les sommes (int64 pour une Serie entière ou booléenne, float64 sinon)
+        """
+        dtype = np.float64 if self._serie.dtype.kind == "f" else np.int64
+        sums = sliding_reduce(self._filled(0, dtype), self._window, np.add)
+        return self._series(sums, self._counts() >= self._min_periods)
+
+    def mean(self) -> Any:
+        """
+        Calcule la moyenne de chaque fenêtre
+
+        Returns
+        -------
+        Series
+            Les moyennes (float64)
+        """
+        counts, means, _ = self._moments()
+        valid = counts >= max(self._min_periods, 1)
+        return self._series(means, valid)
+
+    def std(self, ddof: int = 0) -> Any:
+        """
+        Calcule l'écart-type de chaque fenêtre à partir de ses moments
+
+        Parameters
+        ----------
+        ddof : int
+            Le nombre de degrés de liberté retranché au dénominateur `0 par défaut`
+
+        Returns
+        -------
+        Series
+            Les écarts-types (float64)
+        """
+        counts, _, m2 = self._moments()
+        valid = (counts >= max(self._min_periods, 1)) & (counts > ddof)
+        variances = np.maximum(m2, 0.0) / np.where(valid, counts - ddof, 1)
+        return self._series(np.sqrt(variances), valid)
+
+    def _extremum(self, how: str) -> Any:
+        """
+        Calcule le minimum ou le maximum de chaque fenêtre
+        """
+        dtype = self._serie._values.dtype
+        values = self._filled(_extremum_fill(dtype, how))
+        ufunc = np.minimum if how == "min" else np.maximum
+        extrema = sliding_reduce(values, self._window, ufunc)
+        return self._series(extrema, self._counts() >= max(self._min_periods, 1))
+
+    def min(self) -> Any:
+        """
+        Calcule le minimum de chaque fenêtre
+
+        Returns
+        -------
+        Series
+            Les minimums, du type de la Serie
+        """
+        return self._extremum("min")
+
+    def max(self) -> Any:
+        """
+        Calcule le maximum de chaque fenêtre
+
+        Returns
+        -------
+        Series
+            Les maximums, du type de la Serie
+        """
+        return self._extremum("max")
+
+
+def _window_column(
+    serie: Any, window: Optional[int], min_periods: Optional[int], how: str, **kwargs
+) -> Any:
+    """
+    Applique un calcul par fenêtre à une colonne numérique, les autres colonnes
+    étant conservées telles quelles
+    """
+    if serie.dtype.kind not in WINDOW_KINDS:
+        return serie
+    return getattr(Rolling(serie, window, min_periods), how)(**kwargs)
+
+
+class FrameRolling:
+    """
+    Calculs par fenêtre glissante (`DataFrame.rolling`) ou croissante
+    (`DataFrame.expanding`) de chaque colonne numérique d'un DataFrame, les colonnes
+    étant réparties par l'exécuteur configuré avec `set_options`. Les colonnes non
+    numériques (dates, chaînes...) sont conservées telles quelles
+    """
+
+    def __init__(
+        self, frame: Any, window: Optional[int], min_periods: Optional[int] = None
+    ) -> None:
+        """
+        Fonction __init__ permettant de créer les fenêtres d'un DataFrame
+
+        Parameters
+        ----------
+        frame : DataFrame
+            Le DataFrame
+        window : int
+            La taille de la fenêtre, None pour une fenêtre croissante
+        min_periods : int
+            Le nombre minimal de valeurs présentes dans une fenêtre (voir `Rolling`)
+
+        Raises
+        ------
+        ValueError
+            Taille de fenêtre ou nombre minimal non conforme
+        """
+        check_window(window, min_periods)
+        self._frame = frame
+        self._window = window
+        self._min_periods = min_periods
+
+    def _apply(self, how: str, **kwargs) -> Any:
+        """
+        Applique un calcul par fenêtre à chaque colonne et retourne le DataFrame résultat
+        """
+        series = parallel_map(
+            partial(
+                _window_column,
+                window=self._window,
+                min_periods=self._min_periods,
+                how=how,
+                **kwargs,
+            ),
+            self._frame._series,
+            size=len(self._frame._series) * len(self._frame),
+        )
+        return type(self._frame)(series=series)
+
+    def count(self) -> Any:
+        """
+        Calcule le nombre de valeurs présentes de chaque fenêtre de chaque colonne
+        """
+        return self._apply("count")
+
+    def sum(self) -> Any:
+        """
+        Calcule la somme de chaque fenêtre de chaque colonne
+        """
+        return self._apply("sum")
+
+    def mean(self) -> Any:
+        """
+        Calcule la moyenne de chaque fenêtre de chaque colonne
+        """
+        return self._apply("mean")
+
+    def std(self, ddof: int = 0) -> Any:
+        """
+        Calcule l'écart-type de chaque fenêtre de chaque colonne
+        """
+        return self._apply("std", ddof=ddof)
+
+    def min(self) -> Any:
+        """
+        Calcule le minimum de chaque fenêtre de chaque colonne
+        """
+        return self._apply("min")
+
+    def max(self) -> Any:
+        """
+        Calcule le maximum de chaque fenêtre de chaque colonne
+        """
+        return self._apply("max")
@@ -1,6 +1,9 @@
+from datetime import datetime
 from typing import Any
 
 from mybear import DataFrame
+from mybear import read_binary
+from mybear import read_csv
 from mybear import read_json
 from mybear import Series
 import numpy as np
@@ -166,7 +169,7 @@ def test_std_series(df_series: DataFrame) -> Any:
         for name, element in df_series.data.items()
     ]
 
-    assert DataFrame(series=std_series).data == df_series.std().data
+    assert DataFrame(series=std_series) == df_series.std()
 
 
 def test_std_colonnes(df_colonnes: DataFrame) -> Any:
@@ -237,18 +240,104 @@ def test_groupby(df_articles: DataFrame) -> Any:
     )
 
 
-def test_join(df_colonnes: DataFrame, df_series: DataFrame) -> Any:
+@pytest.fixture
+def df_commandes() -> DataFrame:
+    return DataFrame(
+        colonnes=["name", "quantity"],
+        data=[["Orange", "Kiwi", "Orange", "Rhubarbe"], [3, 5, 1, 2]],
+    )
+
+
+def test_join_inner_fan_out(df_articles: DataFrame, df_commandes: DataFrame) -> Any:
     """
-    Vérification de la méthode groupby
+    Vérification d'une jointure interne où une clé correspond à plusieurs lignes
+    de chaque côté
+    """
+    df_joined = df_articles.join(
+        other=df_commandes, left_on="name", right_on="name", how="inner"
+    )
+    assert df_joined.colonnes == ["name", "price", "quantity"]
+    assert df_joined.data["name"].data == [
+        "Orange",
+        "Orange",
+        "Rhubarbe",
+        "Orange",
+        "Orange",
+    ]
+    assert df_joined.data["quantity"].data == [3, 1, 2, 3, 1]
+
+
+def test_join_how(df_articles: DataFrame, df_commandes: DataFrame) -> Any:
+    """
+    Vérification des jointures à gauche, à droite et pleines, les lignes sans
+    correspondance étant complétées par des valeurs manquantes
+    """
+    left = df_articles.join(df_commandes, left_on="name", right_on="name")
+    assert len(left) == 6
+    assert left.data["quantity"].data[2] is None
+
+    right = df_articles.join(df_commandes, left_on="name", right_on="name", how="right")
+    assert right.data["name"].data == [
+        "Orange",
+        "Orange",
+        "Kiwi",
+        "Orange",
+        "Orange",
+        "Rhubarbe",
+    ]
+    assert right.data["price"].data[2] is None
+
+    outer = df_articles.join(df_commandes, left_on="name", right_on="name", how="outer")
+    assert len(outer) == 7
+    assert outer.data["name"].data[-1] == "Kiwi"
+
+
+def test_join_hash_build_side() -> Any:
+    """
+    Vérification de la jointure par hachage, la table étant construite sur le plus
+    petit DataFrame : même résultat quel que soit le côté construit, clés entières et
+    flottantes égales appariées, clés manquantes sans correspondance
+    """
+    grand = DataFrame(
+        colonnes=["k", "v"],
+        data=[[3, 1, None, 3, 7, 1, 2] * 3, list(range(21))],
+    )
+    petit = DataFrame(
+        colonnes=["k", "w"], data=[[1.0, 3.0, None, 3.0], [10, 30, 0, 31]]
+    )
+    joined = grand.join(petit, left_on="k", right_on="k", how="inner")
+    assert joined.data["v"].data[:6] == [0, 0, 1, 3, 3, 5]
+    assert joined.data["w"].data[:6] == [30, 31, 10, 30, 31, 10]
+    assert len(joined) == 18
+    reverse = petit.join(grand, left_on="k", right_on="k", how="inner")
+    pairs = sorted(zip(reverse.data["v"].data, reverse.data["w"].data))
+    assert pairs == sorted(zip(joined.data["v"].data, joined.data["w"].data))
+
+
+def test_join_suffixes_and_inputs_unchanged(df_articles: DataFrame) -> Any:
+    """
+    Vérification d'une jointure sur plusieurs clés où les colonnes communes sont
+    suffixées sans modifier les DataFrames joints
     """
-    right_on = "price"
-    left_on = "date"
-    df_joined = df_colonnes.join(other=df_series, right_on=right_on, left_on=left_on)
-    assert any(list(map(lambda x: left_on in df_colonnes.colonnes, df_colonnes.colonnes)))
-    assert any(list(map(lambda x: right_on in df_colonnes.colonnes, df_colonnes.colonnes)))
-    if left_on in df_colonnes.colonnes or right_on in df_series.colonnes:
-        assert "_" in df_joined.colonnes
-        
+    df_prix = DataFrame(
+        colonnes=["produit", "price", "name"],
+        data=[["Orange", "Rhubarbe"], [15.0, 2.0], ["agrume", "légume"]],
+    )
+    df_joined = df_articles.join(
+        other=df_prix, left_on=["name", "price"], right_on=["produit", "price"]
+    )
+    assert df_joined.colonnes == ["name_x", "price", "produit", "name_y"]
+    assert df_joined.data["name_y"].data == ["agrume", None, None, "agrume"]
+    assert df_articles.colonnes == ["name", "price"]
+    assert df_prix.colonnes == ["produit", "price", "name"]
+    # Un nom suffixé déjà présent ferait disparaître une colonne
+    gauche = DataFrame(colonnes=["k", "a", "a_x"], data=[[1, 2], [3, 4], [5, 6]])
+    droite = DataFrame(colonnes=["k", "a"], data=[[1, 2], [7, 8]])
+    with pytest.raises(ValueError):
+        gauche.join(droite, left_on="k", right_on="k")
+    df_joined = gauche.join(droite, left_on="k", right_on="k", suffixes=("_g", "_d"))
+    assert df_joined.colonnes == ["k", "a_g", "a_x", "a_d"]
+
 
 def test_same_data_json_orient() -> Any:
     """
@@ -278,7 +367,9 @@ def test_iloc_series_slice(first_serie: Series) -> Any:
     Vérification de la méthode iloc renvoyant une seule instance de la
     classe Series
     """
-    assert Series(data=range(1, 4), name=first_serie.name) == first_serie.iloc[1:-1]
+    assert Series(data=range(1, 4), name=first_serie.name).equals(
+        first_serie.iloc[1:-1]
+    )
 
 
 def test_iloc_dataframe_unique_value(df_series: DataFrame) -> Any:
@@ -303,13 +394,10 @@ def test_iloc_dataframe_slice_int(df_series: DataFrame) -> Any:
     slice_rows = slice(1, 3)
     num_col = 1
 
-    assert (
-        Series(
-            data=list(df_series.data.values())[num_col].data[slice_rows],
-            name=df_series.colonnes[num_col],
-        )
-        == df_series.iloc[slice_rows, num_col]
-    )
+    assert Series(
+        data=list(df_series.data.values())[num_col].data[slice_rows],
+        name=df_series.colonnes[num_col],
+    ).equals(df_series.iloc[slice_rows, num_col])
 
 
 def test_iloc_dataframe_int_slice(df_series: DataFrame) -> Any:
@@ -337,3 +425,482 @@ def test_iloc_dataframe_slice_slice(df_series: DataFrame) -> Any:
         DataFrame(data=[[0, 1], [0, 1]], colonnes=["a", "b"])
         == df_series.iloc[slice_rows, slice_cols]
     )
+
+
+@pytest.fixture
+def csv_path(tmp_path) -> str:
+    path = tmp_path / "articles.csv"
+    path.write_text(
+        "name,price,quantity\n"
+        "Orange,15.0,3\n"
+        "Pamplemousse,1.34,\n"
+        "Rhubarbe,2.34,7\n"
+        "Orange,15.0,1\n"
+    )
+    return str(path)
+
+
+def test_read_csv_typed_columns(csv_path: str) -> Any:
+    """
+    Vérification de la lecture d'un fichier csv vers des colonnes typées,
+    les cellules vides devenant des valeurs manquantes
+    """
+    df = read_csv(csv_path)
+    assert df.colonnes == ["name", "price", "quantity"]
+    assert df.data["price"].dtype == np.float64
+    assert df.data["quantity"].dtype == np.int64
+    assert df.data["quantity"].data == [3, None, 7, 1]
+
+
+def test_read_csv_chunksize(csv_path: str) -> Any:
+    """
+    Vérification de la lecture par blocs d'un fichier csv avec sélection
+    et typage explicite des colonnes
+    """
+    chunks = list(
+        read_csv(csv_path, chunksize=3, usecols=["price"], dtype={"price": str})
+    )
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    assert chunks[0].colonnes == ["price"]
+    assert chunks[1].data["price"].data == ["15.0"]
+
+
+def test_read_csv_mmap_quoted_newlines(tmp_path, monkeypatch) -> Any:
+    """
+    Vérification que la lecture parallèle d'un fichier projeté en mémoire découpe
+    le fichier sur des fins d'enregistrement, y compris avec des sauts de ligne
+    entre guillemets, et retourne le même DataFrame que la lecture séquentielle
+    """
+    import mybear
+
+    path = tmp_path / "quoted.csv"
+    lines = ["id,comment,price"]
+    for i in range(200):
+        lines.append(f'{i},"ligne {i}\nsuite ""{i}""",{i * 1.5}')
+    path.write_text("\n".join(lines) + "\n")
+    monkeypatch.setattr(mybear, "MIN_RANGE_SIZE", 256)
+
+    df = read_csv(str(path), mmap=True, workers=3)
+    assert len(df) == 200
+    assert df.data["comment"].iloc[7] == 'ligne 7\nsuite "7"'
+    assert df == read_csv(str(path))
+
+
+def test_iloc_dataframe_slice_is_view(df_articles: DataFrame) -> Any:
+    """
+    Vérification qu'une sélection de lignes et colonnes partage les buffers du DataFrame
+    """
+    view = df_articles.iloc[1:3, 1:2]
+    assert view.colonnes == ["price"]
+    assert np.shares_memory(view.data["price"].values, df_articles.data["price"].values)
+    assert df_articles.iloc[2, 0:2] == DataFrame(
+        colonnes=["name", "price"], data=[["Rhubarbe"], [2.34]]
+    )
+
+
+def test_iter_rows(df_articles: DataFrame) -> Any:
+    """
+    Vérification des itérateurs de lignes itertuples et iterrows
+    """
+    rows = list(df_articles.itertuples())
+    assert rows[1].Index == 1
+    assert rows[1].name == "Pamplemousse"
+    assert rows[1].price == 1.34
+    assert list(df_articles.itertuples(index=False, name=None))[0] == ("Orange", 15.0)
+    assert next(df_articles.iterrows()) == (0, {"name": "Orange", "price": 15.0})
+    assert [serie.name for serie in df_articles] == ["name", "price"]
+
+
+def test_json_round_trip(df_articles: DataFrame, tmp_path) -> Any:
+    """
+    Vérification qu'un DataFrame écrit par to_json est relu à l'identique par read_json
+    """
+    for orient, lines in (("records", False), ("records", True), ("columns", False)):
+        path = str(tmp_path / f"{orient}_{lines}.json")
+        df_articles.to_json(path, orient=orient, lines=lines)
+        assert read_json(path, orient=orient, lines=lines) == df_articles
+
+
+def test_read_ndjson_chunks(tmp_path, monkeypatch) -> Any:
+    """
+    Vérification de la lecture par blocs d'un fichier NDJSON avec le décodeur json standard,
+    les clés absentes devenant des valeurs manquantes
+    """
+    import src.json_codec
+
+    monkeypatch.setattr(src.json_codec, "orjson", None)
+    path = tmp_path / "events.ndjson"
+    path.write_text(
+        '{"id": 1, "type": "click"}\n'
+        '{"id": 2}\n'
+        "\n"
+        '{"id": 3, "type": "view", "duration": 1.5}\n'
+    )
+    chunks = list(read_json(str(path), lines=True, chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    df = read_json(str(path), lines=True)
+    assert df.colonnes == ["id", "type", "duration"]
+    assert df.data["type"].data == ["click", None, "view"]
+    assert df.data["duration"].data == [None, None, 1.5]
+
+
+def test_binary_round_trip(tmp_path) -> Any:
+    """
+    Vérification qu'un DataFrame écrit par to_binary est relu à l'identique par read_binary,
+    types et valeurs manquantes compris, les colonnes numériques étant projetées sans copie
+    """
+    df = DataFrame(
+        colonnes=["id", "prix", "nom", "actif", "date", "divers"],
+        data=[
+            [1, 2, None],
+            [1.5, None, 3.0],
+            ["stylo", None, "gomme"],
+            [True, False, True],
+            ["01-02-2023", "15-03-2023", None],
+            [1, "deux", None],
+        ],
+    )
+    path = str(tmp_path / "df.mybear")
+    df.to_binary(path)
+    for mmap in (True, False):
+        loaded = read_binary(path, mmap=mmap)
+        assert loaded == df
+        assert [serie.dtype for serie in loaded] == [serie.dtype for serie in df]
+    loaded = read_binary(path)
+    assert not loaded.data["id"].values.flags.owndata
+    loaded.data["id"][0] = 10
+    assert read_binary(path).data["id"][0] == 1
+
+
+def test_filter_mask(df_articles: DataFrame) -> Any:
+    """
+    Vérification de la sélection des lignes d'un DataFrame par un masque booléen
+    """
+    price = df_articles["price"]
+    expected = [p > 2 for p in price.data]
+    filtered = df_articles[(price > 2) & (df_articles["name"] != "Rhubarbe")]
+    expected = [e and n != "Rhubarbe" for e, n in zip(expected, df_articles["name"])]
+    assert len(filtered) == sum(expected)
+    assert filtered.colonnes == df_articles.colonnes
+    assert filtered == df_articles.filter(np.array(expected))
+    with pytest.raises(ValueError):
+        df_articles.filter([True])
+    with pytest.raises(TypeError):
+        df_articles.filter(np.arange(len(df_articles)))
+
+
+def test_reductions_with_nulls() -> Any:
+    """
+    Vérification des réductions d'un DataFrame contenant des valeurs manquantes
+    """
+    df = DataFrame(colonnes=["a", "b"], data=[[1, None, 3], [None, None, 2.5]])
+    assert df.min().data["a"].data == [1]
+    assert df.max().data["b"].data == [2.5]
+    assert df.mean(skipna=False).data["a"].data == [None]
+    assert df.sum(min_count=2).data["b"].data == [None]
+    assert df.sum().data["a"].data == [4]
+
+
+def test_describe_and_agg() -> Any:
+    """
+    Vérification du résumé statistique d'un DataFrame calculé en un passage par colonne
+    """
+    values = np.random.default_rng(0).normal(size=200_000)
+    values[::7] = np.nan
+    df = DataFrame(
+        colonnes=["x", "n", "name"],
+        data=[
+            [None if np.isnan(v) else v for v in values],
+            list(range(200_000)),
+            ["a", "b"] * 100_000,
+        ],
+    )
+    described = df.describe()
+    assert described.colonnes == ["statistic", "x", "n"]
+    statistics = dict(zip(described.data["statistic"], described.data["x"]))
+    present = values[~np.isnan(values)]
+    assert statistics["count"] == len(present)
+    assert statistics["null_count"] == len(values) - len(present)
+    assert statistics["mean"] == pytest.approx(present.mean())
+    assert statistics["std"] == pytest.approx(present.std())
+    assert statistics["min"] == present.min()
+    assert statistics["50%"] == np.median(present)
+    assert statistics["25%"] == np.quantile(present, 0.25)
+    # Les statistiques calculées sont réutilisées par les réductions de la Serie
+    assert df.data["x"]._stats["min"] == present.min()
+
+    aggregated = df.agg(["sum", "median", "max"])
+    total, median, maximum = aggregated.data["n"].data
+    assert (total, maximum) == (sum(range(200_000)), 199_999)
+    assert median == 99_999.5
+    assert aggregated.data["name"].data == [None, None, "b"]
+    # Quantiles exacts sur des données périodiques
+    periodic = DataFrame(colonnes=["p"], data=[[0, 1] * 100_000])
+    quartiles = periodic.agg(["25%", "median", "75%"]).data["p"].data
+    assert quartiles == [0.0, 0.5, 1.0]
+    with pytest.raises(ValueError):
+        df.agg(["variance"])
+
+
+def test_sort_values_multi_keys() -> Any:
+    """
+    Vérification du tri d'un DataFrame selon plusieurs colonnes et de la réutilisation
+    de l'ordre de tri par groupby
+    """
+    df = DataFrame(
+        colonnes=["pays", "annee", "montant"],
+        data=[
+            ["FR", "DE", "FR", None, "DE", "FR"],
+            [2021, 2020, 2020, 2022, 2020, None],
+            [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        ],
+    )
+    sorted_df = df.sort_values(["pays", "annee"], ascending=[True, False])
+    assert sorted_df.data["montant"].data == [2.0, 5.0, 1.0, 3.0, 6.0, 4.0]
+    assert df.sort_values("annee", na_position="first").data["montant"].data == [
+        6.0,
+        2.0,
+        3.0,
+        5.0,
+        1.0,
+        4.0,
+    ]
+    assert sorted_df._is_sorted_by(["pays"])
+    assert not df._is_sorted_by(["pays"])
+    grouped = sorted_df.groupby("pays", agg={"montant": "sum"})
+    assert grouped.data["pays"].data == ["DE", "FR"]
+    assert grouped.data["montant"].data == [7.0, 10.0]
+    # Les groupes d'un DataFrame trié (dans un sens et un ordre de clés quelconques)
+    # sont produits dans le même ordre que par hachage
+    for sens in ([True, False], [False, True]):
+        for by in (["pays"], ["annee", "pays"]):
+            trie = df.sort_values(["pays", "annee"], ascending=sens)
+            assert trie._is_sorted_by(by)
+            grouped = trie.groupby(by, agg={"montant": "sum"})
+            trie._sorted_by = []
+            hashed = trie.groupby(by, agg={"montant": "sum"})
+            for colonne in grouped.colonnes:
+                assert grouped.data[colonne].data == hashed.data[colonne].data
+    # Des clés NaN triées forment un seul groupe, comme par hachage
+    nan = float("nan")
+    trie = DataFrame(colonnes=["k", "v"], data=[[nan, 1.0, nan], [1, 2, 3]])
+    trie = trie.sort_values("k")
+    assert trie._is_sorted_by(["k"])
+    grouped = trie.groupby("k", agg={"v": "sum"})
+    trie._sorted_by = []
+    hashed = trie.groupby("k", agg={"v": "sum"})
+    assert grouped.data["v"].data == hashed.data["v"].data == [2, 4]
+    assert np.isnan(grouped.data["k"].data[1])
+    sorted_df.data["pays"][0] = "IT"
+    assert not sorted_df._is_sorted_by(["pays"])
+    with pytest.raises(ValueError):
+        df.sort_values(["pays"], ascending=[True, False])
+
+
+def test_nlargest(df_articles: DataFrame) -> Any:
+    """
+    Vérification de la sélection des lignes ayant les plus grandes valeurs
+    """
+    top = df_articles.nlargest(3, "price")
+    expected = sorted(df_articles["price"].data, reverse=True)[:3]
+    assert top["price"].data == expected
+    assert df_articles.nsmallest(1, "price")["price"].data == [
+        min(df_articles["price"].data)
+    ]
+
+
+def test_categorical_keys(tmp_path) -> Any:
+    """
+    Vérification des groupby, jointures et écritures binaires sur des colonnes
+    catégorielles lues d'un fichier csv
+    """
+    path = tmp_path / "ventes.csv"
+    rows = [("FR", 1), ("DE", 2), ("", 3), ("FR", 4), ("IT", 5), ("DE", 6)] * 50
+    path.write_text("pays,montant\n" + "".join(f"{p},{m}\n" for p, m in rows))
+    df = read_csv(str(path))
+    assert df["pays"].categories.tolist() == ["FR", "DE", "IT"]
+    grouped = df.groupby("pays", agg={"montant": "sum"})
+    assert grouped.data["pays"].data == ["FR", "DE", "IT"]
+    assert grouped.data["montant"].data == [250, 400, 250]
+
+    pays = DataFrame(
+        colonnes=["pays", "nom"],
+        data=[
+            ["IT", "FR", "ES", "IT"] * 10,
+            ["Italie", "France", "Espagne", "It"] * 10,
+        ],
+    )
+    assert pays["pays"].categories is not None
+    joined = df.join(pays, left_on="pays", right_on="pays", how="inner")
+    assert len(joined) == 50 * (20 + 20)
+    assert set(joined["nom"].data) == {"Italie", "France", "It"}
+
+    binary = str(tmp_path / "ventes.mybear")
+    df.to_binary(binary)
+    loaded = read_binary(binary)
+    assert loaded["pays"].categories.tolist() == ["FR", "DE", "IT"]
+    assert loaded == df
+
+
+def test_string_columns(tmp_path) -> Any:
+    """
+    Vérification de la lecture csv, du filtrage et de l'écriture binaire d'une colonne
+    de chaînes stockée dans un buffer UTF-8
+    """
+    path = tmp_path / "clients.csv"
+    rows = [(f"client {i}", f"ville-{i % 7}" if i % 5 else "") for i in range(300)]
+    path.write_text("nom,ville\n" + "".join(f"{n},{v}\n" for n, v in rows))
+    df = read_csv(str(path))
+    assert df["nom"]._strings is not None
+    assert df["nom"].data[:2] == ["client 0", "client 1"]
+    assert df["ville"].categories is not None
+    assert df["nom"].str.startswith("client 29").sum() == 11
+    assert df["ville"].str.contains("-3").sum() == 34
+
+    filtered = df[df["nom"].str.contains("9")]
+    assert filtered["nom"]._strings is df["nom"]._strings
+    assert len(filtered) == sum("9" in n for n, _ in rows)
+
+    binary = str(tmp_path / "clients.mybear")
+    filtered.to_binary(binary)
+    loaded = read_binary(binary)
+    assert loaded["nom"]._strings is not None
+    assert loaded == filtered
+
+
+def test_read_csv_dates(tmp_path, monkeypatch) -> Any:
+    """
+    Vérification de la lecture par chunks de colonnes de dates : le format détecté
+    sur le premier chunk est réutilisé, une colonne de dates s'élargit aux dates avec
+    heure, et un type date imposé lit les secondes depuis l'epoch
+    """
+    import mybear
+
+    path = tmp_path / "evenements.csv"
+    jours = [f"2024-02-{i % 28 + 1:02d}" for i in range(50)]
+    jours += [f"2024-03-01 {i % 24:02d}:30:00" for i in range(50)]
+    rows = [
+        f"{jour},2024-02-01 {i % 24:02d}:00:00,{86400 * i}"
+        for i, jour in enumerate(jours)
+    ]
+    path.write_text("jour,heure,epoch\n" + "\n".join(rows) + "\n")
+    monkeypatch.setattr(mybear, "CSV_BLOCK_SIZE", 50)
+    df = read_csv(str(path), dtype={"epoch": "datetime64[s]"})
+    assert df["jour"].dtype == np.dtype("datetime64[us]")
+    assert df["jour"].data[:2] == [datetime(2024, 2, 1), datetime(2024, 2, 2)]
+    assert df["jour"].data[-1] == datetime(2024, 3, 1, 1, 30)
+    assert df["heure"].dt.hour.data[:3] == [0, 1, 2]
+    assert df["epoch"].data[1] == datetime(1970, 1, 2)
+
+
+def test_read_csv_promotion_to_object(tmp_path, monkeypatch) -> Any:
+    """
+    Vérification qu'une colonne devenue object en cours de lecture ne contient que des
+    chaînes, quel que soit le découpage en chunks ou en plages : les chunks déjà
+    convertis sont réécrits en chaînes
+    """
+    import mybear
+
+    path = tmp_path / "codes.csv"
+    rows = [f"{i},{i / 2},2024-01-{i % 28 + 1:02d},{i % 2 == 0}" for i in range(60)]
+    rows += [f"A{i},n/a,inconnue,peut-être" for i in range(10)]
+    path.write_text("code,mesure,jour,actif\n" + "\n".join(rows) + "\n")
+    reference = read_csv(str(path))
+    monkeypatch.setattr(mybear, "CSV_BLOCK_SIZE", 20)
+    df = read_csv(str(path))
+    assert df == reference
+    for colonne in df.colonnes:
+        assert df[colonne].dtype == object
+        assert all(isinstance(value, str) for value in df[colonne].data)
+    assert df["code"].data[:2] == ["0", "1"]
+    assert df["mesure"].data[:2] == ["0.0", "0.5"]
+    assert df["jour"].data[0] == "2024-01-01"
+    # De même pour une lecture parallèle par plages d'octets
+    monkeypatch.setattr(mybear, "MIN_RANGE_SIZE", 256)
+    assert read_csv(str(path), mmap=True, workers=3) == reference
+
+
+def test_read_csv_date_formats_across_blocks(tmp_path, monkeypatch) -> Any:
+    """
+    Vérification qu'un changement de format de dates entre deux blocs rend la colonne
+    object comme au sein d'un même bloc, alors que des dates suivies de dates avec heure
+    au même format donnent des dates avec heure, quel que soit le découpage
+    """
+    import mybear
+
+    path = tmp_path / "dates.csv"
+    rows = ["2020-01-01,2020-01-01"] * 2000 + ["01-02-2020,2020-01-02 10:30:00"] * 2000
+    path.write_text("jour,instant\n" + "\n".join(rows) + "\n")
+    reference = read_csv(str(path))
+    assert reference["jour"].dtype == object
+    assert reference["jour"].data[1999:2001] == ["2020-01-01", "01-02-2020"]
+    assert reference["instant"].dtype == np.dtype("datetime64[us]")
+    for size in (1000, 2000, 3000):
+        monkeypatch.setattr(mybear, "CSV_BLOCK_SIZE", size)
+        assert read_csv(str(path)) == reference
+    monkeypatch.setattr(mybear, "MIN_RANGE_SIZE", 4096)
+    assert read_csv(str(path), mmap=True, workers=4) == reference
+    # Plages d'octets coupées exactement au changement de format
+    path = tmp_path / "jours.csv"
+    path.write_text("jour\n" + "2020-01-01\n" * 2000 + "01-02-2020\n" * 2000)
+    reference = read_csv(str(path))
+    monkeypatch.setattr(mybear, "MIN_RANGE_SIZE", 11 * 2000 - 10)
+    assert read_csv(str(path), mmap=True, workers=3) == reference
+    assert reference["jour"].dtype == object
+
+
+def test_resample() -> Any:
+    """
+    Vérification de l'agrégation par période : seules les périodes non vides sont
+    produites, dans l'ordre chronologique, et les lignes sans date sont ignorées
+    """
+    df = DataFrame(
+        colonnes=["date", "montant"],
+        data=[
+            [
+                datetime(2024, 1, 1, 0, 10),
+                datetime(2024, 1, 1, 1, 20),
+                datetime(2024, 1, 1, 0, 50),
+                None,
+                datetime(2024, 1, 1, 3, 0),
+            ],
+            [1, 2, 3, 4, 5],
+        ],
+    )
+    horaire = df.resample(on="date", every="1h", agg={"montant": ["sum", "count"]})
+    assert horaire.colonnes == ["date", "montant_sum", "montant_count"]
+    assert horaire["date"].data == [
+        datetime(2024, 1, 1, 0),
+        datetime(2024, 1, 1, 1),
+        datetime(2024, 1, 1, 3),
+    ]
+    assert horaire["montant_sum"].data == [4, 2, 5]
+    # Un tri décroissant des dates ne change pas l'ordre des périodes
+    decroissant = df.sort_values("date", ascending=False)
+    assert decroissant._is_sorted_by(["date"])
+    resampled = decroissant.resample(on="date", every="1h", agg={"montant": "sum"})
+    assert resampled["date"].data == horaire["date"].data
+    assert resampled["montant"].data == [4, 2, 5]
+    mensuel = df.resample(on="date", every="1M", agg={"montant": "max"})
+    assert mensuel["date"].data == [datetime(2024, 1, 1)]
+    assert mensuel["montant"].data == [5]
+    with pytest.raises(TypeError):
+        df.resample(on="montant", every="1h")
+    with pytest.raises(ValueError):
+        df.resample(on="date", every="1 semaine")
+
+
+def test_rolling() -> Any:
+    """
+    Vérification des calculs par fenêtre de chaque colonne numérique, les autres
+    colonnes étant conservées
+    """
+    df = DataFrame(
+        colonnes=["capteur", "mesure"],
+        data=[["a", "b", "c", "d"], [1.0, 2.0, None, 4.0]],
+    )
+    moyennes = df.rolling(2, min_periods=1).mean()
+    assert moyennes.colonnes == ["capteur", "mesure"]
+    assert moyennes["capteur"].data == ["a", "b", "c", "d"]
+    assert moyennes["mesure"].data == [1.0, 1.5, 2.0, 4.0]
+    assert df.expanding().sum()["mesure"].data == [1.0, 3.0, 3.0, 7.0]
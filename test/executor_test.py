@@ -0,0 +1,153 @@
+import os
+import threading
+from typing import Any
+
+from mybear import DataFrame
+from mybear import get_option
+from mybear import Series
+from mybear import set_options
+import numpy as np
+import pytest
+import src.executor
+import src.spill
+
+
+@pytest.fixture
+def options() -> Any:
+    """
+    Rétablit la configuration d'exécution par défaut après chaque test
+    """
+    yield
+    set_options(num_threads=os.cpu_count() or 1, executor="thread", memory_limit=0)
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+def test_column_executors(options: Any, executor: str) -> Any:
+    """
+    Test case permettant de vérifier que les réductions par colonne donnent le même
+    résultat quel que soit l'exécuteur
+    """
+    set_options(num_threads=2, executor=executor)
+    df = DataFrame(
+        colonnes=["a", "b"], data=[list(range(40_000)), [0.5, None] * 20_000]
+    )
+    assert df.sum().data["a"].data == [sum(range(40_000))]
+    assert df.mean().data["b"].data == [0.5]
+    assert df.max().data["a"].data == [39_999]
+    assert df.describe().data["b"].data[:2] == [20_000, 20_000]
+
+
+def test_tree_reduce(options: Any, monkeypatch: Any) -> Any:
+    """
+    Test case permettant de vérifier les réductions d'une colonne découpée en morceaux
+    """
+    monkeypatch.setattr(src.executor, "REDUCTION_CHUNK_SIZE", 1000)
+    set_options(num_threads=4)
+    values = np.random.default_rng(1).normal(size=10_500)
+    mask = np.ones(len(values), dtype=bool)
+    mask[2000:3000] = False
+    serie = Series(data=values, mask=mask)
+    present = values[mask]
+    assert serie.sum() == pytest.approx(present.sum())
+    assert serie.std() == pytest.approx(present.std())
+    assert serie.min() == present.min()
+    with pytest.raises(ValueError):
+        set_options(executor="gpu")
+    with pytest.raises(ValueError):
+        set_options(num_threads=0)
+
+
+def test_set_options_in_flight(options: Any) -> Any:
+    """
+    Test case permettant de vérifier qu'une reconfiguration n'arrête un pool encore
+    utilisé qu'une fois son travail achevé, le suivant étant créé avec la nouvelle
+    configuration, et qu'aucun thread ni processus d'un pool remplacé ne subsiste
+    """
+    set_options(num_threads=2, executor="thread")
+    started = threading.Event()
+    release = threading.Event()
+
+    def wait(value: int) -> int:
+        started.set()
+        release.wait(10)
+        return value
+
+    results = []
+    caller = threading.Thread(
+        target=lambda: results.append(src.executor.parallel_map(wait, [1, 2, 3]))
+    )
+    caller.start()
+    started.wait(10)
+    pool = src.executor._pools["thread"]
+    set_options(num_threads=3)
+    assert not pool._shutdown
+    assert "thread" not in src.executor._pools
+    release.set()
+    caller.join(10)
+    assert results == [[1, 2, 3]]
+    assert pool._shutdown
+    for thread in pool._threads:
+        thread.join(10)
+        assert not thread.is_alive()
+    assert src.executor.parallel_map(abs, [-1, -2]) == [1, 2]
+    assert src.executor._pools["thread"]._max_workers == 3
+
+    set_options(executor="process")
+    assert src.executor.parallel_map(abs, [-1, -2]) == [1, 2]
+    processes = list(src.executor._pools["process"]._processes.values())
+    set_options(num_threads=2)
+    for process in processes:
+        process.join(10)
+        assert not process.is_alive()
+
+
+def test_memory_limit_spill(options: Any) -> Any:
+    """
+    Test case permettant de vérifier que groupby et join, traités par partitions écrites
+    sur disque au-delà du budget mémoire, donnent le même résultat qu'en mémoire
+    """
+    rng = np.random.default_rng(0)
+    clients = [f"c{value}" for value in rng.integers(0, 300, 2_000).tolist()]
+    montants = [None if i % 11 == 0 else float(i % 40) for i in range(2_000)]
+    ventes = DataFrame(
+        colonnes=["client", "montant", "pays"],
+        data=[clients, montants, ["FR", "DE", None, "IT"] * 500],
+    )
+    clients_df = DataFrame(
+        colonnes=["client", "age"],
+        data=[[f"c{i}" for i in range(0, 400, 2)], list(range(200))],
+    )
+    agg = {"montant": ["sum", "mean", "first", "count"]}
+
+    def compute() -> Any:
+        return [
+            ventes.groupby(["pays", "client"], agg=agg),
+            *(
+                ventes.join(clients_df, left_on="client", right_on="client", how=how)
+                for how in ("left", "right", "inner", "outer")
+            ),
+        ]
+
+    expected = compute()
+    set_options(memory_limit="16KB")
+    assert src.spill.spill_partitions(ventes._series) > 1
+    for result, reference in zip(compute(), expected):
+        assert result == reference
+        assert [serie.dtype for serie in result] == [serie.dtype for serie in reference]
+    # Le nombre de partitions est borné : un budget trop faible est refusé
+    set_options(memory_limit="1B")
+    assert src.spill.spill_partitions(clients_df._series) == len(clients_df)
+    with pytest.raises(ValueError):
+        ventes.groupby("client", agg=agg)
+
+
+def test_memory_limit_parsing(options: Any) -> Any:
+    """
+    Test case permettant de vérifier la lecture du budget mémoire
+    """
+    set_options(memory_limit="1.5KB")
+    assert get_option("memory_limit") == 1536
+    set_options(memory_limit=0)
+    assert get_option("memory_limit") is None
+    with pytest.raises(ValueError):
+        set_options(memory_limit="4 gigas")
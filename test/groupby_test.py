@@ -0,0 +1,113 @@
+from typing import Any
+
+from mybear import DataFrame
+from mybear import Series
+import numpy as np
+import pytest
+from src.groupby import factorize
+from src.groupby import group_codes
+from src.groupby import integer_group_codes
+
+
+@pytest.fixture
+def df_ventes() -> DataFrame:
+    return DataFrame(
+        colonnes=["pays", "annee", "montant"],
+        data=[
+            ["FR", "DE", "FR", "FR", None],
+            [2020, 2020, 2021, 2020, 2020],
+            [10.0, 4.0, None, 2.0, 7.0],
+        ],
+    )
+
+
+def test_factorize_first_appearance() -> Any:
+    """
+    Test case permettant de vérifier que les codes de groupe suivent l'ordre
+    de première apparition et que les valeurs manquantes sont exclues
+    """
+    codes, ngroups = factorize(Series([3, 1, 3, None, 2]))
+    assert ngroups == 3
+    assert codes.tolist() == [0, 1, 0, -1, 2]
+
+
+def test_group_codes_multiple_keys(df_ventes: DataFrame) -> Any:
+    """
+    Test case permettant de vérifier l'encodage d'une clé sur plusieurs colonnes
+    """
+    codes, ngroups = group_codes([df_ventes.data["pays"], df_ventes.data["annee"]])
+    assert ngroups == 3
+    assert codes.tolist() == [0, 1, 2, 0, -1]
+
+
+def test_groupby_named_aggregations(df_ventes: DataFrame) -> Any:
+    """
+    Test case permettant de vérifier les agrégations nommées, les valeurs manquantes
+    étant ignorées
+    """
+    df = df_ventes.groupby(
+        by="pays", agg={"montant": ["sum", "mean", "count", "std", "max"]}
+    )
+    assert df.colonnes == [
+        "pays",
+        "annee",
+        "montant_sum",
+        "montant_mean",
+        "montant_count",
+        "montant_std",
+        "montant_max",
+    ]
+    assert df.data["pays"].data == ["FR", "DE"]
+    assert df.data["montant_sum"].data == [12.0, 4.0]
+    assert df.data["montant_mean"].data == [6.0, 4.0]
+    assert df.data["montant_count"].data == [2, 1]
+    assert df.data["montant_std"].data == [np.std([10.0, 2.0]), 0.0]
+    assert df.data["montant_max"].data == [10.0, 4.0]
+
+
+def test_groupby_non_numeric_aggregation(df_ventes: DataFrame) -> Any:
+    """
+    Test case permettant de vérifier qu'une somme, une moyenne ou un écart-type d'une
+    colonne non numérique est refusé, alors que min et max restent possibles
+    """
+    for how in ("sum", "mean", "std"):
+        with pytest.raises(TypeError):
+            df_ventes.groupby(by="annee", agg={"pays": how})
+    df = df_ventes.groupby(by="annee", agg={"pays": "max"})
+    assert df.data["pays"].data == ["FR", "FR"]
+
+
+def test_groupby_callable(df_ventes: DataFrame) -> Any:
+    """
+    Test case permettant de vérifier qu'une fonction quelconque reçoit la liste
+    des valeurs de chaque groupe
+    """
+    df = df_ventes.groupby(by=["pays", "annee"], agg={"montant": lambda v: v})
+    assert df.data["montant"].data == [[10.0, 2.0], [4.0], []]
+
+
+def test_integer_group_codes() -> Any:
+    """
+    Test case permettant de vérifier que les trois noyaux (lignes triées, adressage
+    direct et tri) numérotent les groupes dans l'ordre croissant des identifiants
+    """
+    ids = np.array([7, 5, 7, 9, 5])
+    valid = np.array([True, True, True, True, False])
+    codes, keys = integer_group_codes(ids, valid)
+    assert codes.tolist() == [1, 0, 1, 2, -1]
+    assert keys.tolist() == [5, 7, 9]
+    codes, keys = integer_group_codes(ids * 10**9, None)
+    assert codes.tolist() == [1, 0, 1, 2, 0]
+    assert keys.tolist() == [5 * 10**9, 7 * 10**9, 9 * 10**9]
+    codes, keys = integer_group_codes(np.array([2, 2, 4, 8]), None, presorted=True)
+    assert codes.tolist() == [0, 0, 1, 2]
+    assert keys.tolist() == [2, 4, 8]
+
+
+def test_groupby_approx_nunique(df_ventes: DataFrame) -> Any:
+    """
+    Test case permettant de vérifier l'estimation du nombre de valeurs distinctes
+    par groupe, les lignes dont la clé est manquante étant ignorées
+    """
+    result = df_ventes.groupby("pays", agg={"annee": "approx_nunique"})
+    assert result["annee"].data == [2, 1]
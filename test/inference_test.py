@@ -0,0 +1,109 @@
+from datetime import date
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+from src.builders import ColumnBuilder
+from src.builders import ValueBuilder
+from src.dates import detect_format
+from src.dates import parse_dates
+from src.inference import infer_kind
+from src.inference import infer_series
+
+
+def test_infer_kind_rules() -> Any:
+    """
+    Test case permettant de vérifier les règles d'inférence du type d'une colonne
+    """
+    assert infer_kind([1, 2, None]) == "i"
+    assert infer_kind([1, 2.5]) == "f"
+    assert infer_kind([True, False]) == "b"
+    assert infer_kind(["3-4-2010", "12-11-2009"]) == "D"
+    assert infer_kind(["a", 1]) == "O"
+    assert infer_kind([]) == "O"
+
+
+def test_infer_series_most_reccurent_type() -> Any:
+    """
+    Test case permettant de vérifier que les valeurs minoritaires sont converties
+    vers le type le plus fréquent ou deviennent des valeurs manquantes
+    """
+    serie = infer_series([1, 2, 4, "3", "x"], name="a")
+    assert serie.dtype == np.int64
+    assert serie.data == [1, 2, 4, 3, None]
+
+
+def test_infer_series_dates() -> Any:
+    """
+    Test case permettant de vérifier la conversion en bloc des dates
+    """
+    serie = infer_series(["3-4-2010", "2-11-2009", None])
+    assert serie.dtype == np.dtype("datetime64[D]")
+    assert serie.data == [date(2010, 4, 3), date(2009, 11, 2), None]
+
+
+def test_infer_series_categorical() -> Any:
+    """
+    Test case permettant de vérifier qu'une colonne de chaînes de caractères ayant peu
+    de valeurs distinctes est stockée sous forme de codes et d'un dictionnaire
+    """
+    values = ["FR", "DE", None, "FR", "IT", "DE"] * 100
+    serie = infer_series(values, name="pays")
+    assert serie.categories.tolist() == ["FR", "DE", "IT"]
+    assert serie.codes.dtype == np.int32
+    assert serie.dtype == object
+    assert serie.data == values
+    assert infer_series([f"id{i}" for i in range(100)]).categories is None
+    assert infer_series(["a", 1, "a", "a"]).categories is None
+
+
+def test_date_formats() -> Any:
+    """
+    Test case permettant de vérifier la détection du format et la conversion vectorisée
+    des dates ISO, jour-mois-année et epoch
+    """
+    assert detect_format(["2024-02-29", None, "1999-12-31"]) == "%Y-%m-%d"
+    assert detect_format(["2024-02-29T10:00", "2024-03-01"]) == "%Y-%m-%d %H:%M:%S"
+    assert detect_format(["3-4-2010", "12-11-2009"]) == "%d-%m-%Y"
+    assert detect_format(["2024-02-30", "abc"]) is None
+    dates = parse_dates(["2024-02-29 10:11:12.25Z", "2024-13-01 00:00", "2024-01-01"])
+    assert dates.tolist() == [
+        datetime(2024, 2, 29, 10, 11, 12, 250000),
+        None,
+        datetime(2024, 1, 1),
+    ]
+    assert parse_dates(["0", "-86400", "1e3"], "epoch").tolist() == [
+        datetime(1970, 1, 1),
+        datetime(1969, 12, 31),
+        None,
+    ]
+    serie = infer_series(["2024-01-05 08:00:00", None, "2023-07-14T12:30:00"])
+    assert serie.dtype == np.dtype("datetime64[us]")
+    assert serie.data[2] == datetime(2023, 7, 14, 12, 30)
+
+
+def test_infer_series_strict_conversions() -> Any:
+    """
+    Test case permettant de vérifier que seules les chaînes "true" et "false" deviennent
+    des booléens et qu'un flottant non entier n'est pas tronqué en entier
+    """
+    serie = infer_series([True, False, "false", "TRUE", "yes", 1], kind="b")
+    assert serie.data == [True, False, False, True, None, None]
+    serie = infer_series([1, 2, "3", "4.0", "4.5", 3.0, 2.5, float("nan")], kind="i")
+    assert serie.data == [1, 2, 3, 4, None, 3, None, None]
+
+
+def test_builders_date_format() -> Any:
+    """
+    Test case permettant de vérifier le format des dates retenu par un ColumnBuilder,
+    les lots JSON d'un ValueBuilder étant déjà décodés
+    """
+    builder = ColumnBuilder("a")
+    assert builder.date_format is None
+    builder.append(["03-04-2010", "", "12-11-2009"])
+    assert builder.date_format == "%d-%m-%Y"
+    assert builder.build().data == [date(2010, 4, 3), None, date(2009, 11, 12)]
+    builder = ColumnBuilder("a")
+    builder.append(["1", "2"])
+    assert builder.date_format is None
+    assert not hasattr(ValueBuilder("a"), "date_format")
@@ -0,0 +1,169 @@
+from typing import Any
+
+from mybear import DataFrame
+from mybear import read_csv
+from mybear import read_json
+from mybear import scan_csv
+from mybear import scan_json
+import pytest
+
+
+@pytest.fixture
+def csv_ventes(tmp_path) -> str:
+    path = tmp_path / "ventes.csv"
+    path.write_text(
+        "id,pays,annee,montant,commentaire\n"
+        "1,FR,2020,10.5,a\n"
+        "2,DE,2021,4.0,b\n"
+        "3,FR,2021,,c\n"
+        "4,IT,2020,2.5,d\n"
+        "5,FR,2022,7.0,e\n"
+    )
+    return str(path)
+
+
+@pytest.fixture
+def df_pays() -> DataFrame:
+    return DataFrame(
+        colonnes=["pays", "nom", "commentaire"],
+        data=[["FR", "DE", "ES"], ["France", "Allemagne", "Espagne"], ["x", "y", "z"]],
+    )
+
+
+def test_read_csv_filters(csv_ventes: str) -> Any:
+    """
+    Test case permettant de vérifier que read_csv ne conserve que les lignes satisfaisant
+    les filtres, les valeurs manquantes ne les satisfaisant jamais
+    """
+    df = read_csv(
+        csv_ventes,
+        usecols=["id", "montant"],
+        filters=[("pays", "==", "FR"), ("montant", ">", 5)],
+    )
+    assert df.colonnes == ["id", "montant"]
+    assert df.data["id"].data == [1, 5]
+    df = read_csv(csv_ventes, filters=[("annee", "in", [2020, 2022])], mmap=True)
+    assert df.data["id"].data == [1, 4, 5]
+    with pytest.raises(ValueError):
+        read_csv(csv_ventes, filters=[("pays", "~", "FR")])
+
+
+def test_pushdown_into_scan(csv_ventes: str) -> Any:
+    """
+    Test case permettant de vérifier que les filtres et les colonnes utilisées
+    sont transmis à la lecture du fichier et que les projections sont fusionnées
+    """
+    lazy = (
+        scan_csv(csv_ventes)
+        .select(["id", "pays", "montant"])
+        .filter("pays", "==", "FR")
+        .select(["montant", "id"])
+    )
+    assert lazy.explain().splitlines() == [
+        "Select ['montant', 'id']",
+        "  Scan read_csv "
+        + csv_ventes
+        + " columns=['id', 'montant'] filters=[('pays', '==', 'FR')]",
+    ]
+    df = lazy.collect()
+    assert df.colonnes == ["montant", "id"]
+    assert df.data["id"].data == [1, 3, 5]
+    assert df.data["montant"].data == [10.5, None, 7.0]
+
+
+def test_lazy_groupby_join(csv_ventes: str, df_pays: DataFrame) -> Any:
+    """
+    Test case permettant de vérifier qu'un plan avec groupby et jointure donne le même
+    résultat que les opérations immédiates, avec uniquement les colonnes nécessaires lues
+    """
+    lazy = (
+        scan_csv(csv_ventes)
+        .join(df_pays.lazy(), left_on="pays", right_on="pays", how="inner")
+        .filter("annee", ">=", 2021)
+        .groupby("nom", agg={"montant": ["sum", "count"]})
+        .select(["nom", "montant_sum"])
+    )
+    plan = lazy.explain()
+    # Les filtres étant évalués par read_csv, annee n'a pas à être lue ; commentaire
+    # est conservé car les suffixes de la jointure en dépendent
+    assert "columns=['pays', 'montant', 'commentaire']" in plan
+    assert "filters=[('annee', '>=', 2021)]" in plan
+
+    eager = (
+        read_csv(csv_ventes, filters=[("annee", ">=", 2021)])
+        .join(df_pays, left_on="pays", right_on="pays", how="inner")
+        .groupby("nom", agg={"montant": ["sum", "count"]})
+    )
+    df = lazy.collect()
+    assert df.colonnes == ["nom", "montant_sum"]
+    assert df.data["nom"].equals(eager.data["nom"])
+    assert df.data["montant_sum"].equals(eager.data["montant_sum"])
+    assert df.data["montant_sum"].data == [4.0, 7.0]
+
+
+def test_filter_not_pushed_to_null_side(csv_ventes: str, df_pays: DataFrame) -> Any:
+    """
+    Test case permettant de vérifier qu'un filtre sur le côté complété par des valeurs
+    manquantes d'une jointure est évalué après celle-ci
+    """
+    lazy = (
+        scan_csv(csv_ventes)
+        .join(df_pays, left_on="pays", right_on="pays", how="left")
+        .filter("nom", "!=", "France")
+    )
+    assert lazy.explain().splitlines()[0].startswith("Filter")
+    assert lazy.collect().data["id"].data == [2]
+
+
+def test_scan_json(tmp_path) -> Any:
+    """
+    Test case permettant de vérifier la lecture différée d'un fichier NDJSON limitée
+    aux clés et aux enregistrements utiles
+    """
+    path = tmp_path / "events.ndjson"
+    path.write_text(
+        '{"id": 1, "type": "click", "duration": 0.5}\n'
+        '{"id": 2, "type": "view"}\n'
+        '{"id": 3, "type": "click", "duration": 2.0}\n'
+    )
+    df = (
+        scan_json(str(path), lines=True)
+        .filter("type", "==", "click")
+        .select(["duration", "id"])
+        .collect()
+    )
+    assert df.colonnes == ["duration", "id"]
+    assert df.data["id"].data == [1, 3]
+    assert read_json(str(path), lines=True, usecols=["type"]).colonnes == ["type"]
+
+
+def test_pushdown_uses_final_types(tmp_path, monkeypatch) -> Any:
+    """
+    Test case permettant de vérifier qu'un filtre descendu dans la lecture est évalué
+    sur le type final de la colonne, comme après une lecture complète, même lorsqu'un
+    bloc suivant élargit le type de la colonne
+    """
+    import mybear
+
+    monkeypatch.setattr(mybear, "CSV_BLOCK_SIZE", 2)
+    monkeypatch.setattr(mybear, "JSON_BLOCK_SIZE", 2)
+    monkeypatch.setattr(mybear, "MIN_RANGE_SIZE", 4)
+    csv_path = tmp_path / "valeurs.csv"
+    csv_path.write_text("a,b\n1,x\n5,y\nabc,z\n")
+    json_path = tmp_path / "valeurs.ndjson"
+    json_path.write_text(
+        '{"a": 1, "b": "x"}\n{"a": 5, "b": "y"}\n{"a": "abc", "b": "z"}\n'
+    )
+    lectures = [
+        (read_csv(str(csv_path)), scan_csv(str(csv_path))),
+        (read_csv(str(csv_path)), scan_csv(str(csv_path), mmap=True, workers=3)),
+        (read_json(str(json_path), lines=True), scan_json(str(json_path), lines=True)),
+    ]
+    for eager, lazy in lectures:
+        for value in (2, "2"):
+            expected = eager[eager["a"] > value]
+            assert lazy.filter("a", ">", value).collect() == expected
+    assert scan_csv(str(csv_path)).filter("a", ">", "2").collect()["b"].data == [
+        "y",
+        "z",
+    ]
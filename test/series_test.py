@@ -1,8 +1,10 @@
+from datetime import datetime
 from typing import Any
 
 import numpy as np
 import pytest
 from src.series import Series
+from src.strings import encode_strings
 
 
 @pytest.fixture
@@ -70,4 +72,368 @@ def test_mean(serie) -> Any:
 
 
 def test_equals(serie):
-    assert serie == Series(range(10), name="Test")
+    assert serie.equals(Series(range(10), name="Test"))
+    assert not serie.equals(Series(range(10), name="Autre"))
+    assert not Series([1, None]).equals(Series([1, 0]))
+
+
+def test_typed_buffer() -> Any:
+    """
+    Test case permettant de vérifier que les données d'une série sont stockées
+    dans un buffer numpy typé
+    """
+    assert Series(range(3)).dtype == np.int64
+    assert Series([1, 2.5]).dtype == np.float64
+    assert Series([True, False]).dtype == np.bool_
+    assert Series(["a", "b"]).dtype == object
+    assert isinstance(Series([1, 2]).values, np.ndarray)
+
+
+def test_missing_values() -> Any:
+    """
+    Test case permettant de vérifier que les valeurs manquantes sont conservées
+    via le masque de validité sans changer le type du buffer
+    """
+    serie = Series([1, None, 3], name="Test")
+    assert serie.dtype == np.int64
+    assert serie.data == [1, None, 3]
+    assert serie.iloc[1] is None
+    assert serie.mean() == 2.0
+
+
+def test_slice_copy_on_write(serie: Series) -> Any:
+    """
+    Test case permettant de vérifier qu'une tranche partage le buffer de la série
+    jusqu'à ce que l'une des deux soit modifiée
+    """
+    tranche = serie.iloc[2:5]
+    assert np.shares_memory(tranche.values, serie.values)
+    tranche[0] = 100
+    assert tranche.data == [100, 3, 4]
+    assert serie.iloc[2] == 2
+    serie[3] = None
+    assert tranche.iloc[1] == 3
+    assert serie.iloc[3] is None
+
+
+def test_nested_iteration(serie: Series) -> Any:
+    """
+    Test case permettant de vérifier que deux itérations imbriquées sont indépendantes
+    et ne modifient pas l'index de la série
+    """
+    pairs = [(a, b) for a in serie.iloc[:3] for b in serie.iloc[:2]]
+    assert pairs == [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 1)]
+    assert serie.index == range(10)
+    assert list(Series([1, None, 3])) == [1, None, 3]
+
+
+def test_comparison_masks(serie: Series) -> Any:
+    """
+    Test case permettant de vérifier que les comparaisons élément par élément produisent
+    des masques booléens, les valeurs manquantes ne satisfaisant aucune comparaison
+    """
+    valeurs = Series([3, None, 7, 1], name="v")
+    assert (valeurs > 2).data == [True, False, True, False]
+    assert (valeurs == 7).data == [False, False, True, False]
+    assert (valeurs != 7).data == [True, False, False, True]
+    assert (valeurs >= Series([3, 3, 8, 0])).data == [True, False, False, True]
+    assert valeurs.isin([1, 3]).data == [True, False, False, True]
+    assert valeurs.isna().data == [False, True, False, False]
+    assert (Series(["a", 1, None]) == "a").data == [True, False, False]
+    assert ((valeurs > 2) & ~(valeurs == 7) | valeurs.isna()).data == [
+        True,
+        True,
+        False,
+        False,
+    ]
+    # Deux Series se comparent aussi élément par élément, equals les comparant
+    # dans leur ensemble
+    autres = Series([3, 2, None, 1])
+    assert (valeurs == autres).data == [True, False, False, True]
+    assert (valeurs != Series([2, 2, 7, 0])).data == [True, False, False, True]
+    assert serie.equals(Series(range(10), name="Test"))
+    with pytest.raises(ValueError):
+        bool(valeurs == autres)
+    with pytest.raises(ValueError):
+        valeurs < Series([1, 2])
+    with pytest.raises(TypeError):
+        valeurs & True
+
+
+def test_arithmetic_broadcasting() -> Any:
+    """
+    Test case permettant de vérifier les opérations arithmétiques vectorisées entre Series
+    et avec un scalaire, les valeurs manquantes étant propagées
+    """
+    a = Series([1, 2, None, 4], name="a")
+    b = Series([1.5, None, 2.0, 2.0], name="b")
+    assert (a + b).data == [2.5, None, None, 6.0]
+    assert (a + b).name == "a"
+    assert (a * 2 - 1).data == [1, 3, None, 7]
+    assert (a * 2).dtype == np.int64
+    assert (12 / a).data == [12.0, 6.0, None, 3.0]
+    assert (a // 2).data == [0, 1, None, 2]
+    # Une division entière par zéro est manquante, une division flottante infinie
+    zeros = Series([0, 2, 1, 0])
+    assert (a // zeros).data == [None, 1, None, None]
+    assert (a % zeros).data == [None, 0, None, None]
+    assert (7 // zeros).data == [None, 3, 7, None]
+    assert (a % 0).data == [None, None, None, None]
+    assert (a / zeros).data == [np.inf, 1.0, None, np.inf]
+    assert (-a).data == [-1, -2, None, -4]
+    assert Series([4.0, None]).sqrt().data == [2.0, None]
+    assert (Series(["x", None]) + "!").data == ["x!", None]
+
+
+def test_inplace_arithmetic() -> Any:
+    """
+    Test case permettant de vérifier que les opérations en place écrivent dans le buffer
+    existant, sauf si le type du résultat l'impose, sans modifier une Serie partagée
+    """
+    serie = Series([1.0, 2.0, 3.0])
+    buffer = serie.values
+    serie += Series([1, None, 1])
+    serie *= 2
+    assert serie.values is buffer
+    assert serie.data == [4.0, None, 8.0]
+
+    entiers = Series(range(4))
+    vue = entiers[:2]
+    vue += 10
+    assert vue.data == [10, 11]
+    assert entiers.data == [0, 1, 2, 3]
+    diviseurs = Series([2, 0, 1, 0])
+    entiers //= diviseurs
+    assert entiers.data == [0, None, 2, None]
+    entiers = Series(range(4))
+    entiers /= 2
+    assert entiers.dtype == np.float64
+    assert entiers.data == [0.0, 0.5, 1.0, 1.5]
+
+
+def test_null_aware_reductions() -> Any:
+    """
+    Test case permettant de vérifier que les réductions ignorent les valeurs manquantes,
+    ainsi que les paramètres skipna et min_count
+    """
+    serie = Series([4, None, 1, 7, None])
+    assert serie.null_count() == 2
+    assert serie.min() == 1
+    assert serie.max() == 7
+    assert serie.sum() == 12
+    assert serie.mean() == 4.0
+    assert serie.std() == pytest.approx(np.std([4, 1, 7]))
+    assert serie.std(ddof=1) == pytest.approx(np.std([4, 1, 7], ddof=1))
+    assert serie.min(skipna=False) is None
+    assert serie.sum(min_count=4) is None
+    vide = Series([None, None])
+    assert vide.sum() == 0
+    assert vide.max() is None
+    assert vide.mean() is None
+    assert Series(["b", None, "a"]).min() == "a"
+
+
+def test_statistics_cache() -> Any:
+    """
+    Test case permettant de vérifier que les statistiques sont mises en cache
+    puis invalidées par toute écriture dans la Serie
+    """
+    serie = Series([3.0, None, 1.0])
+    assert serie.null_count() == 1
+    assert serie.max() == 3.0
+    assert serie.mean() == 2.0
+    assert "moments" in serie._stats
+    serie[1] = 8.0
+    assert serie.null_count() == 0
+    assert serie.max() == 8.0
+    assert serie.mean() == 4.0
+    serie += 1
+    assert serie.min() == 2.0
+    assert serie.sum() == 15.0
+    serie.data = [1, 2]
+    assert serie.max() == 2
+
+
+def test_sort_values() -> Any:
+    """
+    Test case permettant de vérifier le tri stable d'une Serie et la position
+    des valeurs manquantes
+    """
+    serie = Series([3, None, 1, 3, 2])
+    assert serie.argsort().data == [2, 4, 0, 3, 1]
+    assert serie.sort_values().data == [1, 2, 3, 3, None]
+    assert serie.sort_values(ascending=False, na_position="first").data == [
+        None,
+        3,
+        3,
+        2,
+        1,
+    ]
+    assert Series(["b", None, "a"]).sort_values().data == ["a", "b", None]
+    assert not Series([2, 1]).is_sorted()
+    assert Series([2, 1]).sort_values()._stats["sorted"]
+    with pytest.raises(ValueError):
+        serie.sort_values(na_position="middle")
+
+
+def test_nsmallest_nlargest() -> Any:
+    """
+    Test case permettant de vérifier la sélection partielle des plus petits
+    et des plus grands éléments
+    """
+    values = np.random.default_rng(2).integers(0, 50, 1000)
+    serie = Series(data=values)
+    assert serie.nsmallest(10).data == sorted(values.tolist())[:10]
+    assert serie.nlargest(3).data == sorted(values.tolist(), reverse=True)[:3]
+    assert Series([1.5, None, 0.5]).nlargest(5).data == [1.5, 0.5]
+
+
+def test_categorical_operations() -> Any:
+    """
+    Test case permettant de vérifier les comparaisons, l'indexation et l'écriture
+    d'une Serie catégorielle
+    """
+    categories = np.array(["b", "a", "c"], dtype=object)
+    codes = np.array([0, 1, 1, 2, 0], dtype=np.int32)
+    mask = np.array([True, True, False, True, True])
+    serie = Series(data=codes, name="x", mask=mask, categories=categories)
+    assert serie.data == ["b", "a", None, "c", "b"]
+    assert (serie == "b").data == [True, False, False, False, True]
+    assert (serie > "a").data == [True, False, False, True, True]
+    assert serie.isin(["a", "c"]).data == [False, True, False, True, False]
+    assert serie.sort_values().data == ["a", "b", "b", "c", None]
+    assert serie.take([3, 0]).categories is categories
+    view = serie[1:]
+    view[0] = "d"
+    assert view.data == ["d", None, "c", "b"]
+    assert serie[1] == "a"
+    assert serie.categories.tolist() == ["b", "a", "c"]
+    view[1] = 1
+    assert view.categories is None
+    assert view.data == ["d", 1, "c", "b"]
+
+
+def test_string_operations() -> Any:
+    """
+    Test case permettant de vérifier les opérations vectorisées de l'accesseur str
+    sur une Serie de chaînes, une Serie catégorielle et une Serie object
+    """
+    data, spans = encode_strings(["Été chaud", "froid", "", "a,b,,c", "x"])
+    mask = np.array([True, True, True, True, False])
+    serie = Series(data=spans, name="s", mask=mask, strings=data)
+    assert serie.data == ["Été chaud", "froid", "", "a,b,,c", None]
+    assert serie.str.len().data == [9, 5, 0, 6, None]
+    assert serie.str.contains("o").data == [False, True, False, False, False]
+    assert serie.str.contains(",,").data == [False, False, False, True, False]
+    assert serie.str.startswith("Ét").data == [True, False, False, False, False]
+    assert serie.str.lower().data == ["été chaud", "froid", "", "a,b,,c", None]
+    assert serie.str.split(",").data == [
+        ["Été chaud"],
+        ["froid"],
+        [""],
+        ["a", "b", "", "c"],
+        None,
+    ]
+    assert (serie == "froid").data == [False, True, False, False, False]
+    view = serie.take([3, 1])
+    assert view._strings is data
+    assert view.str.split("o").data == [["a,b,,c"], ["fr", "id"]]
+    view[0] = "z"
+    assert view.data == ["z", "froid"]
+    assert serie[3] == "a,b,,c"
+
+    categories = np.array(["Oui", "Non"], dtype=object)
+    codes = np.array([0, 1, 0], dtype=np.int32)
+    categorical = Series(data=codes, categories=categories)
+    assert categorical.str.lower().data == ["oui", "non", "oui"]
+    assert Series(["ab", None]).str.startswith("a").data == [True, False]
+    with pytest.raises(TypeError):
+        Series([1, 2]).str.len()
+
+
+def test_datetime_accessors() -> Any:
+    """
+    Test case permettant de vérifier les accesseurs dt d'une Serie de dates
+    """
+    values = np.array(
+        ["2024-03-05T10:30", "NaT", "1969-12-31T23:59:59.5"], dtype="datetime64[us]"
+    )
+    serie = Series(data=values, mask=~np.isnat(values))
+    assert serie.dt.year.data == [2024, None, 1969]
+    assert serie.dt.month.data == [3, None, 12]
+    assert serie.dt.day.data == [5, None, 31]
+    assert serie.dt.hour.data == [10, None, 23]
+    assert serie.dt.floor("15min").data == [
+        datetime(2024, 3, 5, 10, 30),
+        None,
+        datetime(1969, 12, 31, 23, 45),
+    ]
+    assert serie.dt.truncate("Y").data[0] == datetime(2024, 1, 1)
+    with pytest.raises(ValueError):
+        serie.dt.floor("2 jours")
+    with pytest.raises(TypeError):
+        Series([1, 2]).dt.year
+
+
+def test_rolling() -> Any:
+    """
+    Test case permettant de vérifier les calculs par fenêtre glissante et croissante,
+    les valeurs manquantes étant exclues des fenêtres
+    """
+    serie = Series([3, 1, None, 5, 2, 4], name="mesure")
+    assert serie.rolling(2).sum().data == [None, 4, None, None, 7, 6]
+    assert serie.rolling(3, min_periods=1).max().data == [3, 3, 3, 5, 5, 5]
+    assert serie.rolling(3, min_periods=2).min().data == [None, 1, 1, 1, 2, 2]
+    assert serie.rolling(3, min_periods=1).mean().data == [
+        3.0,
+        2.0,
+        2.0,
+        3.0,
+        3.5,
+        11 / 3,
+    ]
+    assert serie.rolling(2, min_periods=1).count().data == [1, 2, 1, 1, 2, 2]
+    assert serie.expanding().max().data == [3, 3, 3, 5, 5, 5]
+    assert serie.expanding(min_periods=2).std().data[:2] == [None, 1.0]
+
+    values = np.random.default_rng(0).normal(1e6, 1.0, 5000)
+    rolling = Series(values).rolling(100)
+    expected = [values[end - 100 : end].std() for end in (100, 2500, 5000)]
+    stds = rolling.std().values
+    assert np.allclose(stds[[99, 2499, 4999]], expected)
+    assert np.allclose(
+        rolling.sum().values[99:], np.convolve(values, np.ones(100), "valid")
+    )
+
+    # Un changement de niveau ou une tendance ne dégrade pas les fenêtres suivantes
+    noise = np.random.default_rng(1).normal(0.0, 0.01, 2000)
+    for values in (
+        np.concatenate([1e8 + noise[:1000], noise[1000:]]),
+        1e6 * np.arange(2000) + noise,
+    ):
+        stds = Series(values).rolling(20).std().values
+        expected = [values[end - 20 : end].std() for end in range(20, 2001)]
+        assert np.allclose(stds[19:], expected, rtol=1e-6)
+        assert np.isclose(Series(values).expanding().std().values[-1], values.std())
+    with pytest.raises(ValueError):
+        serie.rolling(0)
+    with pytest.raises(TypeError):
+        Series(["a", "b"]).rolling(2)
+
+
+def test_nunique_quantile() -> Any:
+    """
+    Test case permettant de vérifier le nombre de valeurs distinctes et les quantiles,
+    exacts et approchés, les valeurs manquantes étant ignorées
+    """
+    serie = Series([4, 1, None, 4, 2, 3])
+    assert serie.nunique() == 4
+    assert serie.nunique(approx=True) == 4
+    assert Series(["a", "b", None, "a"]).nunique(approx=True) == 2
+    assert serie.quantile() == 3.0
+    assert serie.quantile([0, 0.25, 1]) == [1.0, 2.0, 4.0]
+    assert serie.quantile([0, 0.5, 1], approx=True) == [1.0, 3.0, 4.0]
+    with pytest.raises(ValueError):
+        serie.quantile(1.5)
+    with pytest.raises(TypeError):
+        Series(["a", "b"]).quantile()
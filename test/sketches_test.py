@@ -0,0 +1,49 @@
+from typing import Any
+
+from mybear import HyperLogLog
+from mybear import QuantileSketch
+from mybear import Series
+import numpy as np
+import pytest
+
+
+def test_hyperloglog_merge() -> Any:
+    """
+    Test case permettant de vérifier que la fusion des sketches de plusieurs morceaux
+    estime le nombre de valeurs distinctes de leur réunion, quel que soit le stockage
+    """
+    values = np.random.default_rng(0).integers(0, 50_000, size=200_000)
+    merged = HyperLogLog()
+    for chunk in np.array_split(values, 7):
+        merged.merge(HyperLogLog().update(Series(chunk)))
+    exact = len(np.unique(values))
+    assert abs(merged.estimate() - exact) < 0.03 * exact
+    assert merged.estimate() == HyperLogLog().update(Series(values)).estimate()
+
+    texts = [f"client-{value}" for value in values[:20_000].tolist()]
+    objects = Series(np.array(texts, dtype=object))
+    categorical = Series(texts)
+    assert HyperLogLog().update(objects).estimate() == (
+        HyperLogLog().update(categorical).estimate()
+    )
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=12).merge(HyperLogLog())
+
+
+def test_quantile_sketch_merge() -> Any:
+    """
+    Test case permettant de vérifier l'erreur de rang des quantiles estimés par la
+    fusion des sketches de plusieurs morceaux
+    """
+    values = np.random.default_rng(0).exponential(size=300_000)
+    merged = QuantileSketch()
+    for chunk in np.array_split(values, 9):
+        merged.merge(QuantileSketch().update(Series(chunk)))
+    fractions = [0.01, 0.5, 0.9, 0.99]
+    ranks = np.searchsorted(np.sort(values), merged.quantile(fractions)) / len(values)
+    assert np.abs(ranks - fractions).max() < 0.01
+    assert merged.quantile([0, 1]) == [values.min(), values.max()]
+    assert merged.count == len(values)
+    assert QuantileSketch().quantile(0.5) is None
+    with pytest.raises(TypeError):
+        QuantileSketch().update(Series(["a", "b"]))